@@ -0,0 +1,167 @@
+from __future__ import print_function
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import timeit
+
+import restea
+import restea.formats as formats
+
+from benchmarks.cases import CASES, Skip
+
+
+def get_commit():
+    '''
+    Returns current git commit or None if it's unknown
+    '''
+    try:
+        output = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stderr=subprocess.STDOUT
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.decode('ascii').strip()
+
+
+def measure(func, repeat, min_time):
+    '''
+    Times the function. Number of calls per repeat is calibrated so every
+    repeat takes at least min_time seconds
+
+    :param func: function -- function without arguments to be timed
+    :param repeat: int -- number of repeats
+    :param min_time: float -- minimal duration of one repeat in seconds
+    :returns: dict -- best and median time per call in microseconds and
+    number of calls per repeat
+    '''
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        duration = timer.timeit(number)
+        if duration >= min_time:
+            break
+        number *= 10 if duration < min_time / 10 else 2
+
+    timings = sorted(
+        duration * 1e6 / number for duration in timer.repeat(repeat, number)
+    )
+    return {
+        'best_us': round(timings[0], 3),
+        'median_us': round(timings[len(timings) // 2], 3),
+        'number': number,
+    }
+
+
+def run(pattern=None, repeat=5, min_time=0.2):
+    '''
+    Runs benchmarks
+
+    :param pattern: string -- run only benchmarks which names contain it
+    :param repeat: int -- number of repeats
+    :param min_time: float -- minimal duration of one repeat in seconds
+    :returns: dict -- environment and results of benchmarks
+    '''
+    results = {}
+    for name, setup in CASES:
+        if pattern and pattern not in name:
+            continue
+        try:
+            func = setup()
+        except Skip as e:
+            print('{}: skipped ({})'.format(name, e), file=sys.stderr)
+            continue
+
+        results[name] = measure(func, repeat, min_time)
+        print(
+            '{}: {} us'.format(name, results[name]['best_us']),
+            file=sys.stderr
+        )
+
+    return {
+        'meta': {
+            'restea': restea.__version__,
+            'json_backend': formats.JsonFormat.backend.__name__,
+            'commit': get_commit(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+        },
+        'results': results,
+    }
+
+
+def compare(results, baseline, max_ratio):
+    '''
+    Compares results with the baseline
+
+    :param results: dict -- results returned by `run`
+    :param baseline: dict -- stored results returned by `run`
+    :param max_ratio: float -- maximal allowed ratio of timings
+    :returns: list -- names of benchmarks slower than allowed
+    '''
+    regressions = []
+    for name, result in sorted(results['results'].items()):
+        stored = baseline['results'].get(name)
+        if stored is None:
+            continue
+
+        ratio = result['best_us'] / stored['best_us']
+        print(
+            '{:<40} {:>12.3f} {:>12.3f} {:>7.2f}x'.format(
+                name, stored['best_us'], result['best_us'], ratio
+            ),
+            file=sys.stderr
+        )
+        if ratio > max_ratio:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks', description='Runs restea benchmarks'
+    )
+    parser.add_argument(
+        '-k', dest='pattern',
+        help='run only benchmarks which names contain the pattern'
+    )
+    parser.add_argument(
+        '-o', '--output', help='file results are written to, stdout if omitted'
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--min-time', type=float, default=0.2)
+    parser.add_argument(
+        '--compare', help='file with stored results, i.e. baseline.json'
+    )
+    parser.add_argument('--max-ratio', type=float, default=1.25)
+    args = parser.parse_args(argv)
+
+    results = run(args.pattern, args.repeat, args.min_time)
+    output = json.dumps(results, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.max_ratio)
+        if regressions:
+            print(
+                'Slower than {}x: {}'.format(
+                    args.max_ratio, ', '.join(regressions)
+                ),
+                file=sys.stderr
+            )
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
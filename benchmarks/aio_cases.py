@@ -0,0 +1,23 @@
+import asyncio
+
+from restea.adapters.asgi import ASGIApplication, ASGIResourceWrapper
+
+from benchmarks import resources
+from benchmarks.cases import case
+
+
+@case('adapters.asgi.show')
+def asgi_show():
+    app = ASGIApplication(
+        ASGIResourceWrapper(resources.SiteResource).get_routes('/sites')
+    )
+    scope = {'type': 'http', 'method': 'GET', 'path': '/sites/1'}
+    loop = asyncio.new_event_loop()
+
+    async def receive():
+        return {'type': 'http.request', 'body': b''}
+
+    async def send(message):
+        pass
+
+    return lambda: loop.run_until_complete(app(scope, receive, send))
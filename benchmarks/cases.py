@@ -0,0 +1,285 @@
+import io
+import json
+import sys
+
+import six
+
+from restea import formats
+from restea.adapters.wsgi import (
+    WSGIApplication,
+    WSGIRequestWrapper,
+    WSGIResourceWrapper,
+)
+
+from benchmarks import resources
+
+
+#: registered benchmark cases: pairs of name and setup function
+CASES = []
+
+
+class Skip(Exception):
+    '''
+    Raised by setup function if benchmark can't be run, i.e. optional
+    framework is not installed
+    '''
+
+
+def case(name):
+    '''
+    Registers benchmark case. Decorated function prepares the data and
+    returns a function without arguments which is timed
+
+    :param name: string -- name of the benchmark
+    '''
+    def decorator(setup):
+        CASES.append((name, setup))
+        return setup
+    return decorator
+
+
+def make_environ(method='GET', path='/', body=b'', query=''):
+    '''
+    Returns WSGI environ of the request
+
+    :param method: string -- HTTP method
+    :param path: string -- requested url path
+    :param body: bytes -- request body
+    :param query: string -- query string
+    :returns: dict -- WSGI environ
+    '''
+    return {
+        'REQUEST_METHOD': method,
+        'SCRIPT_NAME': '',
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+        'CONTENT_TYPE': 'application/json',
+        'CONTENT_LENGTH': str(len(body)),
+        'SERVER_NAME': 'localhost',
+        'SERVER_PORT': '80',
+        'HTTP_HOST': 'localhost',
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': 'http',
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': False,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+    }
+
+
+def make_dispatch(resource_class, method='GET', body=b'', **kwargs):
+    '''
+    Returns function dispatching a new resource object for every call, the
+    way adapters do it
+
+    :param resource_class: :class: `restea.resource.Resource` -- resource
+    :param method: string -- HTTP method
+    :param body: bytes -- request body
+    '''
+    formatter = formats.JsonFormat
+
+    def run():
+        request = WSGIRequestWrapper(make_environ(method, body=body))
+        content, status = resource_class(request, formatter).dispatch(
+            **kwargs
+        )[:2]
+        if not isinstance(content, (six.binary_type, six.text_type)):
+            content = ''.join(content)
+        return status
+    return run
+
+
+@case('dispatch.show')
+def dispatch_show():
+    return make_dispatch(resources.SiteResource, iden='1')
+
+
+@case('dispatch.list_10')
+def dispatch_list_small():
+    return make_dispatch(resources.SiteResource)
+
+
+@case('dispatch.list_10000')
+def dispatch_list_big():
+    return make_dispatch(resources.BigListResource)
+
+
+@case('dispatch.list_10000_streamed')
+def dispatch_list_big_streamed():
+    return make_dispatch(resources.StreamedListResource)
+
+
+@case('dispatch.list_10000_columnar')
+def dispatch_list_big_columnar():
+    return make_dispatch(resources.ColumnarListResource)
+
+
+@case('dispatch.create_small_payload')
+def dispatch_create_small():
+    body = json.dumps(resources.SMALL_PAYLOAD).encode('utf-8')
+    return make_dispatch(resources.SiteResource, 'POST', body)
+
+
+@case('dispatch.create_wide_payload')
+def dispatch_create_wide():
+    body = json.dumps(resources.WIDE_PAYLOAD).encode('utf-8')
+    return make_dispatch(resources.WideResource, 'POST', body)
+
+
+@case('dispatch.error_not_found')
+def dispatch_not_found():
+    return make_dispatch(resources.SiteResource, iden='missing')
+
+
+@case('dispatch.error_method_not_allowed')
+def dispatch_method_not_allowed():
+    return make_dispatch(resources.SiteResource, 'PATCH', iden='1')
+
+
+@case('dispatch.error_bad_payload')
+def dispatch_bad_payload():
+    return make_dispatch(resources.SiteResource, 'POST', b'{"name": ')
+
+
+@case('dispatch.error_validation')
+def dispatch_validation_error():
+    body = json.dumps({'name': 'site', 'rating': 10}).encode('utf-8')
+    return make_dispatch(resources.SiteResource, 'POST', body)
+
+
+@case('fields.validate_small')
+def validate_small():
+    fieldset = resources.SiteResource.fields
+    return lambda: fieldset.validate('create', resources.SMALL_PAYLOAD)
+
+
+@case('fields.validate_wide')
+def validate_wide():
+    fieldset = resources.WideResource.fields
+    return lambda: fieldset.validate('create', resources.WIDE_PAYLOAD)
+
+
+@case('fields.validate_many_1000')
+def validate_many():
+    fieldset = resources.SiteResource.fields
+    items = [resources.SMALL_PAYLOAD] * 1000
+    return lambda: fieldset.validate_many('create', items)
+
+
+@case('formats.json_serialize_small')
+def serialize_small():
+    data = resources.make_site(1)
+    return lambda: formats.JsonFormat.serialize(data)
+
+
+@case('formats.json_serialize_10000')
+def serialize_big():
+    return lambda: formats.JsonFormat.serialize(resources.SITES)
+
+
+@case('formats.json_unserialize_wide')
+def unserialize_wide():
+    data = json.dumps(resources.WIDE_PAYLOAD)
+    return lambda: formats.JsonFormat.unserialize(data)
+
+
+def make_wsgi_call(app, method='GET', path='/', body=b''):
+    '''
+    Returns function calling WSGI application and consuming the response
+
+    :param app: WSGI application
+    :param method: string -- HTTP method
+    :param path: string -- requested url path
+    :param body: bytes -- request body
+    '''
+    def start_response(status, headers):
+        pass
+
+    def run():
+        return b''.join(app(make_environ(method, path, body), start_response))
+    return run
+
+
+@case('adapters.wsgi.show')
+def wsgi_show():
+    app = WSGIApplication(
+        WSGIResourceWrapper(resources.SiteResource).get_routes('/sites')
+    )
+    return make_wsgi_call(app, path='/sites/1')
+
+
+@case('adapters.wsgi.create')
+def wsgi_create():
+    app = WSGIApplication(
+        WSGIResourceWrapper(resources.SiteResource).get_routes('/sites')
+    )
+    body = json.dumps(resources.SMALL_PAYLOAD).encode('utf-8')
+    return make_wsgi_call(app, 'POST', '/sites', body)
+
+
+@case('adapters.flask.show')
+def flask_show():
+    try:
+        import flask
+        from restea.adapters.flaskwrap import FlaskResourceWrapper
+    except ImportError as e:
+        raise Skip(str(e))
+
+    app = flask.Flask(__name__)
+    with app.app_context():
+        FlaskResourceWrapper(resources.SiteResource).get_routes('/sites')
+    client = app.test_client()
+    return lambda: client.get('/sites/1').data
+
+
+@case('adapters.django.show')
+def django_show():
+    try:
+        from django.conf import settings
+        if not settings.configured:
+            settings.configure(
+                ROOT_URLCONF=__name__, ALLOWED_HOSTS=['localhost']
+            )
+        from django.test import Client
+        from restea.adapters.djangowrap import DjangoResourceRouter
+    except ImportError as e:
+        raise Skip(str(e))
+
+    global urlpatterns
+    urlpatterns = DjangoResourceRouter(
+        resources.SiteResource
+    ).get_routes('sites')
+    client = Client()
+    return lambda: client.get('/sites/1').content
+
+
+@case('adapters.wheezyweb.show')
+def wheezy_show():
+    try:
+        from wheezy.http import WSGIApplication as WheezyApplication
+        from wheezy.web.middleware import (
+            bootstrap_defaults,
+            path_routing_middleware_factory,
+        )
+        from restea.adapters.wheezywebwrap import WheezyResourceRouter
+    except ImportError as e:
+        raise Skip(str(e))
+
+    app = WheezyApplication(
+        middleware=[
+            bootstrap_defaults(
+                url_mapping=WheezyResourceRouter(
+                    resources.SiteResource
+                ).get_routes('sites')
+            ),
+            path_routing_middleware_factory,
+        ],
+        options={}
+    )
+    return make_wsgi_call(app, path='/sites/1')
+
+
+if sys.version_info >= (3, 5):
+    # coroutines can't be defined in this module while Python 2 is supported
+    import benchmarks.aio_cases  # noqa
@@ -0,0 +1,93 @@
+import datetime
+
+from restea import columnar
+from restea import errors
+from restea import fields
+from restea.resource import Resource
+
+
+def make_site(i):
+    return {
+        'id': i,
+        'name': 'site_{}'.format(i),
+        'title': 'My site #{}'.format(i),
+        'rating': i % 5,
+        'domain': 'www.site-{}.example.com'.format(i),
+        'tags': ['tag{}'.format(i % 7), 'tag{}'.format(i % 11)],
+        'created_at': datetime.datetime(2020, 1, 1, 12, 0, 0),
+    }
+
+
+#: rows returned by `list` of big resources
+SITES = [make_site(i) for i in range(10000)]
+
+#: payload matching SiteResource.fields
+SMALL_PAYLOAD = {'name': 'site', 'title': 'My site', 'rating': 3}
+
+#: number of fields in WideResource.fields
+WIDE_FIELDS_COUNT = 50
+
+#: payload matching WideResource.fields
+WIDE_PAYLOAD = dict(
+    ('field_{}'.format(i), 'value {}'.format(i) if i % 2 else i)
+    for i in range(WIDE_FIELDS_COUNT)
+)
+
+
+class SiteResource(Resource):
+    fields = fields.FieldSet(
+        name=fields.String(max_length=50, required=True),
+        title=fields.String(max_length=150),
+        rating=fields.Integer(range=(0, 5)),
+        domain=fields.String(null=True),
+    )
+
+    def list(self):
+        return SITES[:10]
+
+    def show(self, iden):
+        if iden == 'missing':
+            raise errors.NotFoundError('Site doesn\'t exist')
+        return make_site(int(iden))
+
+    def create(self):
+        return self.payload
+
+    def edit(self, iden):
+        return self.payload
+
+
+class BigListResource(Resource):
+    def list(self):
+        return SITES
+
+
+class StreamedListResource(BigListResource):
+    stream = True
+
+
+#: columns of SITES
+SITE_COLUMNS = columnar.Columns.from_rows(SITES, list(SITES[0]))
+
+
+class ColumnarListResource(Resource):
+    def list(self):
+        return SITE_COLUMNS
+
+
+def _make_wide_fields():
+    wide_fields = {}
+    for i in range(WIDE_FIELDS_COUNT):
+        if i % 2:
+            field = fields.String(max_length=100, required=i < 10)
+        else:
+            field = fields.Integer(range=(0, 1000), required=i < 10)
+        wide_fields['field_{}'.format(i)] = field
+    return fields.FieldSet(**wide_fields)
+
+
+class WideResource(Resource):
+    fields = _make_wide_fields()
+
+    def create(self):
+        return self.payload
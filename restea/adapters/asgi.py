@@ -0,0 +1,248 @@
+from six.moves.urllib.parse import parse_qs
+
+import restea.formats as formats
+from restea.adapters.base import (
+    BaseResourceWrapper,
+    BaseRequestWrapper,
+    cached_property,
+    check_body_size,
+)
+from restea.adapters.wsgi import Router
+
+
+class ASGIRequestWrapper(BaseRequestWrapper):
+    '''
+    Object wrapping ASGI HTTP connection scope and request body.
+    '''
+    def __init__(self, original_request, body=b''):
+        '''
+        :param original_request: dict -- ASGI connection scope
+        :param body: bytes -- request body received from the client
+        '''
+        super(ASGIRequestWrapper, self).__init__(original_request)
+        self._body = body
+        self._query = None
+
+    @cached_property
+    def data(self):
+        '''
+        Returns a payload sent to server
+
+        :returns: string -- raw value of payload sent to server
+        '''
+        return self.raw_data.decode('utf-8')
+
+    @cached_property
+    def raw_data(self):
+        '''
+        Returns a payload sent to server as bytes
+
+        :raises restea.errors.PayloadTooLargeError: body is too large
+        :returns: bytes -- raw payload sent to server
+        '''
+        check_body_size(len(self._body), self.max_body_size)
+        return self._body
+
+    @cached_property
+    def method(self):
+        '''
+        Returns HTTP method for the current request
+
+        :returns: string -- HTTP method name
+        '''
+        return self._original_request['method']
+
+    @cached_property
+    def remote_addr(self):
+        '''
+        Returns address of the client sent the request
+
+        :returns: string -- client IP address, None if it's unknown
+        '''
+        client = self._original_request.get('client')
+        return client[0] if client else None
+
+    @cached_property
+    def headers(self):
+        '''
+        Returns a headers dict. Header names are converted to the WSGI environ
+        format, i.e. HTTP_X_HTTP_METHOD_OVERRIDE, the same way as with other
+        adapters
+
+        :returns: dict -- received request headers
+        '''
+        headers = {}
+        for name, value in self._original_request.get('headers', ()):
+            name = name.decode('latin-1').upper().replace('-', '_')
+            if name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+                name = 'HTTP_' + name
+            headers[name] = value.decode('latin-1')
+        return headers
+
+    def get(self, value):
+        '''
+        Returns a value from the HTTP GET "map"
+
+        :param value: string -- key from GET
+        :returns: string -- value from GET or None if anything is found
+        '''
+        if self._query is None:
+            self._query = parse_qs(
+                self._original_request.get('query_string', b'').decode(
+                    'latin-1'
+                )
+            )
+        values = self._query.get(value)
+        return values[0] if values else None
+
+
+class ASGIResourceWrapper(BaseResourceWrapper):
+    '''
+    ASGIResourceWrapper implements ASGI application API for the
+    `restea.Resource` object. Resource is dispatched with
+    `Resource.dispatch_async`, so resource methods can be coroutines
+    '''
+    request_wrapper_class = ASGIRequestWrapper
+
+    async def read_body(self, receive, max_size=None):
+        '''
+        Receives the whole request body. Once the body exceeds max_size the
+        rest of it is received but dropped, so the request is rejected by
+        the resource without keeping oversized body in memory
+
+        :param receive: ASGI receive callable
+        :param max_size: int -- maximal size of the body, not limited if None
+        :returns: bytes -- request body, longer than max_size if it's
+        exceeded
+        '''
+        chunks = []
+        size = 0
+        more_body = True
+        while more_body:
+            message = await receive()
+            chunk = message.get('body', b'')
+            if max_size is None or size <= max_size:
+                chunks.append(chunk)
+                size += len(chunk)
+            more_body = message.get('more_body', False)
+        return b''.join(chunks)
+
+    def prepare_response(self, content, status_code, content_type, headers):
+        '''
+        Prepares response for the given arguments.
+
+        :returns: coroutine function sending the response with ASGI send
+        callable
+        '''
+        raw_headers = [(b'content-type', content_type.encode('latin-1'))]
+        for name, value in headers.items():
+            raw_headers.append(
+                (name.lower().encode('latin-1'), str(value).encode('latin-1'))
+            )
+
+        async def send_response(send):
+            await send({
+                'type': 'http.response.start',
+                'status': status_code,
+                'headers': raw_headers,
+            })
+            if not self.is_streamed(content):
+                chunks = [content]
+            else:
+                chunks = content
+            for chunk in chunks:
+                if not isinstance(chunk, bytes):
+                    chunk = chunk.encode('utf-8')
+                await send({
+                    'type': 'http.response.body',
+                    'body': chunk,
+                    'more_body': True,
+                })
+            await send({'type': 'http.response.body', 'body': b''})
+
+        return send_response
+
+    async def wrap_request(self, scope, receive, send, **kwargs):
+        '''
+        Prepares data and pass control to `restea.Resource` object
+
+        :param scope: dict -- ASGI connection scope
+        :param receive: ASGI receive callable
+        :param send: ASGI send callable
+        '''
+        data_format, kwargs = self._get_format_name(kwargs)
+        formatter = formats.get_formatter(data_format)
+        body = await self.read_body(
+            receive, self._resource_class.max_body_size
+        )
+
+        resource = self._resource_class(
+            self.request_wrapper_class(scope, body), formatter
+        )
+        response_tuple = await resource.dispatch_async(**kwargs)
+
+        if len(response_tuple) == 3:
+            # For backward compatibility, it adds an empty dict as headers
+            response_tuple += ({},)
+
+        send_response = self.prepare_response(*response_tuple)
+        await send_response(send)
+
+    def get_routes(self, path='', iden_format=r'(?P<iden>\w+)'):
+        '''
+        Prepare routes for the given REST resource
+
+        :param path: string -- base path for the REST resource
+        :param iden: string -- format for identifier, for instance might be
+        used to make composite identifier
+        :returns: list -- pairs of url pattern and ASGI handler
+        '''
+        return [
+            (
+                r'^{}(?:\.(?P<data_format>\w+))?$'.format(path),
+                self.wrap_request
+            ),
+            (
+                r'^{}/{}(?:\.(?P<data_format>\w+))?$'.format(
+                    path, iden_format),
+                self.wrap_request
+            )
+        ]
+
+
+class ASGIApplication(object):
+    '''
+    ASGI application routing HTTP requests to the resources
+    '''
+    def __init__(self, routes=()):
+        '''
+        :param routes: list -- routes returned by
+        `ASGIResourceWrapper.get_routes`
+        '''
+        self.router = Router(routes)
+
+    def add_routes(self, routes):
+        '''
+        Registers routes
+
+        :param routes: list -- routes returned by
+        `ASGIResourceWrapper.get_routes`
+        '''
+        self.router.add_routes(routes)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return
+
+        matched = self.router.match(scope['path'])
+        if matched is not None:
+            handler, kwargs = matched
+            await handler(scope, receive, send, **kwargs)
+            return
+
+        await send({
+            'type': 'http.response.start',
+            'status': 404,
+            'headers': [(b'content-type', b'text/plain')],
+        })
+        await send({'type': 'http.response.body', 'body': b'Not Found'})
@@ -1,6 +1,101 @@
+import six
+
+import restea.errors as errors
 import restea.formats as formats
 
 
+#: size of chunks request body is read by, see
+# `BaseRequestWrapper.iter_body`
+CHUNK_SIZE = 65536
+
+
+class cached_property(object):
+    '''
+    Property computed once per object. Value is stored in the object
+    `__dict__` under the property name, so next lookups don't call the
+    getter at all
+    '''
+    def __init__(self, func):
+        '''
+        :param func: function -- getter of the property
+        '''
+        self.func = func
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        value = obj.__dict__[self.__name__] = self.func(obj)
+        return value
+
+
+#: names of HTTP headers in WSGI environ format, see `get_environ_name`
+_environ_names = {}
+
+
+def get_environ_name(name):
+    '''
+    Returns name of HTTP header in WSGI environ format, i.e.
+    HTTP_IF_NONE_MATCH for If-None-Match
+
+    :param name: string -- name of HTTP header
+    :returns: string -- name of the header in WSGI environ
+    '''
+    environ_name = _environ_names.get(name)
+    if environ_name is None:
+        environ_name = name.upper().replace('-', '_')
+        if environ_name not in ('CONTENT_TYPE', 'CONTENT_LENGTH'):
+            environ_name = 'HTTP_' + environ_name
+        _environ_names[name] = environ_name
+    return environ_name
+
+
+def check_body_size(size, max_size):
+    '''
+    Checks size of request body against the limit
+
+    :param size: int -- size of the body or its part already read
+    :param max_size: int -- maximal size of the body, not limited if None
+    :raises restea.errors.PayloadTooLargeError: body is too large
+    '''
+    if max_size is not None and size > max_size:
+        raise errors.PayloadTooLargeError.constant(
+            'Request body is larger than {} bytes'.format(max_size)
+        )
+
+
+def iter_stream(stream, length=None, chunk_size=CHUNK_SIZE, max_size=None):
+    '''
+    Reads file-like stream by chunks. Known length is checked against the
+    limit before reading anything, otherwise reading stops as soon as the
+    limit is exceeded, so no more than `max_size` and a chunk is read
+
+    :param stream: file-like object with `read(size)` method
+    :param length: int -- number of bytes to read, stream is read until the
+    end if None
+    :param chunk_size: int -- maximal size of a chunk
+    :param max_size: int -- maximal number of bytes to read, not limited if
+    None
+    :raises restea.errors.PayloadTooLargeError: stream is too large
+    :returns: generator of bytes chunks
+    '''
+    if length is not None:
+        check_body_size(length, max_size)
+
+    total = 0
+    while length is None or length > 0:
+        size = chunk_size if length is None else min(chunk_size, length)
+        chunk = stream.read(size)
+        if not chunk:
+            break
+        total += len(chunk)
+        check_body_size(total, max_size)
+        if length is not None:
+            length -= len(chunk)
+        yield chunk
+
+
 class BaseResourceWrapper(object):
     '''
     BaseResourceWrapper is added to have common interface between frameworks.
@@ -42,13 +137,25 @@ class BaseResourceWrapper(object):
         '''
         Prepares response for the given arguments.
 
-        :param content: string -- response content
+        :param content: string -- response content, or iterator of strings
+        if response is streamed (see `is_streamed`). Content is empty for
+        responses without body, i.e. 304 Not Modified
         :param status_code: string -- response status code
         :param content_type: string -- response content type
         :param headers: string -- response headers
         '''
         raise NotImplementedError
 
+    def is_streamed(self, content):
+        '''
+        Checks if response content is an iterator of chunks rather than a
+        string
+
+        :param content: response content
+        :returns: bool -- True if response content should be streamed
+        '''
+        return not isinstance(content, (six.binary_type, six.text_type))
+
     def split_request_and_arguments(self, *args, **kwargs):
         '''
         Hook to return the original request object and arguments.
@@ -93,15 +200,21 @@ class BaseResourceWrapper(object):
 class BaseRequestWrapper(object):
     '''
     BaseRequestWrapper wraps the `restea.request.Request` objects to abstract
-    implementation between different frameworks
+    implementation between different frameworks. Accessors of the wrapped
+    request are computed once per request (see `cached_property`), so request
+    body is read and decoded only once
     '''
+    #: maximal size of request body in bytes, set from
+    # `restea.resource.Resource.max_body_size`. Not limited if None
+    max_body_size = None
+
     def __init__(self, original_request):
         '''
         :param original_request: -- request object from the given framework
         '''
         self._original_request = original_request
 
-    @property
+    @cached_property
     def data(self):
         '''
         Returns a payload sent to server
@@ -110,7 +223,81 @@ class BaseRequestWrapper(object):
         '''
         raise NotImplementedError
 
-    @property
+    @cached_property
+    def raw_data(self):
+        '''
+        Returns a payload sent to server as bytes, without decoding it. Used
+        by formatters which accept bytes (see `accepts_bytes`). Body is read
+        from the body stream by chunks up to `max_body_size` (see
+        `_read_body`), falls back to `data` if wrapper doesn't provide the
+        stream. Wrappers may return memoryview to avoid copying
+
+        :raises restea.errors.PayloadTooLargeError: body is too large
+        :returns: bytes, memoryview -- raw payload sent to server
+        '''
+        body = self._read_body()
+        if body is None:
+            body = self.data
+            check_body_size(len(body), self.max_body_size)
+        return body
+
+    def _get_body_stream(self):
+        '''
+        Returns file-like stream of request body, used to read body by
+        chunks. Wrappers of frameworks which give access to the body stream
+        should override it
+
+        :returns: tuple -- file-like object and number of bytes to read from
+        it (None if stream ends with the body), None if body isn't available
+        as a stream
+        '''
+        return None
+
+    def _read_body(self):
+        '''
+        Reads the whole body from the body stream by chunks, so body larger
+        than `max_body_size` is rejected before it's read
+
+        :raises restea.errors.PayloadTooLargeError: body is too large
+        :returns: bytes -- request body, None if body isn't available as a
+        stream
+        '''
+        body_stream = self._get_body_stream()
+        if body_stream is None:
+            return None
+
+        stream, length = body_stream
+        return b''.join(
+            iter_stream(stream, length, max_size=self.max_body_size)
+        )
+
+    def iter_body(self, chunk_size=CHUNK_SIZE):
+        '''
+        Returns request body as an iterator of bytes chunks, so it can be
+        parsed incrementally (see `restea.formats.BaseFormatter.incremental`)
+        without loading the whole body into memory. Body can be iterated
+        only once and only if it wasn't read with `data` or `raw_data`,
+        otherwise already read body is returned as a single chunk. Body
+        larger than `max_body_size` is rejected while iterated
+
+        :param chunk_size: int -- maximal size of a chunk
+        :raises restea.errors.PayloadTooLargeError: body is too large
+        :returns: iterator of bytes chunks
+        '''
+        if 'data' not in self.__dict__ and 'raw_data' not in self.__dict__:
+            body_stream = self._get_body_stream()
+            if body_stream is not None:
+                stream, length = body_stream
+                return iter_stream(
+                    stream, length, chunk_size, self.max_body_size
+                )
+
+        data = self.raw_data
+        if isinstance(data, six.text_type):
+            data = data.encode('utf-8')
+        return iter([data] if data else [])
+
+    @cached_property
     def headers(self):
         '''
         Returns a headers dict
@@ -119,7 +306,7 @@ class BaseRequestWrapper(object):
         '''
         raise NotImplementedError
 
-    @property
+    @cached_property
     def method(self):
         '''
         Returns HTTP method for the current request
@@ -128,6 +315,30 @@ class BaseRequestWrapper(object):
         '''
         raise NotImplementedError
 
+    def get_header(self, name, default=None):
+        '''
+        Returns value of HTTP header of the request. Header is looked up by
+        its HTTP name, i.e. If-None-Match, so it doesn't depend on the way
+        framework exposes `headers`. Headers are looked up in `headers` in
+        WSGI environ format by default
+
+        :param name: string -- name of HTTP header
+        :param default: value returned if header is missing
+        :returns: string -- value of the header
+        '''
+        return self.headers.get(get_environ_name(name), default)
+
+    @cached_property
+    def remote_addr(self):
+        '''
+        Returns address of the client sent the request. Address is taken
+        from the connection rather than from request headers, so it doesn't
+        depend on the way wrapper exposes headers
+
+        :returns: string -- client IP address, None if it's unknown
+        '''
+        raise NotImplementedError
+
     def get(self, value):
         '''
         Returns a value from the HTTP GET "map"
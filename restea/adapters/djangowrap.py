@@ -1,19 +1,31 @@
+import io
+
 import six
 
-from django.http import HttpResponse
+from django.conf import settings
+from django.http import HttpResponse, StreamingHttpResponse
 from django.conf.urls import url
 
 from restea.adapters.base import (
     BaseResourceWrapper,
     BaseRequestWrapper,
+    cached_property,
 )
 
 
 class DjangoRequestWrapper(BaseRequestWrapper):
     '''
-    Object wrapping Django request object.
+    Object wrapping Django request object. Body size is limited by
+    DATA_UPLOAD_MAX_MEMORY_SIZE setting unless resource sets its own limit
     '''
-    @property
+    def __init__(self, original_request):
+        '''
+        :param original_request: -- Django request object
+        '''
+        super(DjangoRequestWrapper, self).__init__(original_request)
+        self.max_body_size = settings.DATA_UPLOAD_MAX_MEMORY_SIZE
+
+    @cached_property
     def method(self):
         '''
         Returns a payload sent to server
@@ -22,7 +34,16 @@ class DjangoRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.method
 
-    @property
+    @cached_property
+    def remote_addr(self):
+        '''
+        Returns address of the client sent the request
+
+        :returns: string -- client IP address, None if it's unknown
+        '''
+        return self._original_request.META.get('REMOTE_ADDR')
+
+    @cached_property
     def headers(self):
         '''
         Returns a headers dict
@@ -31,6 +52,30 @@ class DjangoRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.META
 
+    def _get_body_stream(self):
+        request = self._original_request
+        content_length = int(self.headers.get('CONTENT_LENGTH') or 0)
+        if hasattr(request, '_body'):
+            # body is already read and cached by Django, i.e. with
+            # request.body, the request can't be read again
+            return io.BytesIO(request._body), len(request._body)
+
+        # Django request is a file-like object limited to the body
+        return request, content_length
+
+    def _read_body(self):
+        '''
+        Reads request body by chunks. Body is cached in the request the same
+        way Django does it, so request.body and request.POST can be used
+        after that
+
+        :raises restea.errors.PayloadTooLargeError: body is too large
+        :returns: bytes -- request body
+        '''
+        body = super(DjangoRequestWrapper, self)._read_body()
+        self._original_request._body = body
+        return body
+
     def get(self, value):
         '''
         Returns HTTP method for the current request
@@ -39,7 +84,7 @@ class DjangoRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.GET.get(value)
 
-    @property
+    @cached_property
     def data(self):
         '''
         Returns a value from the HTTP GET "map"
@@ -47,7 +92,7 @@ class DjangoRequestWrapper(BaseRequestWrapper):
         :param value: string -- key from GET
         :returns: string -- value from GET or None if anything is found
         '''
-        return self._original_request.body
+        return self.raw_data
 
 
 class DjangoResourceRouter(BaseResourceWrapper):
@@ -58,7 +103,11 @@ class DjangoResourceRouter(BaseResourceWrapper):
     request_wrapper_class = DjangoRequestWrapper
 
     def prepare_response(self, content, status_code, content_type, headers):
-        response = HttpResponse(
+        response_class = HttpResponse
+        if self.is_streamed(content):
+            response_class = StreamingHttpResponse
+
+        response = response_class(
             content,
             content_type=content_type,
             status=status_code
@@ -1,3 +1,5 @@
+import io
+
 import six
 
 import flask
@@ -5,6 +7,7 @@ import flask
 from restea.adapters.base import (
     BaseResourceWrapper,
     BaseRequestWrapper,
+    cached_property,
 )
 
 
@@ -12,16 +15,38 @@ class FlaskRequestWrapper(BaseRequestWrapper):
     '''
     Object wrapping Flask request context.
     '''
-    @property
+    @cached_property
     def data(self):
         '''
         Returns a payload sent to server
 
         :returns: string -- raw value of payload sent to server
         '''
-        return self._original_request.data.decode()
+        return self.raw_data.decode()
+
+    def _get_body_stream(self):
+        request = self._original_request
+        cached_data = getattr(request, '_cached_data', None)
+        if cached_data is not None:
+            # body is already read and cached by werkzeug, i.e. with
+            # request.get_data() in before_request, the stream is empty
+            return io.BytesIO(cached_data), len(cached_data)
+        return request.stream, request.content_length
+
+    def _read_body(self):
+        '''
+        Reads request body by chunks. Body is cached in the request the same
+        way werkzeug does it, so request.get_data() and request.json can be
+        used after that
 
-    @property
+        :raises restea.errors.PayloadTooLargeError: body is too large
+        :returns: bytes -- request body
+        '''
+        body = super(FlaskRequestWrapper, self)._read_body()
+        self._original_request._cached_data = body
+        return body
+
+    @cached_property
     def method(self):
         '''
         Returns HTTP method for the current request
@@ -30,7 +55,16 @@ class FlaskRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.method
 
-    @property
+    @cached_property
+    def remote_addr(self):
+        '''
+        Returns address of the client sent the request
+
+        :returns: string -- client IP address, None if it's unknown
+        '''
+        return self._original_request.remote_addr
+
+    @cached_property
     def headers(self):
         '''
         Returns a headers dict
@@ -39,6 +73,16 @@ class FlaskRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.headers
 
+    def get_header(self, name, default=None):
+        '''
+        Returns value of HTTP header of the request
+
+        :param name: string -- name of HTTP header, i.e. If-None-Match
+        :param default: value returned if header is missing
+        :returns: string -- value of the header
+        '''
+        return self._original_request.headers.get(name, default)
+
     def get(self, value):
         '''
         Returns a value from the HTTP GET "map"
@@ -7,15 +7,16 @@ from wheezy.http.comp import bton
 from restea.adapters.base import (
     BaseResourceWrapper,
     BaseRequestWrapper,
+    cached_property,
 )
-from restea.errors import BadRequestError
+from restea.errors import PayloadTooLargeError
 
 
 class WheezyRequestWrapper(BaseRequestWrapper):
     '''
     Object wrapping Wheezy web request object.
     '''
-    @property
+    @cached_property
     def method(self):
         '''
         Returns a payload sent to server
@@ -24,7 +25,16 @@ class WheezyRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.method
 
-    @property
+    @cached_property
+    def remote_addr(self):
+        '''
+        Returns address of the client sent the request
+
+        :returns: string -- client IP address, None if it's unknown
+        '''
+        return self._original_request.environ.get('REMOTE_ADDR')
+
+    @cached_property
     def headers(self):
         '''
         Returns a headers dict
@@ -41,7 +51,35 @@ class WheezyRequestWrapper(BaseRequestWrapper):
         '''
         return self._original_request.get_param(value)
 
-    @property
+    def _get_body_stream(self):
+        '''
+        Returns wsgi.input stream of the request body
+
+        :raises restea.errors.PayloadTooLargeError: content is too long
+        :returns: tuple -- wsgi.input and content length
+        '''
+        orig_req = self._original_request
+        environ = orig_req.environ
+        icl = int(environ['CONTENT_LENGTH'])
+        if icl > orig_req.options['MAX_CONTENT_LENGTH']:
+            raise PayloadTooLargeError('Maximum content length exceeded')
+        fp = environ['wsgi.input']
+        fp.seek(0)
+        return fp, icl
+
+    def _read_body(self):
+        '''
+        Reads request body from wsgi.input by chunks, wsgi.input is rewound
+        after that
+
+        :raises restea.errors.PayloadTooLargeError: content is too long
+        :returns: bytes -- request body
+        '''
+        ret = super(WheezyRequestWrapper, self)._read_body()
+        self._original_request.environ['wsgi.input'].seek(0)
+        return ret
+
+    @cached_property
     def data(self):
         '''
         Returns a value from the HTTP GET "map"
@@ -53,16 +91,18 @@ class WheezyRequestWrapper(BaseRequestWrapper):
         method = orig_req.method.lower()
         if method == 'get':
             return orig_req.query
-        environ = orig_req.environ
-        cl = environ['CONTENT_LENGTH']
-        icl = int(cl)
-        if icl > orig_req.options['MAX_CONTENT_LENGTH']:
-            raise BadRequestError('Maximum content length exceeded')
-        fp = environ['wsgi.input']
-        fp.seek(0)
-        ret = bton(fp.read(icl), orig_req.encoding)
-        fp.seek(0)
-        return ret
+        return bton(self.raw_data, orig_req.encoding)
+
+    @cached_property
+    def raw_data(self):
+        '''
+        Returns a payload sent to server as bytes
+
+        :returns: bytes -- raw payload sent to server
+        '''
+        if self._original_request.method.lower() == 'get':
+            return b''
+        return self._read_body()
 
 
 class WheezyResourceRouter(BaseResourceWrapper):
@@ -74,7 +114,18 @@ class WheezyResourceRouter(BaseResourceWrapper):
 
     def prepare_response(self, content, status_code, content_type, headers):
         response = HTTPResponse(content_type=content_type)
-        response.write(content)
+        if self.is_streamed(content):
+            # Wheezy web buffers response to set Content-Length, so chunks
+            # are only written one by one instead of joined into one string
+            for chunk in content:
+                if isinstance(chunk, six.binary_type):
+                    response.write_bytes(chunk)
+                else:
+                    response.write(chunk)
+        elif isinstance(content, six.binary_type):
+            response.write_bytes(content)
+        else:
+            response.write(content)
         response.status_code = status_code
         for name, value in six.iteritems(headers):
             response.headers.append((name, value))
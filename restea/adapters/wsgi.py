@@ -0,0 +1,273 @@
+import re
+
+import six
+from six.moves import http_client
+from six.moves.urllib.parse import parse_qs
+
+from restea.adapters.base import (
+    BaseResourceWrapper,
+    BaseRequestWrapper,
+    cached_property,
+)
+
+
+class Router(object):
+    '''
+    Router matching url path against all registered routes at once. Route
+    patterns are compiled into a single regular expression, named groups are
+    renamed to be unique for every route
+    '''
+    _group_re = re.compile(r'\(\?P(<|=)(\w+)')
+
+    #: maximal number of groups in one compiled regular expression. `re` of
+    # Python 2 supports only 100 groups including the whole match, so routes
+    # are split into several expressions there. Not limited if None
+    max_groups = 99 if six.PY2 else None
+
+    def __init__(self, routes=()):
+        '''
+        :param routes: list -- pairs of url pattern and handler
+        '''
+        self._routes = []
+        self._regexes = None
+        self._handlers = {}
+        self.add_routes(routes)
+
+    def add_routes(self, routes):
+        '''
+        Registers routes, router is recompiled on the next match
+
+        :param routes: list -- pairs of url pattern and handler, patterns
+        are matched against the whole path
+        '''
+        for pattern, handler in routes:
+            if pattern.startswith('^'):
+                pattern = pattern[1:]
+            if pattern.endswith('$') and not pattern.endswith('\\$'):
+                pattern = pattern[:-1]
+            self._routes.append((pattern, handler))
+        self._regexes = None
+
+    def compile(self):
+        '''
+        Compiles all the routes into a single regular expression, or into as
+        few expressions as `max_groups` allows
+        '''
+        self._regexes = []
+        self._handlers = {}
+        alternatives = []
+        groups = 0
+        for index, (pattern, handler) in enumerate(self._routes):
+            prefix = 'r{}_'.format(index)
+            group_names = {}
+
+            def rename(match):
+                group_name = prefix + match.group(2)
+                group_names[group_name] = match.group(2)
+                return '(?P{}{}'.format(match.group(1), group_name)
+
+            pattern = self._group_re.sub(rename, pattern)
+            route_name = '_r{}'.format(index)
+            self._handlers[route_name] = (handler, group_names)
+
+            # route groups and the group of the route itself
+            route_groups = re.compile(pattern).groups + 1
+            if (
+                alternatives and self.max_groups is not None and
+                groups + route_groups > self.max_groups
+            ):
+                self._regexes.append(self._compile_alternatives(alternatives))
+                alternatives = []
+                groups = 0
+            alternatives.append('(?P<{}>{})'.format(route_name, pattern))
+            groups += route_groups
+
+        if alternatives:
+            self._regexes.append(self._compile_alternatives(alternatives))
+
+    def _compile_alternatives(self, alternatives):
+        return re.compile('^(?:{})$'.format('|'.join(alternatives)))
+
+    def match(self, path):
+        '''
+        Finds handler for the url path
+
+        :param path: string -- url path
+        :returns: tuple -- handler and kwargs taken from named groups of the
+        route pattern, None if there is no matching route
+        '''
+        if self._regexes is None:
+            self.compile()
+
+        for regex in self._regexes:
+            match = regex.match(path)
+            if match:
+                break
+        else:
+            return None
+
+        handler, group_names = self._handlers[match.lastgroup]
+        kwargs = {}
+        for group_name, name in group_names.items():
+            value = match.group(group_name)
+            if value is not None:
+                kwargs[name] = value
+        return handler, kwargs
+
+
+class WSGIRequestWrapper(BaseRequestWrapper):
+    '''
+    Object wrapping WSGI environ.
+    '''
+    def __init__(self, original_request):
+        '''
+        :param original_request: dict -- WSGI environ
+        '''
+        super(WSGIRequestWrapper, self).__init__(original_request)
+        self._query = None
+
+    @cached_property
+    def data(self):
+        '''
+        Returns a payload sent to server
+
+        :returns: string -- raw value of payload sent to server
+        '''
+        return self.raw_data.decode('utf-8')
+
+    def _get_body_stream(self):
+        environ = self._original_request
+        content_length = int(environ.get('CONTENT_LENGTH') or 0)
+        return environ.get('wsgi.input'), content_length
+
+    @cached_property
+    def method(self):
+        '''
+        Returns HTTP method for the current request
+
+        :returns: string -- HTTP method name
+        '''
+        return self._original_request['REQUEST_METHOD']
+
+    @cached_property
+    def remote_addr(self):
+        '''
+        Returns address of the client sent the request
+
+        :returns: string -- client IP address, None if it's unknown
+        '''
+        return self._original_request.get('REMOTE_ADDR')
+
+    @cached_property
+    def headers(self):
+        '''
+        Returns a headers dict
+
+        :returns: dict -- received request headers
+        '''
+        return self._original_request
+
+    def get(self, value):
+        '''
+        Returns a value from the HTTP GET "map"
+
+        :param value: string -- key from GET
+        :returns: string -- value from GET or None if anything is found
+        '''
+        if self._query is None:
+            self._query = parse_qs(
+                self._original_request.get('QUERY_STRING', '')
+            )
+        values = self._query.get(value)
+        return values[0] if values else None
+
+
+class WSGIResourceWrapper(BaseResourceWrapper):
+    '''
+    WSGIResourceWrapper exposes `restea.Resource` object as a WSGI handler
+    without any web framework, routes are served by
+    `restea.adapters.wsgi.WSGIApplication`
+    '''
+    request_wrapper_class = WSGIRequestWrapper
+
+    def prepare_response(self, content, status_code, content_type, headers):
+        '''
+        Prepares response for the given arguments.
+
+        :returns: tuple -- WSGI status line, headers list and body iterable
+        '''
+        status = '{} {}'.format(
+            status_code, http_client.responses.get(status_code, '')
+        )
+        response_headers = [('Content-Type', content_type)]
+        for name, value in six.iteritems(headers):
+            response_headers.append((name, str(value)))
+
+        if self.is_streamed(content):
+            body = (
+                chunk.encode('utf-8')
+                if isinstance(chunk, six.text_type) else chunk
+                for chunk in content
+            )
+        else:
+            if isinstance(content, six.text_type):
+                content = content.encode('utf-8')
+            response_headers.append(('Content-Length', str(len(content))))
+            body = [content]
+
+        return status, response_headers, body
+
+    def get_routes(self, path='', iden_format=r'(?P<iden>\w+)'):
+        '''
+        Prepare routes for the given REST resource
+
+        :param path: string -- base path for the REST resource
+        :param iden: string -- format for identifier, for instance might be
+        used to make composite identifier
+        :returns: list -- pairs of url pattern and handler
+        '''
+        return [
+            (
+                r'^{}(?:\.(?P<data_format>\w+))?$'.format(path),
+                self.wrap_request
+            ),
+            (
+                r'^{}/{}(?:\.(?P<data_format>\w+))?$'.format(
+                    path, iden_format),
+                self.wrap_request
+            )
+        ]
+
+
+class WSGIApplication(object):
+    '''
+    WSGI application routing requests to the resources
+    '''
+    def __init__(self, routes=()):
+        '''
+        :param routes: list -- routes returned by
+        `WSGIResourceWrapper.get_routes`
+        '''
+        self.router = Router(routes)
+
+    def add_routes(self, routes):
+        '''
+        Registers routes
+
+        :param routes: list -- routes returned by
+        `WSGIResourceWrapper.get_routes`
+        '''
+        self.router.add_routes(routes)
+
+    def __call__(self, environ, start_response):
+        matched = self.router.match(environ.get('PATH_INFO', ''))
+        if matched is None:
+            start_response(
+                '404 Not Found', [('Content-Type', 'text/plain')]
+            )
+            return [b'Not Found']
+
+        handler, kwargs = matched
+        status, headers, body = handler(environ, **kwargs)
+        start_response(status, headers)
+        return body
@@ -0,0 +1,118 @@
+import inspect
+
+import restea.cache as cache
+import restea.errors as errors
+import restea.instrumentation as instrumentation
+
+
+async def _resolve(value):
+    '''
+    Awaits the value if it's awaitable, i.e. returned by `async def` method
+    '''
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+async def _measure(resource, phase, func, *args, **kwargs):
+    '''
+    Asynchronous version of :meth: `restea.resource.Resource._measure`,
+    function can return awaitable
+    '''
+    if resource._timings is None:
+        return await _resolve(func(*args, **kwargs))
+
+    outer_phase = resource._start_phase(phase)
+    try:
+        return await _resolve(func(*args, **kwargs))
+    finally:
+        resource._stop_phase(phase, outer_phase)
+
+
+async def measure_awaitable(resource, phase, awaitable):
+    '''
+    Awaits the awaitable measuring its time as a phase of the request, i.e.
+    coroutine returned by `async def` resource method
+
+    :param resource: :class: `restea.resource.Resource` -- resource object
+    :param phase: string -- name of the phase
+    :param awaitable: awaitable to be awaited
+    :returns: result of the awaitable
+    '''
+    if resource._timings is None:
+        return await awaitable
+
+    outer_phase = resource._start_phase(phase)
+    try:
+        return await awaitable
+    finally:
+        resource._stop_phase(phase, outer_phase)
+
+
+async def process_async(resource, *args, **kwargs):
+    '''
+    Asynchronous version of :meth: `restea.resource.Resource.process`.
+    Resource methods, prepare and finish can be either regular functions or
+    defined with `async def`
+
+    :param resource: :class: `restea.resource.Resource` -- resource object
+    :returns: serialized data to be returned to client, iterator of
+    serialized chunks if `list` response is streamed
+    '''
+    measure = resource._measure
+    method_name, method, is_bulk = measure(
+        'resolve', resource._resolve_method, args, kwargs
+    )
+
+    await _measure(resource, 'prepare', resource.prepare)
+    response = await _measure(
+        resource, 'decorators', method, resource, *args, **kwargs
+    )
+    if isinstance(response, cache.CachedResponse):
+        return measure(
+            'serialize', resource._get_cached_content, method_name, response
+        )
+
+    response = measure(
+        'handle', resource._handle_method_response, method_name, response,
+        is_bulk
+    )
+    response = await _measure(resource, 'finish', resource.finish, response)
+    return measure(
+        'serialize', resource._serialize_response, method_name, response
+    )
+
+
+async def dispatch_async(resource, *args, **kwargs):
+    '''
+    Asynchronous version of :meth: `restea.resource.Resource.dispatch`
+
+    :param resource: :class: `restea.resource.Resource` -- resource object
+    :returns: 4-element tuple: result, HTTP status code, content type, and
+    headers
+    '''
+    resource._start_timings()
+    started = instrumentation.clock()
+
+    try:
+        response = (
+            await process_async(resource, *args, **kwargs),
+            200,
+            resource.formatter.content_type,
+            resource._response_headers
+        )
+    except errors.RestError as e:
+        response = resource._measure(
+            'serialize', resource._get_error_response, e
+        )
+
+    if resource.compression is not None:
+        response = resource._measure(
+            'compress', resource._compress_response, response
+        )
+
+    if resource._timings is not None:
+        resource._finish_timings(
+            response, instrumentation.clock() - started
+        )
+    return response
@@ -0,0 +1,185 @@
+import collections
+import hashlib
+import threading
+import time
+import uuid
+
+
+#: response served from cache, passed through resource decorators instead of
+# the data returned by resource method
+CachedResponse = collections.namedtuple('CachedResponse', 'content headers')
+
+
+class BaseCacheBackend(object):
+    '''
+    BaseCacheBackend is base class for cache storages
+    '''
+    def get(self, key):
+        '''
+        Returns a value stored for the key
+
+        :param key: string -- cache key
+        :returns: stored value or None if there is no value or it's expired
+        '''
+        raise NotImplementedError
+
+    def set(self, key, value, ttl=None):
+        '''
+        Stores a value for the key
+
+        :param key: string -- cache key
+        :param value: value to be stored
+        :param ttl: int -- seconds value is kept, forever if None
+        '''
+        raise NotImplementedError
+
+    def delete(self, key):
+        '''
+        Removes a value stored for the key
+
+        :param key: string -- cache key
+        '''
+        raise NotImplementedError
+
+
+class LocalCacheBackend(BaseCacheBackend):
+    '''
+    In-process cache storage with LRU eviction and per-value TTL
+    '''
+    def __init__(self, max_size=1024, clock=time.time):
+        '''
+        :param max_size: int -- maximum number of values kept, least recently
+        used values are evicted first
+        :param clock: function -- returns current time in seconds
+        '''
+        self.max_size = max_size
+        self._clock = clock
+        self._values = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._values.pop(key, None)
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at is not None and expires_at <= self._clock():
+                return None
+
+            self._values[key] = item
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = None
+        if ttl is not None:
+            expires_at = self._clock() + ttl
+
+        with self._lock:
+            self._values.pop(key, None)
+            self._values[key] = (expires_at, value)
+            while len(self._values) > self.max_size:
+                self._values.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+
+class ClientCacheBackend(BaseCacheBackend):
+    '''
+    Cache storage shared between processes. Wraps a cache client with
+    `get(key)`, `set(key, value, timeout)` and `delete(key)` methods, i.e.
+    Django cache or memcache clients
+    '''
+    def __init__(self, client, prefix='restea:'):
+        '''
+        :param client: cache client object
+        :param prefix: string -- prefix added to all the keys
+        '''
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl=None):
+        self.client.set(self.prefix + key, value, ttl)
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+
+class ResponseCache(object):
+    '''
+    ResponseCache keeps serialized responses of resources. Responses of a
+    resource are invalidated all at once by changing the resource
+    generation, which is a part of every cache key
+    '''
+    def __init__(self, backend=None):
+        '''
+        :param backend: :class: `restea.cache.BaseCacheBackend` -- cache
+        storage, in-process LRU cache by default
+        '''
+        if backend is None:
+            backend = LocalCacheBackend()
+        self.backend = backend
+
+    def _get_generation(self, resource_name):
+        '''
+        Returns current generation of the resource, new generation is
+        started if it's not stored (i.e. evicted)
+        '''
+        generation_key = 'generation:' + resource_name
+        generation = self.backend.get(generation_key)
+        if generation is None:
+            generation = self.invalidate(resource_name)
+        return generation
+
+    def get_key(self, resource_name, *parts):
+        '''
+        Returns cache key for the response
+
+        :param resource_name: string -- name of the resource
+        :param parts: values identifying the response, i.e. method name,
+        iden and query params
+        :returns: string -- cache key
+        '''
+        key = repr((self._get_generation(resource_name),) + parts)
+        return 'response:{}:{}'.format(
+            resource_name, hashlib.sha1(key.encode('utf-8')).hexdigest()
+        )
+
+    def get(self, key):
+        '''
+        Returns cached response
+
+        :param key: string -- cache key
+        :returns: :class: `restea.cache.CachedResponse` or None
+        '''
+        cached = self.backend.get(key)
+        if cached is None:
+            return None
+        return CachedResponse(*cached)
+
+    def set(self, key, content, headers, ttl=None):
+        '''
+        Stores serialized response
+
+        :param key: string -- cache key
+        :param content: serialized response content
+        :param headers: dict -- response headers
+        :param ttl: int -- seconds response is kept
+        '''
+        self.backend.set(key, (content, list(headers.items())), ttl)
+
+    def invalidate(self, resource_name):
+        '''
+        Invalidates all the cached responses of the resource
+
+        :param resource_name: string -- name of the resource
+        :returns: string -- new generation of the resource
+        '''
+        generation = uuid.uuid4().hex
+        self.backend.set('generation:' + resource_name, generation)
+        return generation
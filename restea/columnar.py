@@ -0,0 +1,118 @@
+def _to_list(values):
+    '''
+    Converts column values to a list, arrays (i.e. NumPy) are converted all
+    at once with `tolist`
+    '''
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return list(values)
+
+
+def _to_python(value):
+    '''
+    Converts array scalar (i.e. NumPy) to Python value
+    '''
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+class Columns(object):
+    '''
+    Column-oriented list of rows. Resource `list` method can return Columns
+    instead of list of dicts: projection is applied by dropping whole
+    columns and response is serialized as
+    `{"columns": [...], "data": {"column": [...]}}`, so key names are not
+    repeated for every row
+    '''
+    def __init__(self, data, columns=None):
+        '''
+        :param data: dict -- column names mapped to lists or arrays (i.e.
+        NumPy) of values, all of the same length
+        :param columns: list -- order of the columns, keys of data by default
+        '''
+        if columns is None:
+            columns = list(data)
+        self.columns = list(columns)
+        self.data = data
+
+    @classmethod
+    def from_rows(cls, rows, columns=None):
+        '''
+        Builds columns from list of dicts
+
+        :param rows: list -- list of dicts
+        :param columns: list -- names of the columns, all the keys of the
+        rows in order they appear by default
+        :returns: :class: `restea.columnar.Columns` -- columns
+        '''
+        rows = list(rows)
+        if columns is None:
+            columns = []
+            seen = set()
+            for row in rows:
+                for name in row:
+                    if name not in seen:
+                        seen.add(name)
+                        columns.append(name)
+
+        data = dict((name, []) for name in columns)
+        for row in rows:
+            for name in columns:
+                data[name].append(row.get(name))
+        return cls(data, columns)
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(self.data[self.columns[0]])
+
+    def project(self, names):
+        '''
+        Returns only the requested columns
+
+        :param names: set -- names of the columns
+        :returns: :class: `restea.columnar.Columns` -- columns
+        '''
+        columns = [name for name in self.columns if name in names]
+        return Columns(
+            dict((name, self.data[name]) for name in columns), columns
+        )
+
+    def slice(self, start, stop):
+        '''
+        Returns rows from start to stop
+
+        :param start: int -- index of the first row
+        :param stop: int -- index after the last row
+        :returns: :class: `restea.columnar.Columns` -- columns
+        '''
+        return Columns(
+            dict((name, self.data[name][start:stop]) for name in self.columns),
+            self.columns
+        )
+
+    def row(self, index):
+        '''
+        Returns the row as a dict
+
+        :param index: int -- index of the row
+        :returns: dict -- row values
+        '''
+        return dict(
+            (name, _to_python(self.data[name][index]))
+            for name in self.columns
+        )
+
+    def to_dict(self):
+        '''
+        Returns columns in a form which can be serialized by any formatter
+
+        :returns: dict -- names of the columns and lists of values
+        '''
+        return {
+            'columns': self.columns,
+            'data': dict(
+                (name, _to_list(self.data[name])) for name in self.columns
+            ),
+        }
@@ -0,0 +1,201 @@
+import zlib
+
+import six
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class BaseCodec(object):
+    '''
+    BaseCodec is base class for content codings
+    '''
+    #: name of the coding used in Accept-Encoding and Content-Encoding
+    name = None
+
+    #: specifies if codec can be used, i.e. optional library is installed
+    available = True
+
+    def __init__(self, level=6):
+        '''
+        :param level: int -- compression level
+        '''
+        self.level = level
+
+    def compressobj(self):
+        '''
+        Returns compressor object with `compress(data)` and `flush()` methods
+        used to compress streamed content
+        '''
+        raise NotImplementedError
+
+    def compress(self, data):
+        '''
+        Compresses data
+
+        :param data: bytes -- data to be compressed
+        :returns: bytes -- compressed data
+        '''
+        compressor = self.compressobj()
+        return compressor.compress(data) + compressor.flush()
+
+
+class GzipCodec(BaseCodec):
+    name = 'gzip'
+
+    def compressobj(self):
+        return zlib.compressobj(self.level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+
+class DeflateCodec(BaseCodec):
+    name = 'deflate'
+
+    def compressobj(self):
+        return zlib.compressobj(self.level, zlib.DEFLATED, zlib.MAX_WBITS)
+
+
+class _BrotliCompressor(object):
+    '''
+    Adapts brotli compressor to zlib compressor object interface
+    '''
+    def __init__(self, quality):
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data):
+        return self._compressor.process(data)
+
+    def flush(self):
+        return self._compressor.finish()
+
+
+class BrotliCodec(BaseCodec):
+    '''
+    Brotli coding, available if brotli library is installed. It's faster
+    than gzip on the same compression ratio with low levels
+    '''
+    name = 'br'
+    available = brotli is not None
+
+    def __init__(self, level=4):
+        super(BrotliCodec, self).__init__(level)
+
+    def compressobj(self):
+        return _BrotliCompressor(self.level)
+
+    def compress(self, data):
+        return brotli.compress(data, quality=self.level)
+
+
+class Compression(object):
+    '''
+    Compression negotiates content coding with the client using
+    Accept-Encoding header and compresses responses bigger than threshold,
+    set it to `Resource.compression` to enable compression
+    '''
+    def __init__(self, threshold=1024, codecs=None):
+        '''
+        :param threshold: int -- minimal size of compressed response, streamed
+        responses are always compressed
+        :param codecs: list -- codecs in order of preference, available of
+        brotli, gzip and deflate by default
+        '''
+        if codecs is None:
+            codecs = [BrotliCodec(), GzipCodec(), DeflateCodec()]
+        self.threshold = threshold
+        self.codecs = [codec for codec in codecs if codec.available]
+
+    def negotiate(self, accept_encoding):
+        '''
+        Chooses codec acceptable by the client. Codec with the highest
+        quality value is chosen, order of preference is used if values are
+        equal
+
+        :param accept_encoding: string -- value of Accept-Encoding header
+        :returns: :class: `restea.compression.BaseCodec` -- codec or None if
+        response shouldn't be compressed
+        '''
+        if not accept_encoding:
+            return None
+
+        qualities = {}
+        for item in accept_encoding.split(','):
+            coding, _, params = item.partition(';')
+            quality = 1.0
+            params = params.strip()
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            qualities[coding.strip().lower()] = quality
+
+        default = qualities.get('*', 0.0)
+        best, best_quality = None, 0.0
+        for codec in self.codecs:
+            quality = qualities.get(codec.name, default)
+            if quality > best_quality:
+                best, best_quality = codec, quality
+        return best
+
+    def should_compress(self, content):
+        '''
+        Checks if the content is big enough to be compressed
+
+        :param content: string, bytes or iterator of them -- response content
+        :rtype: bool
+        '''
+        if isinstance(content, (six.binary_type, six.text_type)):
+            return len(content) > 0 and len(content) >= self.threshold
+        return True
+
+    def get_etag(self, etag, codec):
+        '''
+        Returns ETag of the compressed content. Compressed and uncompressed
+        content are different representations, so strong ETag of the content
+        gets a suffix of the coding, i.e. "abc" becomes "abc-gzip"
+
+        :param etag: string -- quoted ETag of the uncompressed content
+        :param codec: :class: `restea.compression.BaseCodec` -- codec
+        :returns: string -- quoted ETag of the compressed content
+        '''
+        return '{}-{}"'.format(etag[:-1], codec.name)
+
+    def strip_etag(self, etag):
+        '''
+        Removes suffix of the coding added by `get_etag`, so ETag sent by the
+        client can be compared with ETag of the uncompressed content
+
+        :param etag: string -- quoted ETag
+        :returns: string -- quoted ETag without suffix of the coding
+        '''
+        for codec in self.codecs:
+            suffix = '-{}"'.format(codec.name)
+            if etag.endswith(suffix):
+                return etag[:-len(suffix)] + '"'
+        return etag
+
+    def compress(self, content, codec):
+        '''
+        Compresses the content
+
+        :param content: string, bytes or iterator of them -- response content
+        :param codec: :class: `restea.compression.BaseCodec` -- codec
+        :returns: bytes or generator of bytes if content is streamed
+        '''
+        if isinstance(content, six.text_type):
+            content = content.encode('utf-8')
+        if isinstance(content, six.binary_type):
+            return codec.compress(content)
+        return self._compress_stream(content, codec)
+
+    def _compress_stream(self, chunks, codec):
+        compressor = codec.compressobj()
+        for chunk in chunks:
+            if isinstance(chunk, six.text_type):
+                chunk = chunk.encode('utf-8')
+            data = compressor.compress(chunk)
+            if data:
+                yield data
+        yield compressor.flush()
@@ -3,6 +3,10 @@ class RestError(Exception):
     Base rest error exception class. All other rest exceptions are derived from
     RestError.
     '''
+    #: if True, error response doesn't depend on the request, so it's
+    # serialized once per formatter and reused, see `constant`
+    is_constant = False
+
     def __init__(self, message, **info):
         '''
         :param message: string -- exception message
@@ -12,6 +16,26 @@ class RestError(Exception):
         super(RestError, self).__init__(message)
         self.info = info
 
+    @classmethod
+    def constant(cls, message):
+        '''
+        Returns error which response depends only on the message, i.e.
+        errors raised by restea itself for malformed requests
+
+        :param message: string -- exception message
+        :returns: :class: `restea.errors.RestError` -- error object
+        '''
+        error = cls(message)
+        error.is_constant = True
+        return error
+
+
+class NotModifiedError(RestError):
+    '''
+    HTTP 304. Not modified, responded without body
+    '''
+    http_code = 304
+
 
 class BadRequestError(RestError):
     '''
@@ -48,6 +72,20 @@ class ConflictError(RestError):
     http_code = 409
 
 
+class PayloadTooLargeError(RestError):
+    '''
+    HTTP 413. Request body is bigger than allowed
+    '''
+    http_code = 413
+
+
+class TooManyRequestsError(RestError):
+    '''
+    HTTP 429. Too many requests, client should retry after some time
+    '''
+    http_code = 429
+
+
 class ServerError(RestError):
     '''
     HTTP 503. Internal service error
@@ -2,7 +2,7 @@ import re
 import datetime
 
 import six
-from six.moves import map
+from six.moves import map, collections_abc
 
 
 class FieldSet(object):
@@ -20,6 +20,13 @@ class FieldSet(object):
     class ConfigurationError(Exception):
         pass
 
+    #: error thrown in case some of the items in a batch failed validation,
+    # `errors` holds (index, message) pairs for every failed item
+    class BatchError(Error):
+        def __init__(self, message, errors):
+            super(FieldSet.BatchError, self).__init__(message)
+            self.errors = errors
+
     def __init__(self, **fields):
         '''
         :param **fields: mapping of field names to
@@ -30,15 +37,7 @@ class FieldSet(object):
         for name, field in fields.items():
             field.set_name(name)
             self.fields[name] = field
-
-    @property
-    def field_names(self):
-        '''
-        Returns all field names
-        :returns: field names (from self.fields)
-        :rtype: set
-        '''
-        return set(self.fields.keys())
+        self.compile()
 
     def get_required_field_names(self, method_name, data):
         '''
@@ -57,9 +56,58 @@ class FieldSet(object):
             if is_required_field(field, data)
         )
 
+    def compile(self):
+        '''
+        Builds validation plan for registered fields. Field validators and
+        statically required field names are resolved once, so validation
+        doesn't need to look them up for every payload. Frozen set of all
+        field names is stored in self.field_names. Should be called
+        again if self.fields is changed after FieldSet is created
+        :returns: validation function accepting method name and data
+        :rtype: function
+        '''
+        self.field_names = frozenset(self.fields)
+
+        validators = dict(
+            (name, field.validate) for name, field in self.fields.items()
+        )
+        static_required = frozenset(
+            name for name, field in self.fields.items()
+            if not callable(field.required) and field.required
+        )
+        dynamic_required = tuple(
+            (name, field.required) for name, field in self.fields.items()
+            if callable(field.required)
+        )
+        error_class = self.Error
+
+        def validate(method_name, data):
+            cleaned_data = {}
+            for name, value in data.items():
+                validator = validators.get(name)
+                if validator is not None:
+                    cleaned_data[name] = validator(value)
+
+            for name in static_required:
+                if name not in cleaned_data:
+                    raise error_class('Field "{}" is missing'.format(name))
+
+            for name, is_required in dynamic_required:
+                if (
+                    name not in cleaned_data and
+                    is_required(method_name, cleaned_data)
+                ):
+                    raise error_class('Field "{}" is missing'.format(name))
+
+            return cleaned_data
+
+        self._validate = validate
+        return validate
+
     def validate(self, method_name, data):
         '''
-        Validates payload input
+        Validates payload input using validation plan built by
+        :meth: `restea.fields.FieldSet.compile`
         :param method_name: name of the method
         :type method_name: str
         :param data: input playload data to be validated
@@ -70,21 +118,65 @@ class FieldSet(object):
         :returns: validated data
         :rtype: dict
         '''
-        field_names = self.field_names
-        cleaned_data = {}
-        for name, value in data.items():
-            if name not in field_names:
-                continue
-            cleaned_data[name] = self.fields[name].validate(value)
+        return self._validate(method_name, data)
 
-        required_field_names = self.get_required_field_names(
-            method_name, cleaned_data
-        )
-        for req_field in required_field_names:
-            if req_field not in cleaned_data:
-                raise self.Error('Field "{}" is missing'.format(req_field))
+    def _iter_validate_many(self, method_name, items):
+        '''
+        Validates every item from the iterable with the same validation plan
+        :returns: generator of (index, validated data, error message) tuples,
+        either validated data or error message is None
+        :rtype: generator
+        '''
+        validate = self._validate
+        error_class = self.Error
+        for index, item in enumerate(items):
+            if not isinstance(item, collections_abc.Mapping):
+                yield index, None, 'Data should be key -> value structure'
+                continue
+            try:
+                yield index, validate(method_name, item), None
+            except error_class as e:
+                yield index, None, str(e)
 
-        return cleaned_data
+    def validate_many(self, method_name, items, stream=False):
+        '''
+        Validates a batch of payload items. Unlike `validate` failed items
+        don't stop the validation, errors are collected with indices of the
+        items
+        :param method_name: name of the method
+        :type method_name: str
+        :param items: payload items to be validated
+        :type items: iterable
+        :param stream: return generator of (index, validated data, error
+        message) tuples instead of building a list, so items are validated
+        one by one while consumed
+        :type stream: bool
+        :raises restea.fields.FieldSet.BatchError: validation of some of the
+        items failed
+        :raises restea.fields.FieldSet.ConfigurationError: badformed field
+        :returns: validated items or generator of validation results
+        :rtype: list, generator
+        '''
+        results = self._iter_validate_many(method_name, items)
+        if stream:
+            return results
+
+        cleaned_items = []
+        errors = []
+        for index, cleaned_data, error in results:
+            if error is None:
+                cleaned_items.append(cleaned_data)
+            else:
+                errors.append((index, error))
+
+        if errors:
+            raise self.BatchError(
+                '{} of {} items failed validation'.format(
+                    len(errors), len(errors) + len(cleaned_items)
+                ),
+                errors
+            )
+        return cleaned_items
 
 
 class Field(object):
@@ -101,6 +193,7 @@ class Field(object):
         self.null = settings.pop('null', False)
         self._name = None
         self._settings = settings
+        self._setting_validators = None
 
     def set_name(self, name):
         '''
@@ -138,6 +231,22 @@ class Field(object):
             )
         return getattr(self, validator_method_name)
 
+    def _get_setting_validators(self):
+        '''
+        Resolves validators for all the field settings. Validators are looked
+        up only once, on the first validation
+        :raises restea.fields.FieldSet.ConfigurationError: validator method
+        is not found for a current class
+        :returns: pairs of setting validator and setting value
+        :rtype: tuple
+        '''
+        if self._setting_validators is None:
+            self._setting_validators = tuple(
+                (self._get_setting_validator(setting_name), setting)
+                for setting_name, setting in self._settings.items()
+            )
+        return self._setting_validators
+
     def validate(self, field_value):
         '''
         Validates as field including settings validation
@@ -151,8 +260,7 @@ class Field(object):
 
         res = self._validate_field(field_value)
 
-        for setting_name, setting in self._settings.items():
-            validator_method = self._get_setting_validator(setting_name)
+        for validator_method, setting in self._get_setting_validators():
             res = validator_method(setting, res)
 
         return res
@@ -4,6 +4,29 @@ import time
 
 import six
 
+import restea.columnar as columnar
+import restea.fields as fields
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 _formatter_registry = {}
 
@@ -17,7 +40,8 @@ class LoadError(Exception):
 class FormatterRegistry(type):
     '''
     Registry metaclass. Registers all `restea.formats.BaseFormat` subclasses
-    in _formatter_registry
+    in _formatter_registry. Formatters depending on libraries which are not
+    installed (`available` is False) are not registered
     '''
     def __init__(cls, name, bases, dict):
         '''
@@ -29,7 +53,7 @@ class FormatterRegistry(type):
         :type name: dict
         '''
         super(FormatterRegistry, cls).__init__(name, bases, dict)
-        if name != 'BaseFormatter':
+        if name != 'BaseFormatter' and cls.available:
             _formatter_registry[cls.name] = cls
 
 
@@ -38,13 +62,31 @@ class BaseFormatter(six.with_metaclass(FormatterRegistry)):
     BaseFormatter is base class for different serialization formats
     '''
 
+    #: False if the format depends on a library which is not installed
+    available = True
+
+    #: True if the format unserializes raw bytes or buffers (memoryview) of
+    # the payload, otherwise payload is decoded before passing it to
+    # `unserialize`
+    accepts_bytes = False
+
+    #: True if the format is column-oriented, `list` responses are passed to
+    # `serialize_columns` then
+    columnar = False
+
+    #: True if the format can be unserialized incrementally from chunks of
+    # the payload (see `iter_unserialize`) and serialized item by item. Bulk
+    # payloads are then parsed and validated item by item while bulk method
+    # consumes them, `list` responses are always streamed
+    incremental = False
+
     @classmethod
     def unserialize(cls, data):
         '''
         Unserializes incoming data (payload)
 
         :param data: raw data to be unserialized
-        :type data: str
+        :type data: str, bytes, memoryview
         :returns: respresentation of the data in Python data structure
         :rtype: dict
         '''
@@ -62,21 +104,237 @@ class BaseFormatter(six.with_metaclass(FormatterRegistry)):
         '''
         raise NotImplementedError
 
+    @classmethod
+    def is_list_payload(cls, data):
+        '''
+        Checks if payload is a list, used to choose bulk methods before the
+        payload is parsed. Formats should override it to check only the
+        beginning of the payload, by default the payload is unserialized
+
+        :param data: raw data
+        :type data: str, bytes, memoryview
+        :raises restea.formats.LoadError: data can't be unserialized
+        :rtype: bool
+        '''
+        return isinstance(cls.unserialize(data), list)
+
+    @classmethod
+    def iter_unserialize(cls, chunks):
+        '''
+        Unserializes incomming data (payload) from a sequence of chunks item
+        by item. Should be implemented by incremental formats
+
+        :param chunks: chunks of raw data to be unserialized
+        :type chunks: iterator
+        :returns: unserialized items
+        :rtype: generator
+        '''
+        raise NotImplementedError
+
+    @classmethod
+    def iter_serialize(cls, data):
+        '''
+        Serializes outgoing data as a sequence of chunks. Formats which can
+        encode a list item by item should override it, by default data is
+        serialized at once. Generators are turned into a list first, since
+        `serialize` expects lists
+
+        :param data: Python data structure to be serialized
+        :type data: list, generator
+        :returns: serialized representation of the data split into chunks
+        :rtype: generator
+        '''
+        if not isinstance(data, (list, tuple, dict, six.string_types)):
+            data = list(data)
+        yield cls.serialize(data)
+
+    @classmethod
+    def serialize_columns(cls, columns, fields=None):
+        '''
+        Serializes column-oriented response. Columnar formats should
+        override it, by default columns are serialized as a dict with names
+        of the columns and lists of values
+
+        :param columns: columns to be serialized
+        :type columns: :class: `restea.columnar.Columns`
+        :param fields: fields of the resource, columnar formats may use them
+        to find out types of the columns
+        :type fields: :class: `restea.fields.FieldSet`
+        :returns: serialized representation of the columns
+        :rtype: str, bytes
+        '''
+        return cls.serialize(columns.to_dict())
+
+
+def datetime_to_timestamp(obj):
+    '''
+    Converts datetime object to the timestamp used in serialized data
+
+    :param obj: datetime to be converted
+    :type obj: datetime.datetime
+    :returns: seconds since epoch
+    :rtype: int
+    '''
+    return int(time.mktime(obj.timetuple()))
+
+
+def _as_bytes(data):
+    '''
+    Converts buffers which can't be parsed directly by JSON libraries to
+    bytes, other values are returned as is
+    '''
+    if isinstance(data, memoryview):
+        return data.tobytes()
+    return data
+
+
+def _first_char(data):
+    '''
+    Returns the first non-whitespace character of the data without copying
+    the data, None if there is no such character
+    '''
+    for index in six.moves.range(len(data)):
+        char = data[index:index + 1]
+        if isinstance(char, memoryview):
+            char = char.tobytes()
+        if not char.isspace():
+            return char
+    return None
+
+
+def _encode_default(obj):
+    '''
+    Fallback encoder for JSON backends, encodes datetime the same way as
+    `restea.formats.DateTimeEncoder`
+    '''
+    if isinstance(obj, datetime.datetime):
+        return datetime_to_timestamp(obj)
+    raise TypeError(
+        'Object of type {} is not JSON serializable'.format(
+            type(obj).__name__
+        )
+    )
+
 
 class DateTimeEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, datetime.datetime):
-            encoded = int(time.mktime(obj.timetuple()))
+            encoded = datetime_to_timestamp(obj)
         else:
             encoded = json.JSONEncoder.default(self, obj)
 
         return encoded
 
 
+class StdlibJsonBackend(object):
+    '''
+    JSON backend based on stdlib json module. Used as a fallback when no
+    accelerated JSON library is installed
+    '''
+    name = 'json'
+    available = True
+
+    @staticmethod
+    def loads(data):
+        return json.loads(_as_bytes(data))
+
+    @staticmethod
+    def dumps(data):
+        return json.dumps(data, cls=DateTimeEncoder)
+
+
+class OrjsonBackend(object):
+    '''
+    JSON backend based on orjson. Datetime objects are passed through to
+    the fallback encoder, since native orjson encoding produces RFC 3339
+    strings instead of timestamps
+    '''
+    name = 'orjson'
+    available = orjson is not None
+
+    @staticmethod
+    def loads(data):
+        return orjson.loads(data)
+
+    @staticmethod
+    def dumps(data):
+        try:
+            return orjson.dumps(
+                data,
+                default=_encode_default,
+                option=(
+                    orjson.OPT_PASSTHROUGH_DATETIME |
+                    orjson.OPT_NON_STR_KEYS
+                )
+            ).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # orjson doesn't support some values stdlib json does, i.e.
+            # integers wider than 64 bit
+            return StdlibJsonBackend.dumps(data)
+
+
+def _ujson_supports_default():
+    '''
+    Checks if installed ujson accepts fallback encoder, ujson older than 5.0
+    doesn't support `default` argument of `dumps`
+    '''
+    if ujson is None:
+        return False
+    try:
+        ujson.dumps(
+            None, default=_encode_default, escape_forward_slashes=False
+        )
+    except TypeError:
+        return False
+    return True
+
+
+class UjsonBackend(object):
+    '''
+    JSON backend based on ujson, available only if ujson supports fallback
+    encoder
+    '''
+    name = 'ujson'
+    available = _ujson_supports_default()
+
+    @staticmethod
+    def loads(data):
+        return ujson.loads(_as_bytes(data))
+
+    @staticmethod
+    def dumps(data):
+        return ujson.dumps(
+            data, default=_encode_default, escape_forward_slashes=False
+        )
+
+
+#: JSON backends in order of preference
+JSON_BACKENDS = (OrjsonBackend, UjsonBackend, StdlibJsonBackend)
+
+
+def get_json_backend(backends=JSON_BACKENDS):
+    '''
+    Returns the first JSON backend which is available
+    :param backends: JSON backends in order of preference
+    :type backends: tuple
+    :returns: JSON backend class
+    :rtype: :class: `restea.formats.StdlibJsonBackend` or alike
+    '''
+    for backend in backends:
+        if backend.available:
+            return backend
+    return StdlibJsonBackend
+
+
 class JsonFormat(BaseFormatter):
 
     name = 'json'
     content_type = 'application/json'
+    accepts_bytes = True
+
+    #: backend providing loads and dumps, the fastest installed one by
+    # default. Can be replaced, i.e. with `restea.formats.StdlibJsonBackend`
+    backend = get_json_backend()
 
     @classmethod
     def unserialize(cls, data):
@@ -84,15 +342,27 @@ class JsonFormat(BaseFormatter):
         Unserializes incomming data (payload)
 
         :param data: raw data to be unserialized
-        :type data: str
+        :type data: str, bytes, memoryview
         :returns: representation of the data in Python data structure
         :rtype: dict
         '''
         try:
-            return json.loads(data)
+            return cls.backend.loads(data)
         except ValueError:
             raise LoadError
 
+    @classmethod
+    def is_list_payload(cls, data):
+        '''
+        Checks if payload is a JSON array by its first non-whitespace
+        character, the payload isn't parsed
+
+        :param data: raw data
+        :type data: str, bytes, memoryview
+        :rtype: bool
+        '''
+        return _first_char(data) in (b'[', u'[')
+
     @classmethod
     def serialize(cls, data):
         '''
@@ -104,10 +374,314 @@ class JsonFormat(BaseFormatter):
         :rtype: str
         '''
         try:
-            return json.dumps(data, cls=DateTimeEncoder)
+            return cls.backend.dumps(data)
         except ValueError:
             raise LoadError
 
+    @classmethod
+    def iter_serialize(cls, data):
+        '''
+        Serializes outgoing list item by item, so the whole serialized list
+        never has to be kept in memory
+
+        :param data: Python data structure to be serialized
+        :type data: list, generator
+        :returns: serialized representation of the data split into chunks
+        :rtype: generator
+        '''
+        if isinstance(data, (dict, six.string_types)):
+            yield cls.serialize(data)
+            return
+
+        separator = '['
+        for item in data:
+            yield separator + cls.serialize(item)
+            separator = ','
+
+        yield '[]' if separator == '[' else ']'
+
+
+class NdjsonFormat(JsonFormat):
+    '''
+    Newline delimited JSON (JSON Lines) format, every item of a list is a
+    JSON document on its own line. Payloads are parsed line by line while
+    request body is read, so big bulk payloads never have to be loaded into
+    memory at once
+    '''
+
+    name = 'ndjson'
+    content_type = 'application/x-ndjson'
+    incremental = True
+
+    @classmethod
+    def _loads_lines(cls, lines):
+        '''
+        Unserializes non-empty lines one by one
+        '''
+        for line in lines:
+            if line.strip():
+                try:
+                    yield cls.backend.loads(line)
+                except ValueError:
+                    raise LoadError
+
+    @classmethod
+    def unserialize(cls, data):
+        '''
+        Unserializes incomming data (payload)
+
+        :param data: raw data to be unserialized
+        :type data: str, bytes, memoryview
+        :returns: items of the payload
+        :rtype: list
+        '''
+        data = _as_bytes(data)
+        if isinstance(data, six.text_type):
+            data = data.encode('utf-8')
+        return list(cls._loads_lines(data.split(b'\n')))
+
+    @classmethod
+    def is_list_payload(cls, data):
+        '''
+        Payload is always a list of items
+
+        :rtype: bool
+        '''
+        return True
+
+    @classmethod
+    def iter_unserialize(cls, chunks):
+        '''
+        Unserializes incomming data (payload) from a sequence of chunks line
+        by line, only the last incomplete line is kept between chunks
+
+        :param chunks: chunks of raw data to be unserialized
+        :type chunks: iterator of bytes
+        :returns: items of the payload
+        :rtype: generator
+        '''
+        rest = b''
+        for chunk in chunks:
+            lines = (rest + chunk).split(b'\n')
+            rest = lines.pop()
+            for item in cls._loads_lines(lines):
+                yield item
+
+        for item in cls._loads_lines([rest]):
+            yield item
+
+    @classmethod
+    def serialize(cls, data):
+        '''
+        Serializes outgoing data, dict is serialized as a single line
+
+        :param data: Python data structure to be serialized
+        :type data: dict, list
+        :returns: serialized representation of the data
+        :rtype: str
+        '''
+        return ''.join(cls.iter_serialize(data))
+
+    @classmethod
+    def iter_serialize(cls, data):
+        '''
+        Serializes outgoing list line by line
+
+        :param data: Python data structure to be serialized
+        :type data: list, generator, dict
+        :returns: serialized lines
+        :rtype: generator
+        '''
+        if isinstance(data, dict):
+            data = [data]
+
+        dumps = cls.backend.dumps
+        for item in data:
+            try:
+                yield dumps(item) + '\n'
+            except ValueError:
+                raise LoadError
+
+
+class MsgPackFormat(BaseFormatter):
+    '''
+    MessagePack format, available only if msgpack is installed
+    '''
+
+    name = 'msgpack'
+    content_type = 'application/x-msgpack'
+    available = msgpack is not None
+    accepts_bytes = True
+
+    @classmethod
+    def unserialize(cls, data):
+        '''
+        Unserializes incomming data (payload)
+
+        :param data: raw data to be unserialized
+        :type data: bytes, memoryview
+        :returns: representation of the data in Python data structure
+        :rtype: dict
+        '''
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except (ValueError, msgpack.UnpackException):
+            raise LoadError
+
+    @classmethod
+    def is_list_payload(cls, data):
+        '''
+        Checks if payload is a MessagePack array by its first byte, the
+        payload isn't parsed
+
+        :param data: raw data
+        :type data: bytes, memoryview
+        :rtype: bool
+        '''
+        first = bytearray(data[:1])
+        return bool(first) and (
+            0x90 <= first[0] <= 0x9f or first[0] in (0xdc, 0xdd)
+        )
+
+    @classmethod
+    def serialize(cls, data):
+        '''
+        Serializes outgoing data, datetime objects are encoded the same way
+        as with `restea.formats.DateTimeEncoder`
+
+        :param data: Python data structure to be serialized
+        :type data: dict, list, str
+        :returns: serialized representation of the data
+        :rtype: bytes
+        '''
+        try:
+            return msgpack.packb(
+                data, default=_encode_default, use_bin_type=True
+            )
+        except (ValueError, OverflowError):
+            raise LoadError
+
+
+class ArrowFormat(BaseFormatter):
+    '''
+    Apache Arrow IPC stream format, available only if pyarrow is installed.
+    `list` responses are written column by column as a record batch, so
+    clients can read them without copying, i.e. from a memory map. Types of
+    the columns are taken from resource fields, columns without fields are
+    inferred from the values
+    '''
+
+    name = 'arrow'
+    content_type = 'application/vnd.apache.arrow.stream'
+    available = pyarrow is not None
+    accepts_bytes = True
+    columnar = True
+
+    @classmethod
+    def get_type(cls, field):
+        '''
+        Returns Arrow type of the field
+
+        :param field: field of the column
+        :type field: :class: `restea.fields.Field`
+        :returns: Arrow type or None if type should be inferred
+        :rtype: :class: `pyarrow.DataType`, NoneType
+        '''
+        if isinstance(field, fields.CommaSeparatedListField):
+            # items are typed by the function they are parsed with
+            item_types = {
+                int: pyarrow.int64(),
+                float: pyarrow.float64(),
+                str: pyarrow.string(),
+                six.text_type: pyarrow.string(),
+            }
+            item_type = item_types.get(field.cast_func)
+            if item_type is None:
+                return None
+            return pyarrow.list_(item_type)
+        if isinstance(field, fields.Integer):
+            return pyarrow.int64()
+        if isinstance(field, fields.String):
+            return pyarrow.string()
+        if isinstance(field, fields.Boolean):
+            return pyarrow.bool_()
+        if isinstance(field, fields.DateTime):
+            return pyarrow.timestamp('ms')
+        return None
+
+    @classmethod
+    def is_list_payload(cls, data):
+        '''
+        Payload is always a list of rows
+
+        :rtype: bool
+        '''
+        return True
+
+    @classmethod
+    def unserialize(cls, data):
+        '''
+        Unserializes incomming data (payload)
+
+        :param data: raw data to be unserialized
+        :type data: bytes, memoryview
+        :returns: rows of the stream
+        :rtype: list
+        '''
+        try:
+            reader = pyarrow.ipc.open_stream(pyarrow.py_buffer(data))
+            return reader.read_all().to_pylist()
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+            raise LoadError
+
+    @classmethod
+    def serialize(cls, data):
+        '''
+        Serializes outgoing data, a dict is written as a single row
+
+        :param data: Python data structure to be serialized
+        :type data: dict, list
+        :returns: serialized representation of the data
+        :rtype: bytes
+        '''
+        if isinstance(data, dict):
+            data = [data]
+        try:
+            data = columnar.Columns.from_rows(data)
+        except (AttributeError, TypeError):
+            raise LoadError
+        return cls.serialize_columns(data)
+
+    @classmethod
+    def serialize_columns(cls, columns, fields=None):
+        '''
+        Serializes columns as IPC stream with a single record batch
+
+        :param columns: columns to be serialized
+        :type columns: :class: `restea.columnar.Columns`
+        :param fields: fields of the resource used to find out types of the
+        columns
+        :type fields: :class: `restea.fields.FieldSet`
+        :returns: serialized representation of the columns
+        :rtype: bytes
+        '''
+        field_map = fields.fields if fields is not None else {}
+        arrays = []
+        try:
+            for name in columns.columns:
+                arrays.append(pyarrow.array(
+                    columns.data[name], type=cls.get_type(field_map.get(name))
+                ))
+            batch = pyarrow.RecordBatch.from_arrays(
+                arrays, names=columns.columns
+            )
+            sink = pyarrow.BufferOutputStream()
+            with pyarrow.ipc.new_stream(sink, batch.schema) as writer:
+                writer.write_batch(batch)
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, OverflowError):
+            raise LoadError
+        return sink.getvalue().to_pybytes()
+
 
 def get_formatter(format_name):
     '''
@@ -0,0 +1,172 @@
+import bisect
+import collections
+import threading
+import time
+
+
+#: monotonic clock used to measure phases
+clock = getattr(time, 'perf_counter', time.time)
+
+#: phases of request processing, in order they're run:
+# resolve -- finding resource method, projection and page
+# prepare -- `Resource.prepare`
+# decorators -- resource decorators, response cache and conditional GET
+# parse -- unserialization of the payload
+# validate -- validation of the payload
+# method -- resource method itself
+# handle -- bulk response, pagination and projection
+# finish -- `Resource.finish`
+# serialize -- serialization of response or error
+# compress -- compression of response
+PHASES = (
+    'resolve', 'prepare', 'decorators', 'parse', 'validate', 'method',
+    'handle', 'finish', 'serialize', 'compress',
+)
+
+#: timings of the request passed to observers. Phases are exclusive, i.e.
+# time of payload validated inside the method isn't counted in `method`.
+# Sizes are None if they're unknown: payload wasn't read or response is
+# streamed
+Measurement = collections.namedtuple(
+    'Measurement',
+    'resource_name method_name status total phases request_size '
+    'response_size'
+)
+
+
+def format_server_timing(phases, total):
+    '''
+    Formats `Server-Timing` header value, durations are in milliseconds
+
+    :param phases: dict -- durations of the phases in seconds
+    :param total: float -- duration of the whole request in seconds
+    :returns: string -- header value
+    '''
+    metrics = [
+        '{};dur={:.3f}'.format(phase, duration * 1000)
+        for phase, duration in phases.items()
+    ]
+    metrics.append('total;dur={:.3f}'.format(total * 1000))
+    return ', '.join(metrics)
+
+
+class BaseObserver(object):
+    '''
+    BaseObserver is base class for observers of the requests. Observers are
+    set in `Resource.observers` and are notified after every request
+    '''
+    def observe(self, measurement):
+        '''
+        Receives timings of the request
+
+        :param measurement: :class: `restea.instrumentation.Measurement` --
+        timings and sizes of the request
+        '''
+        raise NotImplementedError
+
+
+class Histogram(object):
+    '''
+    Histogram of values with fixed buckets
+    '''
+    def __init__(self, buckets):
+        '''
+        :param buckets: tuple -- sorted upper bounds of the buckets
+        '''
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def add(self, value):
+        '''
+        Adds value to the histogram
+
+        :param value: int, float -- observed value
+        '''
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def export(self):
+        '''
+        Exports histogram with cumulative counts of values less or equal to
+        the bucket bound, the last bound is '+Inf'
+
+        :returns: dict -- count, sum and buckets of the histogram
+        '''
+        buckets = []
+        total = 0
+        bounds = list(self.buckets) + ['+Inf']
+        for bound, count in zip(bounds, self.counts):
+            total += count
+            buckets.append([bound, total])
+        return {'count': self.count, 'sum': self.sum, 'buckets': buckets}
+
+
+class HistogramObserver(BaseObserver):
+    '''
+    Observer aggregating timings and sizes into histograms per resource,
+    method and phase in process. Histograms can be exported, i.e. to be
+    served by a metrics endpoint
+    '''
+    #: upper bounds of timing buckets in seconds
+    time_buckets = (
+        0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+        0.1, 0.25, 0.5, 1, 2.5, 5, 10,
+    )
+
+    #: upper bounds of size buckets in bytes
+    size_buckets = (
+        128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304,
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+
+    def _get_histogram(self, key, buckets):
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(buckets)
+        return histogram
+
+    def observe(self, measurement):
+        key = (measurement.resource_name, measurement.method_name)
+        with self._lock:
+            self._get_histogram(key + ('total',), self.time_buckets).add(
+                measurement.total
+            )
+            for phase, duration in measurement.phases.items():
+                self._get_histogram(key + (phase,), self.time_buckets).add(
+                    duration
+                )
+            for name in ('request_size', 'response_size'):
+                size = getattr(measurement, name)
+                if size is not None:
+                    self._get_histogram(key + (name,), self.size_buckets).add(
+                        size
+                    )
+
+    def export(self):
+        '''
+        Exports all the histograms
+
+        :returns: dict -- histograms by resource name, method name and
+        metric, which is either a phase, `total` or one of the sizes
+        '''
+        result = {}
+        with self._lock:
+            for key, histogram in self._histograms.items():
+                resource_name, method_name, metric = key
+                methods = result.setdefault(resource_name, {})
+                methods.setdefault(method_name, {})[metric] = \
+                    histogram.export()
+        return result
+
+    def reset(self):
+        '''
+        Drops all the collected histograms
+        '''
+        with self._lock:
+            self._histograms = {}
@@ -0,0 +1,159 @@
+import base64
+import collections
+import itertools
+import json
+
+from six.moves.urllib.parse import urlencode
+
+import restea.columnar as columnar
+import restea.errors as errors
+import restea.fields as fields
+
+
+#: page requested by client: key values of the last item of previous page
+# (None for the first page) and maximum number of items
+Page = collections.namedtuple('Page', 'after limit')
+
+
+def encode_cursor(values):
+    '''
+    Encodes key values into opaque cursor
+
+    :param values: list, tuple -- JSON serializable key values
+    :returns: string -- url safe cursor
+    '''
+    data = json.dumps(list(values), separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(data).rstrip(b'=').decode('ascii')
+
+
+def decode_cursor(cursor):
+    '''
+    Decodes key values from the cursor made by `encode_cursor`
+
+    :param cursor: string -- url safe cursor
+    :raises ValueError: cursor is malformed
+    :returns: tuple -- key values
+    '''
+    data = cursor.encode('ascii')
+    data += b'=' * (-len(data) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(data).decode('utf-8'))
+    except (TypeError, ValueError):
+        raise ValueError('Malformed cursor')
+
+    if not isinstance(values, list):
+        raise ValueError('Malformed cursor')
+    return tuple(values)
+
+
+class KeysetPaginator(object):
+    '''
+    KeysetPaginator implements cursor pagination for `list` method of
+    resources. Cursor holds key values of the last item of the previous page,
+    so resource fetches the next page with a query like
+    `WHERE (key) > page.after ORDER BY key LIMIT page.limit + 1` and deep
+    pages cost the same as the first one. Resource method should return one
+    item more than `page.limit`, it's used to find out if there is a next page
+    '''
+    #: name of response header with the cursor of the next page
+    next_cursor_header = 'X-Next-Cursor'
+
+    def __init__(
+        self, key=('id',), default_limit=20, max_limit=100,
+        cursor_param='cursor', limit_param='limit'
+    ):
+        '''
+        :param key: tuple -- names of item keys pages are ordered by, key
+        values should be unique and JSON serializable
+        :param default_limit: int -- number of items if it's not requested
+        :param max_limit: int -- maximum number of items client can request
+        :param cursor_param: string -- name of GET param with cursor
+        :param limit_param: string -- name of GET param with page size
+        '''
+        self.key = tuple(key)
+        self.default_limit = default_limit
+        self.cursor_param = cursor_param
+        self.limit_param = limit_param
+        self.fields = fields.FieldSet(**{
+            cursor_param: fields.String(max_length=1024),
+            limit_param: fields.Integer(range=(1, max_limit)),
+        })
+
+    def get_page(self, request):
+        '''
+        Returns page requested by client
+
+        :param request: :class: `restea.adapters.base.BaseRequestWrapper` --
+        request wrapper object
+        :raises restea.errors.BadRequestError: cursor or page size is invalid
+        :returns: :class: `restea.pagination.Page` -- requested page
+        '''
+        params = {}
+        for name in (self.cursor_param, self.limit_param):
+            value = request.get(name)
+            if value is not None:
+                params[name] = value
+
+        try:
+            params = self.fields.validate('list', params)
+        except fields.FieldSet.Error as e:
+            raise errors.BadRequestError(str(e))
+
+        after = None
+        cursor = params.get(self.cursor_param)
+        if cursor:
+            try:
+                after = decode_cursor(cursor)
+            except ValueError:
+                raise errors.BadRequestError('Invalid cursor')
+            if len(after) != len(self.key):
+                raise errors.BadRequestError('Invalid cursor')
+
+        return Page(after, params.get(self.limit_param, self.default_limit))
+
+    def get_key(self, item):
+        '''
+        Returns key values of the item
+
+        :param item: dict -- item returned by resource
+        :returns: tuple -- key values
+        '''
+        return tuple(item[name] for name in self.key)
+
+    def get_link(self, cursor, page):
+        '''
+        Returns value of `Link` header pointing to the next page. Link is
+        relative to the current url, override to keep other GET params
+
+        :param cursor: string -- cursor of the next page
+        :param page: :class: `restea.pagination.Page` -- current page
+        :returns: string -- `Link` header value
+        '''
+        query = urlencode([
+            (self.cursor_param, cursor), (self.limit_param, page.limit)
+        ])
+        return '<?{}>; rel="next"'.format(query)
+
+    def paginate(self, items, page):
+        '''
+        Cuts items of the page and makes cursor of the next page
+
+        :param items: list, generator, :class: `restea.columnar.Columns` --
+        items returned by resource, at most `page.limit + 1` items are
+        consumed
+        :param page: :class: `restea.pagination.Page` -- current page
+        :returns: tuple -- items of the page and cursor of the next page or
+        None if it's the last page
+        '''
+        if isinstance(items, columnar.Columns):
+            if len(items) <= page.limit:
+                return items, None
+            items = items.slice(0, page.limit)
+            return items, encode_cursor(self.get_key(items.row(-1)))
+
+        items = list(itertools.islice(items, page.limit + 1))
+        if len(items) <= page.limit:
+            return items, None
+
+        items = items[:page.limit]
+        return items, encode_cursor(self.get_key(items[-1]))
@@ -0,0 +1,203 @@
+from __future__ import division
+
+import math
+import threading
+import time
+
+import restea.cache as cache
+import restea.errors as errors
+
+
+class BaseLimiter(object):
+    '''
+    BaseLimiter is base class for rate limiters. State of the limiter is kept
+    in a cache backend (see `restea.cache.BaseCacheBackend`), in-process by
+    default. With a shared backend, i.e. `restea.cache.ClientCacheBackend`,
+    limits are shared between processes, but updates of the state aren't
+    atomic between them, so limits are approximate
+    '''
+    def __init__(self, backend=None, clock=time.time):
+        '''
+        :param backend: :class: `restea.cache.BaseCacheBackend` -- storage of
+        the limiter state
+        :param clock: function -- returns current time in seconds
+        '''
+        if backend is None:
+            backend = cache.LocalCacheBackend(max_size=10000, clock=clock)
+        self.backend = backend
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def acquire(self, key):
+        '''
+        Takes a request from the limit of the key
+
+        :param key: string -- key requests are limited by
+        :returns: float -- 0 if request is allowed, otherwise seconds after
+        which the request would be allowed
+        '''
+        with self._lock:
+            return self._acquire(key, self._clock())
+
+    def _acquire(self, key, now):
+        raise NotImplementedError
+
+
+class TokenBucketLimiter(BaseLimiter):
+    '''
+    Token bucket limiter. Bucket holds up to `burst` tokens and is refilled
+    with `rate` tokens per second, every request takes a token
+    '''
+    def __init__(self, rate, burst=None, **kwargs):
+        '''
+        :param rate: float -- tokens added per second
+        :param burst: int -- size of the bucket, `rate` by default
+        '''
+        super(TokenBucketLimiter, self).__init__(**kwargs)
+        self.rate = float(rate)
+        self.burst = burst or max(1, int(rate))
+        self._ttl = int(math.ceil(self.burst / self.rate)) + 1
+
+    def _acquire(self, key, now):
+        state = self.backend.get(key)
+        if state is None:
+            tokens = self.burst
+        else:
+            tokens, updated_at = state
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate)
+
+        if tokens < 1:
+            return (1 - tokens) / self.rate
+
+        self.backend.set(key, (tokens - 1, now), self._ttl)
+        return 0
+
+
+class SlidingWindowLimiter(BaseLimiter):
+    '''
+    Sliding window limiter allowing `limit` requests per `window` seconds.
+    Number of requests in the window is estimated from the counters of the
+    current and the previous fixed windows, so only two numbers are kept per
+    key
+    '''
+    def __init__(self, limit, window, **kwargs):
+        '''
+        :param limit: int -- number of requests allowed per window
+        :param window: int -- window length in seconds
+        '''
+        super(SlidingWindowLimiter, self).__init__(**kwargs)
+        self.limit = limit
+        self.window = window
+
+    def _acquire(self, key, now):
+        current = int(now // self.window)
+        previous_count, count = 0, 0
+
+        state = self.backend.get(key)
+        if state is not None:
+            window, stored_previous_count, stored_count = state
+            if window == current:
+                previous_count, count = stored_previous_count, stored_count
+            elif window == current - 1:
+                previous_count = stored_count
+
+        elapsed = now - current * self.window
+        remaining = self.window - elapsed
+        estimated = previous_count * remaining / self.window + count
+
+        if estimated + 1 > self.limit:
+            if previous_count and count + 1 <= self.limit:
+                # wait until the previous window slides out enough
+                free = self.limit - 1 - count
+                return remaining - free * self.window / previous_count
+            return remaining
+
+        self.backend.set(
+            key, (current, previous_count, count + 1), 2 * self.window
+        )
+        return 0
+
+
+class RateLimit(object):
+    '''
+    Resource decorator limiting requests of every client to resource methods,
+    to be added to `Resource.decorators`. Requests over the limit get 429
+    response with `Retry-After` header. Every resource method has its own
+    limits, i.e. `list` and `show` don't share the budget. Clients which
+    can't be identified, i.e. requests over a unix socket without address,
+    share a single limit
+    '''
+    def __init__(
+        self, limiter, methods=None, client_header=None, prefix='ratelimit',
+        key_func=None, fallback_key='unidentified'
+    ):
+        '''
+        :param limiter: :class: `restea.ratelimit.BaseLimiter` -- limiter
+        :param methods: tuple -- names of limited resource methods, all the
+        methods are limited if None
+        :param client_header: string -- request header identifying the
+        client, i.e. X-Api-Key. Clients are identified by their address if
+        None
+        :param prefix: string -- prefix of limiter keys, should be unique if
+        backend is shared between limiters
+        :param key_func: function -- takes request wrapper and returns
+        identity of the client, used instead of `client_header` and address
+        if given
+        :param fallback_key: string -- identity shared by clients which
+        can't be identified, requests of such clients aren't limited if None
+        '''
+        self.limiter = limiter
+        self.methods = methods
+        self.client_header = client_header
+        self.prefix = prefix
+        self.key_func = key_func
+        self.fallback_key = fallback_key
+
+    def get_client_key(self, request):
+        '''
+        Returns identity of the client sent the request
+
+        :param request: :class: `restea.adapters.base.BaseRequestWrapper` --
+        request wrapper object
+        :returns: string -- client identity, `fallback_key` if the client
+        can't be identified
+        '''
+        if self.key_func is not None:
+            client_key = self.key_func(request)
+        elif self.client_header is None:
+            client_key = request.remote_addr
+        else:
+            client_key = request.get_header(self.client_header)
+        return client_key or self.fallback_key
+
+    def check(self, resource):
+        '''
+        Takes the request from the limit of the client
+
+        :param resource: :class: `restea.resource.Resource` -- resource
+        object
+        :raises restea.errors.TooManyRequestsError: limit is exceeded
+        '''
+        method_name = resource._method_name
+        if self.methods is not None and method_name not in self.methods:
+            return
+
+        client_key = self.get_client_key(resource.request)
+        if client_key is None:
+            return
+
+        key = '{}:{}:{}:{}'.format(
+            self.prefix, resource._get_cache_name(), method_name, client_key
+        )
+        retry_after = self.limiter.acquire(key)
+        if retry_after:
+            resource.set_header(
+                'Retry-After', max(1, int(math.ceil(retry_after)))
+            )
+            raise errors.TooManyRequestsError.constant('Too many requests')
+
+    def __call__(self, func):
+        def wrapper(resource, *args, **kwargs):
+            self.check(resource)
+            return func(resource, *args, **kwargs)
+        return wrapper
@@ -1,10 +1,37 @@
 from __future__ import unicode_literals
 
+import calendar
 import collections
+import email.utils
+import hashlib
+import inspect
+import random
 
+import six
+from six.moves import collections_abc
+
+import restea.cache as cache
+import restea.columnar as columnar
 import restea.errors as errors
 import restea.formats as formats
 import restea.fields as fields
+import restea.instrumentation as instrumentation
+
+
+#: maximum number of serialized constant errors kept
+MAX_CONSTANT_ERRORS = 1024
+
+#: serialized constant errors by formatter, error class and message, see
+# `restea.errors.RestError.constant`
+_constant_error_contents = {}
+
+#: attributes of the resource dispatch table is built from, see
+# `Resource._get_dispatch_table`
+_DISPATCH_ATTRIBUTES = frozenset([
+    'method_map', 'bulk_method_map', 'decorators', 'cache', 'cache_methods',
+    'stream', 'conditional', 'conditional_methods', 'observers',
+    'server_timing',
+])
 
 
 class Resource(object):
@@ -21,6 +48,79 @@ class Resource(object):
         'delete': 'delete',
     }
 
+    #: maps HTTP methods to optional bulk class methods, used for requests
+    # without iden which have a list as a payload
+    bulk_method_map = {
+        'post': 'bulk_create',
+        'put': 'bulk_edit',
+        'delete': 'bulk_delete',
+    }
+
+    #: decorators applied to every resource method, i.e. authorization or
+    # `restea.ratelimit.RateLimit`. The first one is the outermost
+    decorators = ()
+
+    #: if True, `list` responses are serialized item by item and returned as
+    # an iterator of chunks, so adapters can stream them
+    stream = False
+
+    #: response cache, see `restea.cache.ResponseCache`. Responses of
+    # cache_methods are cached until any other method of the resource succeeds
+    cache = None
+
+    #: methods which serialized responses are cached
+    cache_methods = ('list', 'show')
+
+    #: seconds cached responses are kept
+    cache_ttl = 60
+
+    #: names of GET params responses depend on, used as a part of cache key
+    cache_params = ()
+
+    #: if True, conditional GET is supported for conditional_methods. Version
+    # of the data is taken from get_etag and get_last_modified before the
+    # method is called, otherwise ETag is computed over serialized response.
+    # Requests with matching If-None-Match or If-Modified-Since get 304
+    conditional = False
+
+    #: methods supporting conditional GET
+    conditional_methods = ('list', 'show')
+
+    #: name of GET param with comma separated list of fields client wants to
+    # get, i.e. ?fields=id,name. Requested fields are set to self.projection
+    # before the method is called, so method can fetch only them. Names out
+    # of self.fields are ignored if the resource has fields. Projection is
+    # disabled if None
+    projection_param = None
+
+    #: methods supporting projection
+    projection_methods = ('list', 'show')
+
+    #: paginator of `list` method, see `restea.pagination.KeysetPaginator`.
+    # Requested page is set to self.page before the method is called, cursor
+    # of the next page is returned in `Link` and next cursor headers
+    paginator = None
+
+    #: observers notified with timings of every dispatched request, see
+    # `restea.instrumentation.BaseObserver`. Timings aren't measured if
+    # there are no observers
+    observers = ()
+
+    #: share of requests, from 0 to 1, which responses get `Server-Timing`
+    # header with durations of request phases, see
+    # `restea.instrumentation.PHASES`. Disabled if 0
+    server_timing = 0
+
+    #: response compression, see `restea.compression.Compression`. Responses
+    # are sent uncompressed if None
+    compression = None
+
+    #: maximal size of request body in bytes, bigger requests get 413
+    # response. Adapters read body by chunks and stop as soon as the limit
+    # is exceeded, so oversized body is never loaded into memory. Not
+    # limited if None
+    max_body_size = None
+
     def __init__(self, request, formatter):
         '''
         :param request: request wrapper object
@@ -32,9 +132,28 @@ class Resource(object):
         if not hasattr(self, 'fields'):
             self.fields = fields.FieldSet()
 
+        if self.max_body_size is not None:
+            request.max_body_size = self.max_body_size
+
         self.request = request
         self.formatter = formatter
         self._response_headers = collections.OrderedDict()
+        self._cache_key = None
+        self._method_name = None
+        self._is_bulk = False
+        self._bulk_payload_error = None
+
+        #: frozen set of field names requested by client, None if all the
+        # fields are requested
+        self.projection = None
+
+        #: page requested by client, see `restea.pagination.Page`
+        self.page = None
+
+        self._timings = None
+        self._phase = None
+        self._phase_started = None
+        self._server_timing_sampled = False
 
     def _iden_required(self, method_name):
         '''
@@ -47,30 +166,103 @@ class Resource(object):
         '''
         return method_name not in ('list', 'create')
 
-    def _match_response_to_fields(self, dct):
+    def _match_response_to_fields(self, dct, field_names=None):
         '''
         Filters output from rest method to return only fields matching
         self.fields
         :param dct: dict to be filtered
         :type dct: dict
+        :param field_names: names of fields to keep, self.fields by default
+        :type field_names: frozenset, set, list
         :returns: filtered dict, with no values out of self.fields
         :rtype: dict
         '''
+        if field_names is None:
+            field_names = self.fields.field_names
         return {
-            k: v for k, v in dct.items()
-            if k in self.fields.field_names
+            name: dct[name] for name in field_names
+            if name in dct
         }
 
-    def _match_resource_list_to_fields(self, lst):
+    def _match_resource_list_to_fields(self, lst, field_names=None):
         '''
         Filters 'list' output from rest method to return only fields matching
         self.fields
         :param lst: list to be filtered
         :type lst: list, tuple, set
+        :param field_names: names of fields to keep, self.fields by default
+        :type field_names: frozenset, set, list
         :returns: filtered list, with no values out of self.fields
         :rtype: generator
         '''
-        return (self._match_response_to_fields(item) for item in lst)
+        return (
+            self._match_response_to_fields(item, field_names)
+            for item in lst
+        )
+
+    def _get_projection(self, method_name):
+        '''
+        Returns field names requested by client in projection_param. Unknown
+        names are dropped if the resource has fields, all the fields are
+        returned if no known field is requested
+
+        :param method_name: name of the method
+        :type method_name: str
+        :returns: requested field names or None if all the fields are
+        requested
+        :rtype: frozenset, NoneType
+        '''
+        if (
+            self.projection_param is None or
+            method_name not in self.projection_methods
+        ):
+            return None
+
+        value = self.request.get(self.projection_param)
+        if not value:
+            return None
+
+        names = frozenset(name.strip() for name in value.split(','))
+        if self.fields.field_names:
+            names &= self.fields.field_names
+        else:
+            names -= frozenset([''])
+        return names or None
+
+    def _paginate(self, response):
+        '''
+        Cuts items of the requested page and sets headers pointing to the
+        next page
+
+        :param response: items returned by `list` method
+        :returns: items of the page
+        :rtype: list
+        '''
+        items, cursor = self.paginator.paginate(response, self.page)
+        if cursor is not None:
+            self.set_header('Link', self.paginator.get_link(cursor, self.page))
+            self.set_header(self.paginator.next_cursor_header, cursor)
+        return items
+
+    def _apply_projection(self, response):
+        '''
+        Filters response data to return only fields from self.projection
+
+        :param response: data returned by resource method
+        :returns: filtered response data
+        '''
+        if isinstance(response, collections_abc.Mapping):
+            return self._match_response_to_fields(response, self.projection)
+
+        if isinstance(response, columnar.Columns):
+            return response.project(self.projection)
+
+        items = self._match_resource_list_to_fields(
+            response, self.projection
+        )
+        if self.stream:
+            return items
+        return list(items)
 
     def _apply_decorators(self, method):
         '''
@@ -88,26 +280,38 @@ class Resource(object):
 
         return method
 
-    def _get_method_name(self, has_iden):
+    def _get_http_method(self):
+        '''
+        Returns lowercased HTTP method taking method override header into
+        account
+
+        :returns: HTTP method name
+        :rtype: str
+        '''
+        method = self.request.method
+        method = self.request.get_header('X-HTTP-Method-Override', method)
+        return method.lower()
+
+    def _get_method_name(self, has_iden, http_method=None):
         '''
         Return resource object based on the HTTP method
 
         :param has_iden: specifies if requested url has iden (i.e /res/ vs
         /res/1)
         :type has_iden: bool
+        :param http_method: lowercased HTTP method, taken from request if not
+        given
+        :type http_method: str
         :raises errors.MethodNotAllowedError: if HTTP method is not supprted
         :returns: name of the resource method name
         :rtype: str
         '''
-        method = self.request.method
-        method = self.request.headers.get(
-            'HTTP_X_HTTP_METHOD_OVERRIDE',
-            method
-        )
-        method_name = self.method_map.get(method.lower())
+        if http_method is None:
+            http_method = self._get_http_method()
+        method_name = self.method_map.get(http_method)
 
         if not method_name:
-            raise errors.MethodNotAllowedError(
+            raise errors.MethodNotAllowedError.constant(
                 'Method "{}" is not supported'.format(self.request.method)
             )
 
@@ -115,17 +319,515 @@ class Resource(object):
             method_name = method_name[has_iden]
 
         if not has_iden and self._iden_required(method_name):
-            raise errors.BadRequestError(
+            raise errors.BadRequestError.constant(
                 'Given method requires iden'
             )
 
         if has_iden and not self._iden_required(method_name):
-            raise errors.BadRequestError(
+            raise errors.BadRequestError.constant(
                 'Given method shouldn\'t have iden'
             )
 
         return method_name
 
+    def _build_dispatch_table(self):
+        '''
+        Builds dispatch table for the resource class. Table maps HTTP method,
+        presence of iden and bulk flag to the resource method name, method
+        decorated with self.decorators and error raised for the combination
+
+        :returns: dispatch table
+        :rtype: dict
+        '''
+        cls = type(self)
+        table = {}
+        for http_method in self.method_map:
+            for has_iden in (False, True):
+                try:
+                    method_name = self._get_method_name(has_iden, http_method)
+                except errors.RestError as e:
+                    table[(http_method, has_iden, False)] = (
+                        None, None, (type(e), str(e))
+                    )
+                    continue
+
+                method = None
+                if hasattr(cls, method_name):
+                    method = self._get_cached_method(
+                        method_name,
+                        self._get_observed_method(getattr(cls, method_name))
+                    )
+                    method = self._get_conditional_method(method_name, method)
+                    method = self._apply_decorators(method)
+                table[(http_method, has_iden, False)] = (
+                    method_name, method, None
+                )
+
+        for http_method, method_name in self.bulk_method_map.items():
+            if hasattr(cls, method_name):
+                method = self._apply_decorators(
+                    self._get_observed_method(getattr(cls, method_name))
+                )
+                table[(http_method, False, True)] = (method_name, method, None)
+
+        return table
+
+    def _get_observed_method(self, method):
+        '''
+        Wraps a method to measure its own time apart from decorators, if
+        resource has observers or `Server-Timing` header enabled. Awaitable
+        returned by `async def` method is measured until it's awaited
+
+        :param method: resource method
+        :type method: function
+        :returns: wrapped method
+        :rtype: function
+        '''
+        if not self.observers and not self.server_timing:
+            return method
+
+        def observed_method(resource, *args, **kwargs):
+            response = resource._measure(
+                'method', method, resource, *args, **kwargs
+            )
+            if six.PY3 and inspect.isawaitable(response):
+                # restea.aio uses syntax which is not supported by Python 2
+                from restea.aio import measure_awaitable
+                return measure_awaitable(resource, 'method', response)
+            return response
+        return observed_method
+
+    def _start_phase(self, phase):
+        '''
+        Starts measuring time of the phase, outer phase is paused
+
+        :param phase: name of the phase, see `restea.instrumentation.PHASES`
+        :type phase: str
+        :returns: name of the outer phase
+        :rtype: str, NoneType
+        '''
+        outer_phase = self._phase
+        now = instrumentation.clock()
+        if outer_phase is not None:
+            self._timings[outer_phase] += now - self._phase_started
+        self._timings.setdefault(phase, 0)
+        self._phase, self._phase_started = phase, now
+        return outer_phase
+
+    def _stop_phase(self, phase, outer_phase):
+        '''
+        Stops measuring time of the phase, outer phase is resumed
+
+        :param phase: name of the phase
+        :type phase: str
+        :param outer_phase: name of the outer phase returned by
+        `_start_phase`
+        :type outer_phase: str, NoneType
+        '''
+        now = instrumentation.clock()
+        self._timings[phase] += now - self._phase_started
+        self._phase, self._phase_started = outer_phase, now
+
+    def _measure(self, phase, func, *args, **kwargs):
+        '''
+        Calls the function measuring its time as a phase of the request.
+        Phases are exclusive: time of the nested phase isn't counted in the
+        outer one. Function is just called if timings aren't measured
+
+        :param phase: name of the phase, see `restea.instrumentation.PHASES`
+        :type phase: str
+        :param func: function to be called
+        :type func: function
+        :returns: result of the function
+        '''
+        if self._timings is None:
+            return func(*args, **kwargs)
+
+        outer_phase = self._start_phase(phase)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._stop_phase(phase, outer_phase)
+
+    def _start_timings(self):
+        '''
+        Starts measuring timings of the request if resource has observers or
+        `Server-Timing` header is sampled for the request
+
+        :returns: whatever timings are measured
+        :rtype: bool
+        '''
+        self._server_timing_sampled = bool(
+            self.server_timing and random.random() < self.server_timing
+        )
+        if not self.observers and not self._server_timing_sampled:
+            return False
+
+        self._timings = collections.OrderedDict()
+        return True
+
+    def _finish_timings(self, response, total):
+        '''
+        Notifies observers and sets `Server-Timing` header if it's sampled
+
+        :param response: 4-element tuple returned by `dispatch`
+        :type response: tuple
+        :param total: time of the whole request in seconds
+        :type total: float
+        '''
+        if self.observers:
+            self._notify_observers(response, total)
+        if self._server_timing_sampled:
+            self.set_header(
+                'Server-Timing',
+                instrumentation.format_server_timing(self._timings, total)
+            )
+
+    def _notify_observers(self, response, total):
+        '''
+        Notifies observers with timings of the request
+
+        :param response: 4-element tuple returned by `dispatch`
+        :type response: tuple
+        :param total: time of the whole request in seconds
+        :type total: float
+        '''
+        request_size = None
+        if hasattr(self, '_payload_data'):
+            request_size = len(self._get_request_data() or '')
+
+        content = response[0]
+        response_size = None
+        if isinstance(content, (six.binary_type, six.text_type)):
+            response_size = len(content)
+
+        measurement = instrumentation.Measurement(
+            self._get_cache_name(), self._method_name, response[1], total,
+            self._timings, request_size, response_size
+        )
+        for observer in self.observers:
+            observer.observe(measurement)
+
+    @classmethod
+    def _get_cache_name(cls):
+        '''
+        Returns name of the resource used in cache keys
+        :returns: full name of the resource class
+        :rtype: str
+        '''
+        return '{}.{}'.format(cls.__module__, cls.__name__)
+
+    @classmethod
+    def invalidate_cache(cls):
+        '''
+        Invalidates all cached responses of the resource. Called
+        automatically once a method not in cache_methods succeeds
+        '''
+        if cls.cache is not None:
+            cls.cache.invalidate(cls._get_cache_name())
+
+    def _get_cache_key(self, method_name, args, kwargs):
+        '''
+        Returns cache key for the response of the current request
+        :param method_name: name of the method
+        :type method_name: str
+        :returns: cache key
+        :rtype: str
+        '''
+        return self.cache.get_key(
+            self._get_cache_name(),
+            method_name,
+            args,
+            sorted(kwargs.items()),
+            [self.request.get(name) for name in self.cache_params],
+            sorted(self.projection or ()),
+            self.page,
+            self.formatter.name,
+        )
+
+    def _get_cached_method(self, method_name, method):
+        '''
+        Wraps a method to return cached response if there is one. Wrapper is
+        applied before self.decorators, so decorators (i.e. authorization)
+        are still called for cached responses and get
+        :class: `restea.cache.CachedResponse` as a method result
+
+        :param method_name: name of the method
+        :type method_name: str
+        :param method: resource method
+        :type method: function
+        :returns: method returning cached responses
+        :rtype: function
+        '''
+        if self.cache is None or method_name not in self.cache_methods:
+            return method
+
+        if self.stream and method_name == 'list':
+            return method
+
+        @six.wraps(method)
+        def cached_method(resource, *args, **kwargs):
+            cache_key = resource._get_cache_key(method_name, args, kwargs)
+            cached = resource.cache.get(cache_key)
+            if cached is not None:
+                return cached
+            resource._cache_key = cache_key
+            return method(resource, *args, **kwargs)
+
+        return cached_method
+
+    def get_etag(self, method_name, *args, **kwargs):
+        '''
+        Returns version token of the data requested, used as ETag. Should be
+        cheap to get compared to the method itself, ETag is computed over
+        serialized response if None is returned
+
+        :param method_name: name of the method
+        :type method_name: str
+        :returns: version token or None
+        :rtype: str, NoneType
+        '''
+        return None
+
+    def get_last_modified(self, method_name, *args, **kwargs):
+        '''
+        Returns modification time of the data requested, used for
+        Last-Modified and If-Modified-Since. Naive datetime is treated as UTC
+
+        :param method_name: name of the method
+        :type method_name: str
+        :returns: modification time or None
+        :rtype: datetime.datetime, NoneType
+        '''
+        return None
+
+    def _is_etag_matched(self, etag):
+        '''
+        Checks if ETag matches If-None-Match request header
+        :param etag: ETag of the response
+        :type etag: str
+        :rtype: bool
+        '''
+        etags = self._get_request_etags()
+        if '*' in etags:
+            return True
+
+        if self.compression is not None:
+            etags = [self.compression.strip_etag(tag) for tag in etags]
+        return etag in etags or 'W/' + etag in etags
+
+    def _get_request_etags(self):
+        '''
+        Returns ETags listed in If-None-Match request header
+        :rtype: list
+        '''
+        if_none_match = self.request.get_header('If-None-Match')
+        if not if_none_match:
+            return []
+        return [tag.strip() for tag in if_none_match.split(',')]
+
+    def _is_modified_since(self, last_modified):
+        '''
+        Checks if modification time is later than If-Modified-Since request
+        header. If-Modified-Since is ignored if If-None-Match is sent
+        :param last_modified: modification time of the data
+        :type last_modified: datetime.datetime
+        :rtype: bool
+        '''
+        get_header = self.request.get_header
+        if_modified_since = get_header('If-Modified-Since')
+        if not if_modified_since or get_header('If-None-Match'):
+            return True
+
+        since = email.utils.parsedate_tz(if_modified_since)
+        if since is None:
+            return True
+
+        timestamp = calendar.timegm(last_modified.utctimetuple())
+        return timestamp > email.utils.mktime_tz(since)
+
+    def _check_conditions(self, method_name, args, kwargs):
+        '''
+        Sets ETag and Last-Modified headers from version of the data
+        requested and checks conditional headers of the request
+
+        :param method_name: name of the method
+        :type method_name: str
+        :raises restea.errors.NotModifiedError: data is not modified
+        '''
+        etag = self.get_etag(method_name, *args, **kwargs)
+        last_modified = self.get_last_modified(method_name, *args, **kwargs)
+
+        not_modified = False
+        if etag is not None:
+            etag = '"{}"'.format(etag)
+            self.set_header('ETag', etag)
+            not_modified = self._is_etag_matched(etag)
+
+        if last_modified is not None:
+            self.set_header(
+                'Last-Modified',
+                email.utils.formatdate(
+                    calendar.timegm(last_modified.utctimetuple()),
+                    usegmt=True
+                )
+            )
+            not_modified = (
+                not_modified or not self._is_modified_since(last_modified)
+            )
+
+        if not_modified:
+            raise errors.NotModifiedError('Not modified')
+
+    def _set_content_etag(self, content):
+        '''
+        Sets ETag computed over serialized response unless it's already taken
+        from get_etag
+
+        :param content: serialized response
+        :type content: str, bytes
+        '''
+        if 'ETag' in self._response_headers:
+            return
+
+        if isinstance(content, six.text_type):
+            content = content.encode('utf-8')
+        self.set_header(
+            'ETag', '"{}"'.format(hashlib.sha1(content).hexdigest())
+        )
+
+    def _check_etag(self):
+        '''
+        Checks ETag of the response against If-None-Match request header
+
+        :raises restea.errors.NotModifiedError: data is not modified
+        '''
+        etag = self._response_headers.get('ETag')
+        if etag is not None and self._is_etag_matched(etag):
+            raise errors.NotModifiedError('Not modified')
+
+    def _get_conditional_method(self, method_name, method):
+        '''
+        Wraps a method to check conditional request headers before the
+        method is called. Wrapper is applied before self.decorators, so
+        decorators (i.e. authorization) are called for not modified data
+
+        :param method_name: name of the method
+        :type method_name: str
+        :param method: resource method
+        :type method: function
+        :returns: method checking conditional headers
+        :rtype: function
+        '''
+        if not self.conditional or method_name not in self.conditional_methods:
+            return method
+
+        @six.wraps(method)
+        def conditional_method(resource, *args, **kwargs):
+            resource._check_conditions(method_name, args, kwargs)
+            return method(resource, *args, **kwargs)
+
+        return conditional_method
+
+    @classmethod
+    def reset_dispatch_table(cls):
+        '''
+        Drops dispatch tables of the resource class and its subclasses, so
+        they are built again on the next request. Should be called if methods
+        or attributes the table is built from are changed on the class after
+        it has handled a request, i.e. if resource methods are mocked in
+        tests
+        '''
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            if '_dispatch_table' in klass.__dict__:
+                del klass._dispatch_table
+            classes.extend(klass.__subclasses__())
+
+    def _get_dispatch_table(self):
+        '''
+        Returns dispatch table for the resource. Table is built on first use
+        and kept in the resource class, so it's just looked up on the next
+        requests (see `reset_dispatch_table`). Resource objects which
+        override any of the attributes the table is built from, i.e.
+        decorators, get a table of their own
+
+        :returns: dispatch table
+        :rtype: dict
+        '''
+        if not _DISPATCH_ATTRIBUTES.isdisjoint(self.__dict__):
+            return self._build_dispatch_table()
+
+        cls = type(self)
+        table = cls.__dict__.get('_dispatch_table')
+        if table is None:
+            table = cls._dispatch_table = self._build_dispatch_table()
+        return table
+
+    def _get_dispatch_entry(self, has_iden):
+        '''
+        Returns resource method for the request from the dispatch table. Bulk
+        method is used only if resource implements it, requested url has no
+        iden and payload is a list. Payload is only peeked at to tell if it's
+        a list (see `_is_list_payload`), payloads of incremental formats (see
+        `restea.formats.BaseFormatter.incremental`) are always lists, so they
+        aren't read at all
+
+        :param has_iden: specifies if requested url has iden (i.e /res/ vs
+        /res/1)
+        :type has_iden: bool
+        :raises errors.MethodNotAllowedError: if HTTP method is not supprted
+        :raises restea.errors.BadRequestError: iden is missing or unexpected
+        :raises restea.errors.BadRequestError: method is not implemented
+        :raises restea.errors.BadRequestError: unparseable data
+        :returns: 3-element tuple: method name, decorated method and whatever
+        method is bulk
+        :rtype: tuple
+        '''
+        http_method = self._get_http_method()
+        table = self._get_dispatch_table()
+
+        entry = table.get((http_method, has_iden, True))
+        if entry and (
+            self.formatter.incremental or self._is_list_payload()
+        ):
+            return entry[0], entry[1], True
+
+        entry = table.get((http_method, has_iden, False))
+        if not entry:
+            raise errors.MethodNotAllowedError.constant(
+                'Method "{}" is not supported'.format(self.request.method)
+            )
+
+        method_name, method, error = entry
+        if error:
+            error_class, message = error
+            raise error_class.constant(message)
+
+        if method is None:
+            self._get_method(method_name)
+        return method_name, method, False
+
+    def _is_list_payload(self):
+        '''
+        Checks if payload is a list without parsing it when formatter can
+        tell it from the beginning of the payload (see
+        `restea.formats.BaseFormatter.is_list_payload`), so requests
+        rejected by decorators aren't parsed
+
+        :raises restea.errors.BadRequestError: unparseable data
+        :rtype: bool
+        '''
+        data = self._get_request_data()
+        if not data:
+            return False
+
+        try:
+            return self.formatter.is_list_payload(data)
+        except formats.LoadError:
+            raise errors.BadRequestError.constant('Fail to load the data')
+
     @property
     def _is_valid_formatter(self):
         '''
@@ -166,11 +868,50 @@ class Resource(object):
         method_exists = hasattr(self, method_name)
         if not method_exists:
             msg = 'Method "{}" is not implemented for a given endpoint'
-            raise errors.BadRequestError(
+            raise errors.BadRequestError.constant(
                 msg.format(self.request.method)
             )
         return getattr(type(self), method_name)
 
+    def _get_request_data(self):
+        '''
+        Returns payload of the request, raw bytes if formatter accepts bytes
+
+        :returns: payload sent to server
+        :rtype: str, bytes
+        '''
+        if self.formatter.accepts_bytes:
+            return self.request.raw_data
+        return self.request.data
+
+    def _unserialize_payload(self):
+        '''
+        Returns unserialized payload data for request. Payload is
+        unserialized only once per request
+
+        :raises restea.errors.BadRequestError: unparseable data
+        :returns: unserialized payload or None if there is no payload
+        :rtype: dict, list, NoneType
+        '''
+        if not hasattr(self, '_payload_data'):
+            data = self._get_request_data()
+            if not data:
+                self._payload_data = None
+                return None
+
+            try:
+                if self._timings is None:
+                    self._payload_data = self.formatter.unserialize(data)
+                else:
+                    self._payload_data = self._measure(
+                        'parse', self.formatter.unserialize, data
+                    )
+            except formats.LoadError:
+                raise errors.BadRequestError.constant(
+                    'Fail to load the data'
+                )
+        return self._payload_data
+
     def _get_payload(self, method_name):
         '''
         Returns a validated and parsed payload data for request
@@ -183,18 +924,13 @@ class Resource(object):
         :returns: validated data passed to resource
         :rtype: dict
         '''
-        if not self.request.data:
+        if not self._get_request_data():
             return {}
 
-        try:
-            payload_data = self.formatter.unserialize(self.request.data)
-        except formats.LoadError:
-            raise errors.BadRequestError(
-                'Fail to load the data'
-            )
+        payload_data = self._unserialize_payload()
 
-        if not isinstance(payload_data, collections.Mapping):
-            raise errors.BadRequestError(
+        if not isinstance(payload_data, collections_abc.Mapping):
+            raise errors.BadRequestError.constant(
                 'Data should be key -> value structure'
             )
 
@@ -205,12 +941,274 @@ class Resource(object):
         except fields.FieldSet.ConfigurationError as e:
             raise errors.ServerError(str(e))
 
+    def _get_bulk_payload(self):
+        '''
+        Returns a validated and parsed list payload for bulk methods. Every
+        item is validated as a payload of the corresponding single item
+        method, i.e. `create` for `bulk_create`
+
+        :raises restea.errors.BadRequestError: validation of some of the
+        items not passed, `errors` contains index and error for every item
+        :returns: validated items passed to resource, generator of them for
+        incremental formats (see `_iter_bulk_payload`)
+        :rtype: list, generator
+        '''
+        method_name = self.method_map.get(self._get_http_method())
+        if self.formatter.incremental:
+            return self._iter_bulk_payload(method_name)
+
+        try:
+            return self.fields.validate_many(
+                method_name, self._unserialize_payload()
+            )
+        except fields.FieldSet.BatchError as e:
+            raise errors.BadRequestError(
+                str(e),
+                errors=[
+                    {'index': index, 'error': error}
+                    for index, error in e.errors
+                ]
+            )
+        except fields.FieldSet.ConfigurationError as e:
+            raise errors.ServerError(str(e))
+
+    def _iter_bulk_payload(self, method_name):
+        '''
+        Parses and validates bulk payload of incremental format item by item
+        while request body is read. Items before the invalid one are already
+        consumed by the bulk method when it's found, so items stop there and
+        the error is added to the bulk response after their results (see
+        `_get_bulk_response`)
+
+        :param method_name: name of the single item method
+        :type method_name: str
+        :returns: validated items passed to resource
+        :rtype: generator
+        '''
+        items = self.formatter.iter_unserialize(self.request.iter_body())
+        index = 0
+        try:
+            results = self.fields.validate_many(
+                method_name, items, stream=True
+            )
+            for index, cleaned_data, error in results:
+                if error is not None:
+                    self._bulk_payload_error = errors.BadRequestError(
+                        error, index=index
+                    )
+                    return
+                yield cleaned_data
+                # index of the next item, in case it can't be loaded
+                index += 1
+        except formats.LoadError:
+            self._bulk_payload_error = errors.BadRequestError(
+                'Fail to load the data', index=index
+            )
+        except fields.FieldSet.ConfigurationError as e:
+            raise errors.ServerError(str(e))
+
+    @property
+    def payload(self):
+        '''
+        Returns validated payload for the requested method. Payload is
+        parsed and validated on the first access, so methods which don't use
+        it (or requests rejected by decorators) never parse request body
+
+        :raises restea.errors.BadRequestError: unparseable data
+        :raises restea.errors.BadRequestError: validation of fields not passed
+        :returns: validated data passed to resource
+        :rtype: dict, list
+        '''
+        if not hasattr(self, '_payload'):
+            if self._is_bulk:
+                get_payload, args = self._get_bulk_payload, ()
+            else:
+                get_payload, args = self._get_payload, (self._method_name,)
+
+            if self._timings is None:
+                self._payload = get_payload(*args)
+            else:
+                self._payload = self._measure('validate', get_payload, *args)
+        return self._payload
+
+    @payload.setter
+    def payload(self, value):
+        self._payload = value
+
+    def _get_bulk_response(self, results):
+        '''
+        Returns per-item statuses for results of bulk method. Bulk method
+        can return `restea.errors.RestError` instance for the item which
+        failed. Error of the invalid item of incremental payload follows the
+        results of the items before it
+
+        :param results: results of bulk method, one per payload item
+        :type results: list, tuple, generator
+        :returns: per-item statuses with item data or error
+        :rtype: generator
+        '''
+        for result in results:
+            if isinstance(result, errors.RestError):
+                item = result.info.copy()
+                item['error'] = str(result)
+                item['status'] = result.http_code
+            else:
+                item = {'status': 200, 'data': result}
+            yield item
+
+        error = self._bulk_payload_error
+        if error is not None:
+            item = error.info.copy()
+            item['error'] = str(error)
+            item['status'] = error.http_code
+            yield item
+
     def prepare(self):
         pass
 
     def finish(self, response):
         return response
 
+    def _resolve_method(self, args, kwargs):
+        '''
+        Resolves resource method for the request, payload is loaded lazily
+        on access to `payload`
+
+        :raises restea.errors.BadRequestError: wrong self.formatter type
+        :returns: 3-element tuple: method name, decorated method and whatever
+        method is bulk
+        :rtype: tuple
+        '''
+        if not self._is_valid_formatter:
+            raise errors.BadRequestError.constant('Not recognizable format')
+
+        method_name, method, is_bulk = self._get_dispatch_entry(
+            has_iden=bool(args or kwargs)
+        )
+        self._method_name = method_name
+        self._is_bulk = is_bulk
+        self.projection = self._get_projection(method_name)
+        if self.paginator is not None and method_name == 'list':
+            self.page = self.paginator.get_page(self.request)
+        return method_name, method, is_bulk
+
+    def _is_conditional(self, method_name):
+        '''
+        Checks if conditional GET is supported for the method
+        :param method_name: name of the method
+        :type method_name: str
+        :rtype: bool
+        '''
+        return self.conditional and method_name in self.conditional_methods
+
+    def _get_cached_content(self, method_name, cached):
+        '''
+        Returns content of the cached response restoring its headers
+
+        :param method_name: name of the method
+        :type method_name: str
+        :param cached: cached response
+        :type cached: :class: `restea.cache.CachedResponse`
+        :raises restea.errors.NotModifiedError: data is not modified
+        :returns: serialized data to be returned to client
+        :rtype: str, bytes
+        '''
+        self._response_headers.update(cached.headers)
+        if self._is_conditional(method_name):
+            self._check_etag()
+        return cached.content
+
+    def _handle_method_response(self, method_name, response, is_bulk):
+        '''
+        Handles data returned by resource method before it's passed to
+        finish: invalidates cached responses, builds bulk response, cuts
+        requested page and applies projection
+
+        :param method_name: name of the method
+        :type method_name: str
+        :param response: data returned by resource method
+        :returns: response data
+        '''
+        if self.cache is not None and method_name not in self.cache_methods:
+            self.invalidate_cache()
+
+        if is_bulk:
+            response = self._get_bulk_response(response)
+            if self.formatter.incremental:
+                return response
+            return list(response)
+
+        if self.page is not None:
+            response = self._paginate(response)
+        if self.projection is not None:
+            response = self._apply_projection(response)
+        return response
+
+    def _serialize_columns(self, response):
+        '''
+        Serializes response with columnar serialization of the formatter,
+        list of dicts is converted to columns first
+
+        :param response: :class: `restea.columnar.Columns` or list of dicts
+        :raises restea.formats.LoadError: response isn't a list of dicts
+        :returns: serialized columns
+        :rtype: str, bytes
+        '''
+        if not isinstance(response, columnar.Columns):
+            try:
+                response = columnar.Columns.from_rows(response)
+            except (AttributeError, TypeError):
+                raise formats.LoadError
+        return self.formatter.serialize_columns(response, self.fields)
+
+    def _serialize_response(self, method_name, response):
+        '''
+        Serializes response data
+
+        :param method_name: name of the method
+        :type method_name: str
+        :param response: response data
+        :raises restea.errors.ServerError: formatter serialization error
+        :raises restea.errors.NotModifiedError: data is not modified
+        :returns: serialized data to be returned to client, iterator of
+        serialized chunks if `list` response or bulk response of incremental
+        format is streamed. Columns (see `restea.columnar.Columns`) and
+        responses of columnar formats are never streamed
+        :rtype: str, generator
+        '''
+        if isinstance(response, columnar.Columns) or (
+            self.formatter.columnar and method_name == 'list'
+        ):
+            serialize = self._serialize_columns
+        elif (
+            (self.stream or self.formatter.incremental) and
+            method_name == 'list'
+        ) or (self.formatter.incremental and self._is_bulk):
+            return self.formatter.iter_serialize(response)
+        else:
+            serialize = self.formatter.serialize
+
+        try:
+            content = serialize(response)
+        except formats.LoadError:
+            raise errors.ServerError.constant(
+                'Service can\'t respond with this format'
+            )
+
+        is_conditional = self._is_conditional(method_name)
+        if is_conditional:
+            self._set_content_etag(content)
+
+        if self._cache_key is not None:
+            self.cache.set(
+                self._cache_key, content, self._response_headers,
+                self.cache_ttl
+            )
+
+        if is_conditional:
+            self._check_etag()
+        return content
+
     def process(self, *args, **kwargs):
         '''
         Processes the payload and maps HTTP method to resource object methods
@@ -220,25 +1218,56 @@ class Resource(object):
         :raises restea.errors.ServerError: Some unhandled exception in
         resource method implementation or formatter serialization error
 
-        :returns: serialized data to be returned to client
-        :rtype: str
+        :returns: serialized data to be returned to client, iterator of
+        serialized chunks if `list` response is streamed
+        :rtype: str, generator
         '''
-        if not self._is_valid_formatter:
-            raise errors.BadRequestError('Not recognizable format')
-
-        method_name = self._get_method_name(has_iden=bool(args or kwargs))
-        self.payload = self._get_payload(method_name)
-        method = self._get_method(method_name)
-        method = self._apply_decorators(method)
+        if self._timings is not None:
+            return self._process_measured(args, kwargs)
 
+        method_name, method, is_bulk = self._resolve_method(args, kwargs)
         self.prepare()
         response = method(self, *args, **kwargs)
+        if isinstance(response, cache.CachedResponse):
+            return self._get_cached_content(method_name, response)
+
+        response = self._handle_method_response(
+            method_name, response, is_bulk
+        )
         response = self.finish(response)
+        return self._serialize_response(method_name, response)
 
-        try:
-            return self.formatter.serialize(response)
-        except formats.LoadError:
-            raise errors.ServerError('Service can\'t respond with this format')
+    def _process_measured(self, args, kwargs):
+        '''
+        Version of `process` measuring time of every phase of the request
+
+        :param args: positional arguments of `process`
+        :type args: tuple
+        :param kwargs: keyword arguments of `process`
+        :type kwargs: dict
+        :returns: serialized data to be returned to client
+        :rtype: str, generator
+        '''
+        measure = self._measure
+        method_name, method, is_bulk = measure(
+            'resolve', self._resolve_method, args, kwargs
+        )
+
+        measure('prepare', self.prepare)
+        response = measure('decorators', method, self, *args, **kwargs)
+        if isinstance(response, cache.CachedResponse):
+            return measure(
+                'serialize', self._get_cached_content, method_name, response
+            )
+
+        response = measure(
+            'handle', self._handle_method_response, method_name, response,
+            is_bulk
+        )
+        response = measure('finish', self.finish, response)
+        return measure(
+            'serialize', self._serialize_response, method_name, response
+        )
 
     def dispatch(self, *args, **kwargs):
         '''
@@ -249,24 +1278,151 @@ class Resource(object):
         headers
         :rtype: tuple
         '''
+        if not self._start_timings():
+            try:
+                response = (
+                    self.process(*args, **kwargs),
+                    200,
+                    self.formatter.content_type,
+                    self._response_headers
+                )
+            except errors.RestError as e:
+                response = self._get_error_response(e)
+            if self.compression is not None:
+                response = self._compress_response(response)
+            return response
+
+        started = instrumentation.clock()
         try:
-            return (
+            response = (
                 self.process(*args, **kwargs),
                 200,
                 self.formatter.content_type,
                 self._response_headers
             )
         except errors.RestError as e:
-            err = e.info.copy()
-            err['error'] = str(e)
+            response = self._measure('serialize', self._get_error_response, e)
+        if self.compression is not None:
+            response = self._measure(
+                'compress', self._compress_response, response
+            )
+        self._finish_timings(response, instrumentation.clock() - started)
+        return response
+
+    def dispatch_async(self, *args, **kwargs):
+        '''
+        Asynchronous version of `dispatch`. Resource methods, prepare and
+        finish can be defined with `async def`. Requires Python 3.5+
+
+        :returns: awaitable returning 4-element tuple: result, HTTP status
+        code, content type, and headers
+        :rtype: coroutine
+        '''
+        # restea.aio uses syntax which is not supported by Python 2
+        from restea.aio import dispatch_async
+        return dispatch_async(self, *args, **kwargs)
+
+    def _get_error_response(self, e):
+        '''
+        Returns response for the error raised while processing the request
 
+        :param e: error raised
+        :type e: :class: `restea.errors.RestError`
+        :returns: 4-element tuple: result, HTTP status code, content type, and
+        headers
+        :rtype: tuple
+        '''
+        if isinstance(e, errors.NotModifiedError):
             return (
-                self._error_formatter.serialize(err),
+                '',
                 e.http_code,
-                self._error_formatter.content_type,
+                self.formatter.content_type,
                 self._response_headers
             )
 
+        formatter = self._error_formatter
+        if e.is_constant:
+            content = self._get_constant_error_content(formatter, e)
+        else:
+            err = e.info.copy()
+            err['error'] = str(e)
+            content = formatter.serialize(err)
+
+        return (
+            content,
+            e.http_code,
+            formatter.content_type,
+            self._response_headers
+        )
+
+    def _get_constant_error_content(self, formatter, e):
+        '''
+        Returns serialized constant error, it's serialized once per formatter
+        and reused for next requests
+
+        :param formatter: formatter of the error
+        :type formatter: :class: `restea.formats.BaseFormatter`
+        :param e: constant error raised
+        :type e: :class: `restea.errors.RestError`
+        :returns: serialized error
+        :rtype: str, bytes
+        '''
+        key = (formatter, type(e), str(e))
+        content = _constant_error_contents.get(key)
+        if content is None:
+            err = e.info.copy()
+            err['error'] = str(e)
+            content = formatter.serialize(err)
+            # messages might include HTTP method sent by client, so number
+            # of stored errors is limited
+            if len(_constant_error_contents) < MAX_CONSTANT_ERRORS:
+                _constant_error_contents[key] = content
+        return content
+
+    def _compress_response(self, response):
+        '''
+        Compresses response content with the coding accepted by client, if
+        content is big enough. ETag of compressed content gets a suffix of
+        the coding (see `restea.compression.Compression.get_etag`). Not
+        modified responses have no body to compress, they get the ETag of
+        the compressed content only if the client has it
+
+        :param response: 4-element tuple: result, HTTP status code, content
+        type, and headers
+        :type response: tuple
+        :returns: response with compressed content
+        :rtype: tuple
+        '''
+        content, status_code = response[0], response[1]
+        not_modified = status_code == errors.NotModifiedError.http_code
+        if not not_modified and not self.compression.should_compress(content):
+            return response
+
+        vary = self._response_headers.get('Vary')
+        if not vary:
+            self.set_header('Vary', 'Accept-Encoding')
+        elif 'accept-encoding' not in vary.lower():
+            self.set_header('Vary', vary + ', Accept-Encoding')
+
+        codec = self.compression.negotiate(
+            self.request.get_header('Accept-Encoding')
+        )
+        if codec is None:
+            return response
+
+        etag = self._response_headers.get('ETag')
+        if not_modified:
+            if etag is not None:
+                etag = self.compression.get_etag(etag, codec)
+                if etag in self._get_request_etags():
+                    self.set_header('ETag', etag)
+            return response
+
+        if etag is not None:
+            self.set_header('ETag', self.compression.get_etag(etag, codec))
+        self.set_header('Content-Encoding', codec.name)
+        return (self.compression.compress(content, codec),) + response[1:]
+
     def set_header(self, name, value):
         '''
         Sets the given response header name and value.
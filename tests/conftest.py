@@ -0,0 +1,30 @@
+import sys
+
+import pytest
+
+from restea import formats
+from restea.resource import Resource
+
+
+# async def syntax is not supported by Python 2
+collect_ignore = ['test_aio.py'] if sys.version_info < (3, 5) else []
+
+
+@pytest.fixture(autouse=True)
+def stdlib_json_backend(monkeypatch):
+    '''
+    Pins stdlib JSON backend, so tests don't depend on installed JSON
+    libraries
+    '''
+    monkeypatch.setattr(
+        formats.JsonFormat, 'backend', formats.StdlibJsonBackend
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_dispatch_tables():
+    '''
+    Drops dispatch tables of resources, so methods mocked on resource
+    classes are used
+    '''
+    Resource.reset_dispatch_table()
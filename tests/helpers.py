@@ -0,0 +1,18 @@
+import mock
+
+from restea.adapters.base import get_environ_name
+
+
+def create_request_mock(**kwargs):
+    '''
+    Returns mock of request wrapper. Headers are looked up with `get_header`
+    in `headers` dict in WSGI environ format, i.e. HTTP_IF_NONE_MATCH
+    '''
+    kwargs.setdefault('headers', {})
+    request = mock.Mock(**kwargs)
+
+    def get_header(name, default=None):
+        return request.headers.get(get_environ_name(name), default)
+
+    request.get_header.side_effect = get_header
+    return request
@@ -0,0 +1,79 @@
+import io
+
+import mock
+import pytest
+
+from restea import errors
+from restea.adapters.base import (
+    BaseRequestWrapper,
+    check_body_size,
+    iter_stream,
+)
+
+
+class StreamRequestWrapper(BaseRequestWrapper):
+    def __init__(self, stream, length=None):
+        super(StreamRequestWrapper, self).__init__(None)
+        self._stream = stream
+        self._length = length
+
+    def _get_body_stream(self):
+        return self._stream, self._length
+
+
+def test_check_body_size():
+    check_body_size(10, None)
+    check_body_size(10, 10)
+    with pytest.raises(errors.PayloadTooLargeError) as e:
+        check_body_size(11, 10)
+    assert str(e.value) == 'Request body is larger than 10 bytes'
+
+
+def test_iter_stream():
+    stream = io.BytesIO(b'abcdefgtrailing')
+    chunks = list(iter_stream(stream, 7, chunk_size=3, max_size=7))
+    assert chunks == [b'abc', b'def', b'g']
+    assert stream.read() == b'trailing'
+
+    chunks = iter_stream(io.BytesIO(b'abcdefg'), chunk_size=3)
+    assert list(chunks) == [b'abc', b'def', b'g']
+
+
+def test_iter_stream_known_length_rejected_before_read():
+    stream = mock.Mock(wraps=io.BytesIO(b'a' * 20))
+    chunks = iter_stream(stream, 20, chunk_size=4, max_size=10)
+
+    with pytest.raises(errors.PayloadTooLargeError):
+        next(chunks)
+    assert not stream.read.called
+
+
+def test_iter_stream_unknown_length_cut_off():
+    stream = io.BytesIO(b'a' * 20)
+    chunks = iter_stream(stream, chunk_size=4, max_size=10)
+
+    assert [next(chunks) for _ in range(2)] == [b'aaaa', b'aaaa']
+    with pytest.raises(errors.PayloadTooLargeError):
+        next(chunks)
+    # no more than the limit and a chunk is read
+    assert stream.tell() == 12
+
+
+def test_request_wrapper_read_body():
+    request = StreamRequestWrapper(io.BytesIO(b'{"a": 1}'), 8)
+    request.max_body_size = 8
+    assert request.raw_data == b'{"a": 1}'
+
+    request = StreamRequestWrapper(io.BytesIO(b'{"a": 1}'))
+    request.max_body_size = 4
+    with pytest.raises(errors.PayloadTooLargeError):
+        request.raw_data
+
+
+def test_request_wrapper_iter_body():
+    request = StreamRequestWrapper(io.BytesIO(b'a' * 10), 10)
+    assert list(request.iter_body(chunk_size=4)) == [b'aaaa', b'aaaa', b'aa']
+
+    request = StreamRequestWrapper(io.BytesIO(b'a' * 10), 10)
+    assert request.raw_data == b'a' * 10
+    assert list(request.iter_body(chunk_size=4)) == [b'a' * 10]
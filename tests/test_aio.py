@@ -0,0 +1,141 @@
+import asyncio
+import json
+
+import mock
+
+from restea import errors
+from restea import formats
+from restea import instrumentation
+from restea import ratelimit
+from restea.adapters.asgi import (
+    ASGIApplication,
+    ASGIRequestWrapper,
+    ASGIResourceWrapper,
+)
+from restea.resource import Resource
+from tests.helpers import create_request_mock
+
+
+def create_request(method='GET', data=None):
+    return create_request_mock(
+        method=method, headers={}, data=data, raw_data=data
+    )
+
+
+def run(coroutine):
+    return asyncio.new_event_loop().run_until_complete(coroutine)
+
+
+class AsyncResource(Resource):
+    async def prepare(self):
+        self.prepared = True
+
+    async def show(self, iden):
+        await asyncio.sleep(0)
+        if iden == 'missing':
+            raise errors.NotFoundError('Not found!')
+        return {'iden': iden, 'prepared': self.prepared}
+
+    def list(self):
+        return [{'iden': 1}]
+
+    async def finish(self, response):
+        if isinstance(response, dict):
+            response['finished'] = True
+        return response
+
+
+def test_dispatch_async_coroutine_method():
+    resource = AsyncResource(create_request(), formats.JsonFormat)
+    res, status, content_type, headers = run(resource.dispatch_async(iden=1))
+
+    assert json.loads(res) == {'iden': 1, 'prepared': True, 'finished': True}
+    assert status == 200
+    assert content_type == 'application/json'
+    assert headers == {}
+
+
+def test_dispatch_async_regular_method():
+    resource = AsyncResource(create_request(), formats.JsonFormat)
+    res, status, _, _ = run(resource.dispatch_async())
+
+    assert json.loads(res) == [{'iden': 1}]
+    assert status == 200
+
+
+def test_dispatch_async_error():
+    resource = AsyncResource(create_request(), formats.JsonFormat)
+    res, status, _, _ = run(resource.dispatch_async(iden='missing'))
+
+    assert json.loads(res) == {'error': 'Not found!'}
+    assert status == 404
+
+
+def test_dispatch_async_method_not_allowed():
+    resource = AsyncResource(create_request('PATCH'), formats.JsonFormat)
+    res, status, _, _ = run(resource.dispatch_async(iden=1))
+
+    assert json.loads(res) == {'error': 'Method "PATCH" is not supported'}
+    assert status == 405
+
+
+class LimitedResource(Resource):
+    decorators = [
+        ratelimit.RateLimit(ratelimit.TokenBucketLimiter(rate=0.001, burst=1))
+    ]
+
+    def show(self, iden):
+        return {'iden': iden}
+
+
+def test_asgi_request_wrapper_remote_addr():
+    request = ASGIRequestWrapper({'client': ('10.0.0.1', 1234)})
+    assert request.remote_addr == '10.0.0.1'
+    assert ASGIRequestWrapper({'client': None}).remote_addr is None
+    assert ASGIRequestWrapper({}).remote_addr is None
+
+
+def test_asgi_rate_limit_by_remote_addr():
+    app = ASGIApplication(
+        ASGIResourceWrapper(LimitedResource).get_routes('/items')
+    )
+
+    async def get(client):
+        messages = []
+
+        async def receive():
+            return {'type': 'http.request', 'body': b''}
+
+        async def send(message):
+            messages.append(message)
+
+        scope = {
+            'type': 'http', 'method': 'GET', 'path': '/items/1',
+            'headers': [], 'client': client,
+        }
+        await app(scope, receive, send)
+        return messages[0]['status']
+
+    assert run(get(('10.0.0.1', 1234))) == 200
+    assert run(get(('10.0.0.1', 1235))) == 429
+    assert run(get(('10.0.0.2', 1234))) == 200
+    assert run(get(None)) == 200
+    assert run(get(None)) == 429
+
+
+class ObservedAsyncResource(Resource):
+    observers = [mock.Mock(spec=instrumentation.BaseObserver)]
+
+    async def show(self, iden):
+        await asyncio.sleep(0.05)
+        return {'iden': iden}
+
+
+def test_dispatch_async_measures_coroutine_method():
+    observer = ObservedAsyncResource.observers[0]
+    resource = ObservedAsyncResource(create_request(), formats.JsonFormat)
+    assert run(resource.dispatch_async(iden=1))[1] == 200
+
+    phases = observer.observe.call_args[0][0].phases
+    assert phases['method'] >= 0.04
+    assert phases['decorators'] < 0.04
@@ -0,0 +1,116 @@
+import mock
+import pytest
+
+from restea import cache
+
+
+class Clock(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_base_cache_backend_should_be_abstract():
+    backend = cache.BaseCacheBackend()
+    with pytest.raises(NotImplementedError):
+        backend.get('key')
+    with pytest.raises(NotImplementedError):
+        backend.set('key', 'value')
+    with pytest.raises(NotImplementedError):
+        backend.delete('key')
+
+
+def test_local_cache_backend_get_set_delete():
+    backend = cache.LocalCacheBackend()
+    assert backend.get('key') is None
+
+    backend.set('key', 'value')
+    assert backend.get('key') == 'value'
+
+    backend.delete('key')
+    assert backend.get('key') is None
+
+
+def test_local_cache_backend_ttl():
+    clock = Clock()
+    backend = cache.LocalCacheBackend(clock=clock)
+    backend.set('key', 'value', ttl=10)
+
+    clock.now += 9
+    assert backend.get('key') == 'value'
+    clock.now += 1
+    assert backend.get('key') is None
+
+
+def test_local_cache_backend_evicts_least_recently_used():
+    backend = cache.LocalCacheBackend(max_size=2)
+    backend.set('key1', 1)
+    backend.set('key2', 2)
+    backend.get('key1')
+    backend.set('key3', 3)
+
+    assert backend.get('key1') == 1
+    assert backend.get('key2') is None
+    assert backend.get('key3') == 3
+
+
+def test_client_cache_backend():
+    client = mock.Mock()
+    client.get.return_value = 'value'
+    backend = cache.ClientCacheBackend(client, prefix='p:')
+
+    assert backend.get('key') == 'value'
+    client.get.assert_called_with('p:key')
+
+    backend.set('key', 'value', 10)
+    client.set.assert_called_with('p:key', 'value', 10)
+
+    backend.delete('key')
+    client.delete.assert_called_with('p:key')
+
+
+def test_response_cache_get_set():
+    response_cache = cache.ResponseCache()
+    key = response_cache.get_key('res', 'show', (1,))
+    assert response_cache.get(key) is None
+
+    response_cache.set(key, 'content', {'foo': 'bar'}, ttl=10)
+    assert response_cache.get(key) == cache.CachedResponse(
+        'content', [('foo', 'bar')]
+    )
+
+
+def test_response_cache_keys():
+    response_cache = cache.ResponseCache()
+    key = response_cache.get_key('res', 'show', (1,))
+    assert key == response_cache.get_key('res', 'show', (1,))
+    assert key != response_cache.get_key('res', 'show', (2,))
+    assert key != response_cache.get_key('other', 'show', (1,))
+
+
+def test_response_cache_invalidate():
+    response_cache = cache.ResponseCache()
+    other_key = response_cache.get_key('other', 'show', (1,))
+    response_cache.set(other_key, 'content', {})
+    key = response_cache.get_key('res', 'show', (1,))
+    response_cache.set(key, 'content', {})
+
+    response_cache.invalidate('res')
+    assert response_cache.get(
+        response_cache.get_key('res', 'show', (1,))
+    ) is None
+    assert response_cache.get(other_key) is not None
+
+
+def test_response_cache_shared_backend():
+    client = cache.LocalCacheBackend()
+    cache1 = cache.ResponseCache(cache.ClientCacheBackend(client))
+    cache2 = cache.ResponseCache(cache.ClientCacheBackend(client))
+
+    cache1.set(cache1.get_key('res', 'list'), 'content', {})
+    assert cache2.get(cache2.get_key('res', 'list')).content == 'content'
+
+    cache2.invalidate('res')
+    assert cache1.get(cache1.get_key('res', 'list')) is None
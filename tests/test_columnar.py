@@ -0,0 +1,63 @@
+import pytest
+
+from restea.columnar import Columns
+
+
+def create_columns():
+    return Columns.from_rows(
+        [
+            {'id': 1, 'name': 'a', 'rating': 5},
+            {'id': 2, 'name': 'b'},
+            {'id': 3, 'name': 'c', 'rating': 1},
+        ],
+        ['id', 'name', 'rating']
+    )
+
+
+def test_from_rows():
+    columns = create_columns()
+    assert columns.columns == ['id', 'name', 'rating']
+    assert columns.data == {
+        'id': [1, 2, 3],
+        'name': ['a', 'b', 'c'],
+        'rating': [5, None, 1],
+    }
+    assert len(columns) == 3
+
+
+def test_len_empty():
+    assert len(Columns({})) == 0
+
+
+def test_project():
+    projected = create_columns().project(frozenset(['rating', 'id']))
+    assert projected.columns == ['id', 'rating']
+    assert sorted(projected.data) == ['id', 'rating']
+
+
+def test_slice_and_row():
+    columns = create_columns().slice(1, 3)
+    assert len(columns) == 2
+    assert columns.row(-1) == {'id': 3, 'name': 'c', 'rating': 1}
+
+
+def test_to_dict():
+    assert create_columns().project(['id', 'name']).to_dict() == {
+        'columns': ['id', 'name'],
+        'data': {'id': [1, 2, 3], 'name': ['a', 'b', 'c']},
+    }
+
+
+def test_numpy_columns():
+    numpy = pytest.importorskip('numpy')
+    columns = Columns({
+        'id': numpy.arange(3),
+        'value': numpy.array([0.5, 1.5, 2.5]),
+    })
+
+    assert columns.to_dict()['data'] == {
+        'id': [0, 1, 2], 'value': [0.5, 1.5, 2.5]
+    }
+    row = columns.row(0)
+    assert row == {'id': 0, 'value': 0.5}
+    assert type(row['id']) is int
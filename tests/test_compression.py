@@ -0,0 +1,87 @@
+import gzip
+import io
+import zlib
+
+import pytest
+
+from restea import compression
+
+
+def gunzip(data):
+    return gzip.GzipFile(fileobj=io.BytesIO(data)).read()
+
+
+@pytest.mark.parametrize('accept_encoding,expected', [
+    (None, None),
+    ('', None),
+    ('gzip', 'gzip'),
+    ('deflate, gzip', 'gzip'),
+    ('gzip;q=0.5, deflate', 'deflate'),
+    ('gzip;q=0, deflate;q=0', None),
+    ('identity', None),
+    ('*', 'gzip'),
+    ('*;q=0.1, deflate;q=0.5', 'deflate'),
+    ('gzip;q=broken, deflate', 'deflate'),
+])
+def test_negotiate(accept_encoding, expected):
+    compressor = compression.Compression(
+        codecs=[compression.GzipCodec(), compression.DeflateCodec()]
+    )
+    codec = compressor.negotiate(accept_encoding)
+    assert (codec and codec.name) == expected
+
+
+def test_unavailable_codecs_skipped():
+    class UnavailableCodec(compression.BaseCodec):
+        name = 'fast'
+        available = False
+
+    compressor = compression.Compression(
+        codecs=[UnavailableCodec(), compression.GzipCodec()]
+    )
+    assert compressor.negotiate('fast, gzip').name == 'gzip'
+
+
+def test_should_compress():
+    compressor = compression.Compression(threshold=10)
+    assert not compressor.should_compress('short')
+    assert compressor.should_compress(b'long enough content')
+    assert compressor.should_compress(iter(['a']))
+
+
+def test_should_compress_empty_content():
+    compressor = compression.Compression(threshold=0)
+    assert not compressor.should_compress('')
+    assert not compressor.should_compress(b'')
+    assert compressor.should_compress('a')
+
+
+def test_etag():
+    compressor = compression.Compression(
+        codecs=[compression.GzipCodec(), compression.DeflateCodec()]
+    )
+    etag = compressor.get_etag('"abc"', compression.GzipCodec())
+    assert etag == '"abc-gzip"'
+    assert compressor.strip_etag(etag) == '"abc"'
+    assert compressor.strip_etag('W/"abc-deflate"') == 'W/"abc"'
+    assert compressor.strip_etag('"abc-br"') == '"abc-br"'
+    assert compressor.strip_etag('"abc"') == '"abc"'
+
+
+def test_compress():
+    compressor = compression.Compression()
+    gzip_codec = compression.GzipCodec()
+    assert gunzip(compressor.compress('content', gzip_codec)) == b'content'
+
+    deflate_codec = compression.DeflateCodec()
+    compressed = compressor.compress(b'content', deflate_codec)
+    assert zlib.decompress(compressed) == b'content'
+
+
+def test_compress_stream():
+    compressor = compression.Compression()
+    chunks = compressor.compress(
+        iter(['[', b'1', ',', '2', ']']), compression.GzipCodec()
+    )
+    assert not isinstance(chunks, bytes)
+    assert gunzip(b''.join(chunks)) == b'[1,2]'
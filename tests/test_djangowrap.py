@@ -0,0 +1,55 @@
+import pytest
+
+from restea import errors
+
+try:
+    from django.conf import settings
+    from django.test import RequestFactory
+    if not settings.configured:
+        settings.configure()
+    from restea.adapters import djangowrap
+except ImportError:
+    djangowrap = None
+
+pytestmark = pytest.mark.skipif(
+    djangowrap is None, reason='Django adapter is not available'
+)
+
+
+def create_request(body):
+    return RequestFactory().post(
+        '/items', body, content_type='application/json'
+    )
+
+
+def test_max_body_size_defaults_to_settings(monkeypatch):
+    monkeypatch.setattr(settings, 'DATA_UPLOAD_MAX_MEMORY_SIZE', 4)
+    request = djangowrap.DjangoRequestWrapper(create_request(b'{"a": 1}'))
+    assert request.max_body_size == 4
+
+    with pytest.raises(errors.PayloadTooLargeError):
+        request.raw_data
+
+
+def test_read_body():
+    original_request = create_request(b'{"a": 1}')
+    request = djangowrap.DjangoRequestWrapper(original_request)
+
+    assert request.raw_data == b'{"a": 1}'
+    assert request.data == b'{"a": 1}'
+    # body is still available to Django code
+    assert original_request.body == b'{"a": 1}'
+
+
+def test_read_body_already_read():
+    original_request = create_request(b'{"a": 1}')
+    assert original_request.body == b'{"a": 1}'
+
+    request = djangowrap.DjangoRequestWrapper(original_request)
+    assert request.raw_data == b'{"a": 1}'
+    assert b''.join(request.iter_body()) == b'{"a": 1}'
+
+    request = djangowrap.DjangoRequestWrapper(original_request)
+    request.max_body_size = 4
+    with pytest.raises(errors.PayloadTooLargeError):
+        request.raw_data
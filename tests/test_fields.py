@@ -1,9 +1,9 @@
 from __future__ import unicode_literals
 
-import six
 from six.moves import map, range
 
 import mock
+from mock import patch
 import pytest
 import datetime
 from restea.fields import (
@@ -40,7 +40,7 @@ def test_field_set_init():
 
 def test_feild_set_field_names():
     fs, _, _ = create_field_set_helper()
-    assert fs.field_names == set(['field1', 'field2'])
+    assert fs.field_names == frozenset(['field1', 'field2'])
 
 
 def test_feild_set_field_names_empty():
@@ -96,6 +96,65 @@ def test_feild_set_validate_requred_fields_missing():
     assert 'Field "field1" is missing' in str(e)
 
 
+def test_field_set_validate_dynamic_required_field_missing():
+    fs, f1, f2 = create_field_set_helper()
+    f1.validate.return_value = 1
+    f2.required = lambda method_name, data: method_name == 'create'
+
+    assert fs.compile()('edit', {'field1': '1'}) == {'field1': 1}
+    with pytest.raises(FieldSet.Error) as e:
+        fs.validate('create', {'field1': '1'})
+    assert 'Field "field2" is missing' in str(e.value)
+
+
+def test_field_set_compile_picks_up_new_fields():
+    fs, _, _ = create_field_set_helper(no_fields=True)
+    assert fs.validate('create', {'field3': '3'}) == {}
+
+    f3 = mock.Mock(spec=Field())
+    f3.validate.return_value = 3
+    fs.fields['field3'] = f3
+    fs.compile()
+    assert fs.validate('create', {'field3': '3'}) == {'field3': 3}
+
+
+def test_field_set_validate_many():
+    fs, f1, f2 = create_field_set_helper()
+    f1.validate.side_effect = int
+    f2.validate.side_effect = int
+    items = [{'field1': '1', 'field2': '2'}, {'field1': '3', 'field2': '4'}]
+
+    assert fs.validate_many('create', items) == [
+        {'field1': 1, 'field2': 2},
+        {'field1': 3, 'field2': 4},
+    ]
+
+
+def test_field_set_validate_many_collects_errors():
+    fs = FieldSet(field1=Integer(required=True))
+    items = [{'field1': '1'}, {'field1': 'x'}, {}, ['field1'], {'field1': 5}]
+
+    with pytest.raises(FieldSet.BatchError) as e:
+        fs.validate_many('create', items)
+    assert str(e.value) == '3 of 5 items failed validation'
+    assert e.value.errors == [
+        (1, 'Field "field1" is not a number'),
+        (2, 'Field "field1" is missing'),
+        (3, 'Data should be key -> value structure'),
+    ]
+
+
+def test_field_set_validate_many_stream():
+    fs = FieldSet(field1=Integer(required=True))
+    items = iter([{'field1': '1'}, {'field1': 'x'}])
+
+    results = fs.validate_many('create', items, stream=True)
+    assert next(results) == (0, {'field1': 1}, None)
+    assert next(results) == (1, None, 'Field "field1" is not a number')
+    with pytest.raises(StopIteration):
+        next(results)
+
+
 def test_field_init():
     f = Field(setting1=1, setting2=2, required=True)
     assert f._name is None
@@ -150,6 +209,19 @@ def test_field_validate():
     f._validate_my_setting.assert_called_with(1, 'value')
 
 
+def test_field_validate_resolves_setting_validators_once():
+    f = Field(my_setting=1)
+    f._validate_field = mock.Mock(return_value='value')
+    f._validate_my_setting = mock.Mock(return_value='value')
+
+    with patch.object(
+        f, '_get_setting_validator', wraps=f._get_setting_validator
+    ) as get_validator_mock:
+        f.validate('value')
+        f.validate('value')
+    assert get_validator_mock.call_count == 1
+
+
 def test_field_validate_raises_on_field_validation():
     f = Field(my_setting=1)
     f.set_name('test')
@@ -0,0 +1,195 @@
+import gzip
+import io
+import json
+
+import pytest
+
+from restea import compression
+from restea import errors
+from restea import fields
+from restea import ratelimit
+from restea.resource import Resource
+
+flask = pytest.importorskip('flask')
+flaskwrap = pytest.importorskip('restea.adapters.flaskwrap')
+
+
+class ItemResource(Resource):
+    fields = fields.FieldSet(name=fields.String())
+    conditional = True
+
+    def show(self, iden):
+        return {'iden': iden}
+
+    def create(self):
+        return self.payload
+
+
+class LimitedItemResource(ItemResource):
+    decorators = [
+        ratelimit.RateLimit(ratelimit.TokenBucketLimiter(rate=0.001, burst=1))
+    ]
+
+
+class CompressedItemResource(ItemResource):
+    compression = compression.Compression(threshold=0)
+
+    def list(self):
+        return [{'name': 'item {}'.format(i)} for i in range(50)]
+
+
+def require_token(func):
+    def wrapper(resource, *args, **kwargs):
+        if resource.request.headers.get('Authorization') != 'Token a':
+            raise errors.ForbiddenError('Forbidden')
+        return func(resource, *args, **kwargs)
+    return wrapper
+
+
+class ProtectedItemResource(ItemResource):
+    decorators = [require_token]
+
+
+@pytest.fixture
+def client():
+    app = flask.Flask(__name__)
+    with app.app_context():
+        flaskwrap.FlaskResourceWrapper(ItemResource).get_routes('items')
+    return app.test_client()
+
+
+def test_headers():
+    app = flask.Flask(__name__)
+    with app.test_request_context('/', headers={'If-None-Match': '"a"'}):
+        request = flaskwrap.FlaskRequestWrapper(flask.request)
+        assert request.headers is flask.request.headers
+        assert request.headers.get('If-None-Match') == '"a"'
+        assert request.get_header('If-None-Match') == '"a"'
+        assert request.get_header('if-none-match') == '"a"'
+        assert request.get_header('If-Match', 'default') == 'default'
+
+
+def test_show(client):
+    response = client.get('/items/1')
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {'iden': '1'}
+
+
+def test_create(client):
+    response = client.post('/items.json', data=json.dumps({'name': 'a'}))
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {'name': 'a'}
+
+
+def test_conditional_get(client):
+    etag = client.get('/items/1').headers['ETag']
+
+    response = client.get('/items/1', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.get_data() == b''
+
+    response = client.get('/items/2', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+
+
+def test_method_override(client):
+    response = client.post(
+        '/items/1', headers={'X-HTTP-Method-Override': 'GET'}
+    )
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {'iden': '1'}
+
+
+def test_remote_addr():
+    app = flask.Flask(__name__)
+    environ = {'REMOTE_ADDR': '10.0.0.1'}
+    with app.test_request_context('/', environ_base=environ):
+        request = flaskwrap.FlaskRequestWrapper(flask.request)
+        assert request.remote_addr == '10.0.0.1'
+
+
+def test_rate_limit_by_remote_addr():
+    app = flask.Flask(__name__)
+    with app.app_context():
+        flaskwrap.FlaskResourceWrapper(LimitedItemResource).get_routes(
+            'items'
+        )
+    client = app.test_client()
+
+    def get(address):
+        return client.get(
+            '/items/1', environ_base={'REMOTE_ADDR': address}
+        ).status_code
+
+    assert get('10.0.0.1') == 200
+    assert get('10.0.0.1') == 429
+    assert get('10.0.0.2') == 200
+
+
+def test_compression():
+    app = flask.Flask(__name__)
+    with app.app_context():
+        flaskwrap.FlaskResourceWrapper(CompressedItemResource).get_routes(
+            'items'
+        )
+    client = app.test_client()
+
+    response = client.get('/items', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['Content-Encoding'] == 'gzip'
+    data = gzip.GzipFile(fileobj=io.BytesIO(response.get_data())).read()
+    assert len(json.loads(data.decode('utf-8'))) == 50
+
+    etag = response.headers['ETag']
+    assert etag.endswith('-gzip"')
+    response = client.get('/items/1', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': etag
+    })
+    assert response.status_code == 200
+
+    etag = client.get(
+        '/items/1', headers={'Accept-Encoding': 'gzip'}
+    ).headers['ETag']
+    response = client.get('/items/1', headers={
+        'Accept-Encoding': 'gzip', 'If-None-Match': etag
+    })
+    assert response.status_code == 304
+    assert response.get_data() == b''
+    assert 'Content-Encoding' not in response.headers
+
+
+def test_create_body_read_before_request():
+    app = flask.Flask(__name__)
+
+    @app.before_request
+    def read_body():
+        flask.request.get_data()
+
+    with app.app_context():
+        flaskwrap.FlaskResourceWrapper(ItemResource).get_routes('items')
+    client = app.test_client()
+
+    response = client.post('/items.json', data=json.dumps({'name': 'a'}))
+    assert response.status_code == 200
+    assert json.loads(response.get_data()) == {'name': 'a'}
+
+
+def test_body_available_after_read():
+    app = flask.Flask(__name__)
+    with app.test_request_context('/', method='POST', data=b'{"a": 1}'):
+        request = flaskwrap.FlaskRequestWrapper(flask.request)
+        assert request.raw_data == b'{"a": 1}'
+        assert flask.request.get_data() == b'{"a": 1}'
+
+
+def test_decorator_reads_headers():
+    app = flask.Flask(__name__)
+    with app.app_context():
+        flaskwrap.FlaskResourceWrapper(ProtectedItemResource).get_routes(
+            'items'
+        )
+    client = app.test_client()
+
+    response = client.get('/items/1', headers={'Authorization': 'Token a'})
+    assert response.status_code == 200
+    assert client.get('/items/1').status_code == 403
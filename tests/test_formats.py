@@ -75,3 +75,370 @@ def test_get_formatter():
 def test_get_formatter_unexisting():
     with patch.dict(formats._formatter_registry, {}, clear=True):
         assert formats.get_formatter('a') is None
+
+
+def test_base_formatter_iter_serialize():
+    with patch.object(formats.BaseFormatter, 'serialize') as serialize_mock:
+        serialize_mock.return_value = 'serialized'
+        chunks = list(formats.BaseFormatter.iter_serialize([1, 2]))
+    assert chunks == ['serialized']
+    serialize_mock.assert_called_with([1, 2])
+
+
+def test_base_formatter_iter_serialize_generator():
+    with patch.object(formats.BaseFormatter, 'serialize') as serialize_mock:
+        serialize_mock.return_value = 'serialized'
+        list(formats.BaseFormatter.iter_serialize(i for i in range(2)))
+    serialize_mock.assert_called_with([0, 1])
+
+
+def test_json_format_iter_serialize():
+    data = ({'a': i} for i in range(3))
+    chunks = list(formats.JsonFormat.iter_serialize(data))
+    assert len(chunks) == 4
+    assert json.loads(''.join(chunks)) == [{'a': 0}, {'a': 1}, {'a': 2}]
+
+
+def test_json_format_iter_serialize_empty():
+    assert list(formats.JsonFormat.iter_serialize([])) == ['[]']
+
+
+def test_json_format_iter_serialize_dict():
+    chunks = list(formats.JsonFormat.iter_serialize({'a': 1}))
+    assert chunks == [json.dumps({'a': 1})]
+
+
+def test_json_format_uses_backend():
+    backend = mock.Mock()
+    backend.loads.return_value = {'a': 1}
+    backend.dumps.return_value = '{"a":1}'
+
+    with patch.object(formats.JsonFormat, 'backend', backend):
+        assert formats.JsonFormat.unserialize('{"a":1}') == {'a': 1}
+        assert formats.JsonFormat.serialize({'a': 1}) == '{"a":1}'
+    backend.loads.assert_called_with('{"a":1}')
+    backend.dumps.assert_called_with({'a': 1})
+
+
+def test_json_format_backend_value_error():
+    backend = mock.Mock()
+    backend.loads.side_effect = ValueError('Wrong data')
+    backend.dumps.side_effect = ValueError('Wrong type object passed')
+
+    with patch.object(formats.JsonFormat, 'backend', backend):
+        with pytest.raises(formats.LoadError):
+            formats.JsonFormat.unserialize('')
+        with pytest.raises(formats.LoadError):
+            formats.JsonFormat.serialize({})
+
+
+def test_get_json_backend():
+    unavailable = mock.Mock(available=False)
+    available = mock.Mock(available=True)
+    assert formats.get_json_backend((unavailable, available)) == available
+    assert formats.get_json_backend((unavailable,)) == \
+        formats.StdlibJsonBackend
+
+
+@pytest.mark.parametrize('backend', [
+    formats.OrjsonBackend, formats.UjsonBackend
+])
+def test_json_backend_matches_stdlib(backend):
+    if not backend.available:
+        pytest.skip('{} is not installed'.format(backend.name))
+
+    data = {
+        'date_field': datetime.datetime(2015, 10, 6, 16, 29, 19),
+        'url': 'http://example.com/a',
+        'items': [1, 2.5, None, True, 'text'],
+    }
+    expected = json.loads(formats.StdlibJsonBackend.dumps(data))
+    assert json.loads(backend.dumps(data)) == expected
+    assert backend.loads(backend.dumps(data)) == expected
+
+
+def test_orjson_backend_falls_back_to_stdlib():
+    if not formats.OrjsonBackend.available:
+        pytest.skip('orjson is not installed')
+
+    data = {1: 2 ** 70}
+    assert formats.OrjsonBackend.dumps(data) == json.dumps(data)
+
+
+def test_ujson_supports_default():
+    ujson = mock.Mock()
+    with patch.object(formats, 'ujson', ujson):
+        assert formats._ujson_supports_default()
+        ujson.dumps.side_effect = TypeError(
+            "'default' is an invalid keyword argument for this function"
+        )
+        assert not formats._ujson_supports_default()
+
+    with patch.object(formats, 'ujson', None):
+        assert not formats._ujson_supports_default()
+
+
+def test_formatter_registry_skips_unavailable_formatter():
+    with patch.dict(formats._formatter_registry, {}, clear=True):
+        formats.FormatterRegistry(
+            'A', (formats.BaseFormatter,), {'name': 'a', 'available': False}
+        )
+        assert formats._formatter_registry == {}
+
+
+msgpack_required = pytest.mark.skipif(
+    not formats.MsgPackFormat.available, reason='msgpack is not installed'
+)
+
+
+@msgpack_required
+def test_msgpack_format_params():
+    assert formats.MsgPackFormat.name == 'msgpack'
+    assert formats.MsgPackFormat.accepts_bytes
+    assert formats.get_formatter('msgpack') == formats.MsgPackFormat
+
+
+@msgpack_required
+def test_msgpack_format_serialize_unserialize():
+    data = {'test': 1, 'list': [1.5, None, 'text'], 'bin': b'\x00\x01'}
+    serialized = formats.MsgPackFormat.serialize(data)
+    assert isinstance(serialized, bytes)
+    assert formats.MsgPackFormat.unserialize(serialized) == data
+
+
+@msgpack_required
+def test_msgpack_format_serialize_datetime():
+    date = datetime.datetime(2015, 10, 6, 16, 29, 19)
+    serialized = formats.MsgPackFormat.serialize({'date_field': date})
+    assert formats.MsgPackFormat.unserialize(serialized) == json.loads(
+        json.dumps({'date_field': date}, cls=formats.DateTimeEncoder)
+    )
+
+
+@msgpack_required
+def test_msgpack_format_iter_serialize_generator():
+    data = ({'a': i} for i in range(2))
+    serialized = b''.join(formats.MsgPackFormat.iter_serialize(data))
+    assert formats.MsgPackFormat.unserialize(serialized) == [
+        {'a': 0}, {'a': 1}
+    ]
+
+
+@msgpack_required
+def test_msgpack_format_unserialize_error():
+    with pytest.raises(formats.LoadError):
+        formats.MsgPackFormat.unserialize(b'\xc1')
+    with pytest.raises(formats.LoadError):
+        formats.MsgPackFormat.unserialize(b'\x92\x01')
+
+
+bytes_test_data = {'test': 1, 'test2': [{'a': 1}, 'text', None]}
+
+
+def test_json_format_unserialize_bytes():
+    assert formats.JsonFormat.accepts_bytes
+    serialized = json.dumps(bytes_test_data).encode('utf-8')
+    assert formats.JsonFormat.unserialize(serialized) == bytes_test_data
+    assert formats.JsonFormat.unserialize(memoryview(serialized)) == \
+        bytes_test_data
+
+
+@pytest.mark.parametrize('backend', [
+    formats.OrjsonBackend, formats.UjsonBackend
+])
+def test_json_backend_loads_buffers(backend):
+    if not backend.available:
+        pytest.skip('{} is not installed'.format(backend.name))
+
+    serialized = json.dumps(bytes_test_data).encode('utf-8')
+    assert backend.loads(serialized) == bytes_test_data
+    assert backend.loads(memoryview(serialized)) == bytes_test_data
+
+
+arrow_required = pytest.mark.skipif(
+    not formats.ArrowFormat.available, reason='pyarrow is not installed'
+)
+
+
+@arrow_required
+def test_arrow_format_params():
+    assert formats.ArrowFormat.name == 'arrow'
+    assert formats.ArrowFormat.accepts_bytes
+    assert formats.ArrowFormat.columnar
+    assert formats.get_formatter('arrow') == formats.ArrowFormat
+
+
+@arrow_required
+def test_arrow_format_serialize_columns_schema():
+    import pyarrow
+    from restea import columnar, fields
+
+    field_set = fields.FieldSet(
+        id=fields.Integer(), name=fields.String(), active=fields.Boolean(),
+        created=fields.DateTime(),
+        tags=fields.CommaSeparatedListField(),
+    )
+    date = datetime.datetime(2015, 10, 6, 16, 29, 19)
+    columns = columnar.Columns({
+        'id': [1, 2], 'name': ['a', None], 'active': [True, False],
+        'created': [date, 1444148959000], 'tags': [['x'], []],
+        'score': [1.5, 2.5],
+    }, ['id', 'name', 'active', 'created', 'tags', 'score'])
+
+    serialized = formats.ArrowFormat.serialize_columns(columns, field_set)
+    schema = pyarrow.ipc.open_stream(serialized).schema
+    assert schema.names == columns.columns
+    assert schema.types == [
+        pyarrow.int64(), pyarrow.string(), pyarrow.bool_(),
+        pyarrow.timestamp('ms'), pyarrow.list_(pyarrow.string()),
+        pyarrow.float64(),
+    ]
+    assert formats.ArrowFormat.unserialize(memoryview(serialized)) == [
+        {
+            'id': 1, 'name': 'a', 'active': True, 'created': date,
+            'tags': ['x'], 'score': 1.5,
+        },
+        {
+            'id': 2, 'name': None, 'active': False, 'created': date,
+            'tags': [], 'score': 2.5,
+        },
+    ]
+
+
+@arrow_required
+def test_arrow_format_comma_separated_list_types():
+    import pyarrow
+    from restea import fields
+
+    get_type = formats.ArrowFormat.get_type
+    assert get_type(fields.CommaSeparatedListField(cast_func=int)) == (
+        pyarrow.list_(pyarrow.int64())
+    )
+    assert get_type(fields.CommaSeparatedListField(cast_func=float)) == (
+        pyarrow.list_(pyarrow.float64())
+    )
+    assert get_type(fields.CommaSeparatedListField()) == (
+        pyarrow.list_(pyarrow.string())
+    )
+    assert get_type(
+        fields.CommaSeparatedListField(cast_func=lambda value: value)
+    ) is None
+
+
+@arrow_required
+def test_arrow_format_serialize_int_list_column():
+    import pyarrow
+    from restea import columnar, fields
+
+    field_set = fields.FieldSet(
+        ids=fields.CommaSeparatedListField(cast_func=int)
+    )
+    columns = columnar.Columns({'ids': [[1, 2], [3]]})
+
+    serialized = formats.ArrowFormat.serialize_columns(columns, field_set)
+    schema = pyarrow.ipc.open_stream(serialized).schema
+    assert schema.types == [pyarrow.list_(pyarrow.int64())]
+    assert formats.ArrowFormat.unserialize(serialized) == [
+        {'ids': [1, 2]}, {'ids': [3]}
+    ]
+
+
+@arrow_required
+def test_arrow_format_serialize_rows():
+    serialized = formats.ArrowFormat.serialize([{'a': 1}, {'b': 'x'}])
+    assert formats.ArrowFormat.unserialize(serialized) == [
+        {'a': 1, 'b': None}, {'a': None, 'b': 'x'}
+    ]
+    serialized = formats.ArrowFormat.serialize({'a': 1})
+    assert formats.ArrowFormat.unserialize(serialized) == [{'a': 1}]
+
+
+@arrow_required
+def test_arrow_format_errors():
+    from restea import columnar, fields
+
+    with pytest.raises(formats.LoadError):
+        formats.ArrowFormat.unserialize(b'not arrow')
+    with pytest.raises(formats.LoadError):
+        formats.ArrowFormat.serialize(['text'])
+    with pytest.raises(formats.LoadError):
+        formats.ArrowFormat.serialize_columns(
+            columnar.Columns({'id': ['x']}),
+            fields.FieldSet(id=fields.Integer())
+        )
+
+
+def test_ndjson_format_params():
+    assert formats.NdjsonFormat.incremental
+    assert not formats.JsonFormat.incremental
+    assert formats.get_formatter('ndjson') == formats.NdjsonFormat
+
+
+def test_ndjson_format_serialize():
+    serialized = formats.NdjsonFormat.serialize([{'a': 1}, [2]])
+    assert serialized.endswith('\n')
+    assert [json.loads(line) for line in serialized.splitlines()] == [
+        {'a': 1}, [2]
+    ]
+    assert json.loads(formats.NdjsonFormat.serialize({'a': 1})) == {'a': 1}
+    assert formats.NdjsonFormat.serialize([]) == ''
+
+
+def test_ndjson_format_iter_serialize():
+    assert list(formats.NdjsonFormat.iter_serialize(iter([1, 'a']))) == [
+        '1\n', '"a"\n'
+    ]
+
+
+def test_ndjson_format_unserialize():
+    data = b'{"a": 1}\r\n\n[2]\n"text"'
+    assert formats.NdjsonFormat.unserialize(data) == [{'a': 1}, [2], 'text']
+    assert formats.NdjsonFormat.unserialize(memoryview(data)) == \
+        [{'a': 1}, [2], 'text']
+    assert formats.NdjsonFormat.unserialize(u'{"a": 1}\n') == [{'a': 1}]
+    with pytest.raises(formats.LoadError):
+        formats.NdjsonFormat.unserialize(b'{"a": 1}\n{')
+
+
+def test_ndjson_format_iter_unserialize():
+    chunks = [b'{"a"', b': 1}\n{"b": 2}\n[', b'3]', b'']
+    items = formats.NdjsonFormat.iter_unserialize(iter(chunks))
+    assert next(items) == {'a': 1}
+    assert list(items) == [{'b': 2}, [3]]
+
+    with pytest.raises(formats.LoadError):
+        list(formats.NdjsonFormat.iter_unserialize([b'1\n{\n2']))
+
+
+def test_base_formatter_iter_unserialize_should_be_abstract():
+    with pytest.raises(NotImplementedError):
+        list(formats.BaseFormatter.iter_unserialize([b'']))
+
+
+def test_json_format_is_list_payload():
+    assert formats.JsonFormat.is_list_payload(b' \n\t[{"a": 1}]')
+    assert formats.JsonFormat.is_list_payload(u'[')
+    assert formats.JsonFormat.is_list_payload(memoryview(b'  [1]'))
+    assert not formats.JsonFormat.is_list_payload(b' {"a": [1]}')
+    assert not formats.JsonFormat.is_list_payload(u'"["')
+    assert not formats.JsonFormat.is_list_payload(b'  ')
+
+
+def test_base_formatter_is_list_payload_unserializes():
+    with patch.object(formats.BaseFormatter, 'unserialize') as unserialize:
+        unserialize.return_value = [1]
+        assert formats.BaseFormatter.is_list_payload(b'data')
+        unserialize.return_value = {}
+        assert not formats.BaseFormatter.is_list_payload(b'data')
+    unserialize.assert_called_with(b'data')
+
+
+@msgpack_required
+def test_msgpack_format_is_list_payload():
+    for data in ([], [1, 2], list(range(20)), list(range(70000))):
+        serialized = formats.MsgPackFormat.serialize(data)
+        assert formats.MsgPackFormat.is_list_payload(memoryview(serialized))
+    for data in ({}, {'a': [1]}, 'text', 1):
+        serialized = formats.MsgPackFormat.serialize(data)
+        assert not formats.MsgPackFormat.is_list_payload(serialized)
+    assert not formats.MsgPackFormat.is_list_payload(b'')
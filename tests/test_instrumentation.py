@@ -0,0 +1,66 @@
+import collections
+
+import mock
+
+from restea import instrumentation
+
+
+def create_measurement(**kwargs):
+    values = dict(
+        resource_name='res', method_name='show', status=200, total=0.002,
+        phases={'method': 0.0015, 'serialize': 0.0005},
+        request_size=None, response_size=100
+    )
+    values.update(kwargs)
+    return instrumentation.Measurement(**values)
+
+
+def test_format_server_timing():
+    phases = collections.OrderedDict([('parse', 0.0012), ('method', 0.01)])
+    assert instrumentation.format_server_timing(phases, 0.0125) == \
+        'parse;dur=1.200, method;dur=10.000, total;dur=12.500'
+
+
+def test_histogram():
+    histogram = instrumentation.Histogram((1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.add(value)
+
+    assert histogram.export() == {
+        'count': 4,
+        'sum': 56.5,
+        'buckets': [[1, 2], [10, 3], ['+Inf', 4]],
+    }
+
+
+def test_histogram_observer_export():
+    observer = instrumentation.HistogramObserver()
+    observer.observe(create_measurement())
+    observer.observe(create_measurement(total=0.02, response_size=None))
+    observer.observe(create_measurement(method_name='list'))
+
+    exported = observer.export()
+    assert sorted(exported['res']) == ['list', 'show']
+
+    show = exported['res']['show']
+    assert sorted(show) == ['method', 'response_size', 'serialize', 'total']
+    assert show['total']['count'] == 2
+    assert show['total']['sum'] == 0.022
+    assert show['response_size']['count'] == 1
+
+
+def test_histogram_observer_reset():
+    observer = instrumentation.HistogramObserver()
+    observer.observe(create_measurement())
+    observer.reset()
+    assert observer.export() == {}
+
+
+def test_base_observer_not_implemented():
+    observer = instrumentation.BaseObserver()
+    try:
+        observer.observe(mock.Mock())
+    except NotImplementedError:
+        pass
+    else:
+        assert False, 'NotImplementedError expected'
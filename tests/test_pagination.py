@@ -0,0 +1,75 @@
+import mock
+import pytest
+
+import restea.errors as errors
+from restea.pagination import (
+    KeysetPaginator,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def create_request(**params):
+    request = mock.Mock()
+    request.get.side_effect = params.get
+    return request
+
+
+def test_encode_decode_cursor():
+    cursor = encode_cursor([10, 'name'])
+    assert '=' not in cursor
+    assert decode_cursor(cursor) == (10, 'name')
+
+
+@pytest.mark.parametrize('cursor', ['!!!', encode_cursor([1])[:-2], 'e30'])
+def test_decode_cursor_malformed(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+def test_get_page_defaults():
+    paginator = KeysetPaginator(default_limit=10)
+    assert paginator.get_page(create_request()) == Page(None, 10)
+
+
+def test_get_page_with_cursor_and_limit():
+    paginator = KeysetPaginator()
+    request = create_request(cursor=encode_cursor([5]), limit='3')
+    assert paginator.get_page(request) == Page((5,), 3)
+
+
+@pytest.mark.parametrize('params', [
+    {'limit': '0'},
+    {'limit': '101'},
+    {'limit': 'many'},
+    {'cursor': 'broken!'},
+    {'cursor': encode_cursor([1, 2])},
+])
+def test_get_page_invalid(params):
+    paginator = KeysetPaginator()
+    with pytest.raises(errors.BadRequestError):
+        paginator.get_page(create_request(**params))
+
+
+def test_paginate():
+    paginator = KeysetPaginator()
+    items = ({'id': i} for i in range(100))
+
+    page, cursor = paginator.paginate(items, Page(None, 2))
+    assert page == [{'id': 0}, {'id': 1}]
+    assert decode_cursor(cursor) == (1,)
+    assert next(items) == {'id': 3}
+
+
+def test_paginate_last_page():
+    paginator = KeysetPaginator()
+    page, cursor = paginator.paginate([{'id': 1}], Page((0,), 1))
+    assert page == [{'id': 1}]
+    assert cursor is None
+
+
+def test_get_link():
+    paginator = KeysetPaginator()
+    assert paginator.get_link('abc', Page(None, 5)) == \
+        '<?cursor=abc&limit=5>; rel="next"'
@@ -0,0 +1,163 @@
+import pytest
+
+from restea import cache
+from restea import errors
+from restea import formats
+from restea import ratelimit
+from restea.resource import Resource
+from tests.helpers import create_request_mock
+
+
+class FakeClock(object):
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_limiter():
+    clock = FakeClock()
+    limiter = ratelimit.TokenBucketLimiter(rate=2, burst=3, clock=clock)
+
+    assert [limiter.acquire('key') for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire('key') == 0.5
+    assert limiter.acquire('other') == 0
+
+    clock.now += 0.5
+    assert limiter.acquire('key') == 0
+    assert limiter.acquire('key') == 0.5
+
+
+def test_sliding_window_limiter():
+    clock = FakeClock(1000.0)
+    limiter = ratelimit.SlidingWindowLimiter(limit=4, window=10, clock=clock)
+
+    assert [limiter.acquire('key') for _ in range(4)] == [0, 0, 0, 0]
+    assert limiter.acquire('key') == 10
+
+    # half of the previous window is still counted
+    clock.now = 1015.0
+    assert [limiter.acquire('key') for _ in range(2)] == [0, 0]
+    assert limiter.acquire('key') == pytest.approx(2.5)
+
+    clock.now = 1030.0
+    assert limiter.acquire('key') == 0
+
+
+#: limiter shared by limited resources, its state is reset for every test
+# by `limiter_backend` fixture
+limiter = ratelimit.TokenBucketLimiter(rate=1, clock=FakeClock())
+
+
+@pytest.fixture(autouse=True)
+def limiter_backend(monkeypatch):
+    monkeypatch.setattr(limiter, 'backend', cache.LocalCacheBackend())
+
+
+def get_user(request):
+    return request.headers.get('HTTP_X_USER')
+
+
+class LimitedResource(Resource):
+    decorators = [ratelimit.RateLimit(limiter)]
+
+    def list(self):
+        return []
+
+    def show(self, iden):
+        return {'iden': iden}
+
+
+class ShowLimitedResource(LimitedResource):
+    decorators = [ratelimit.RateLimit(limiter, methods=('show',))]
+
+
+class ApiKeyLimitedResource(LimitedResource):
+    decorators = [ratelimit.RateLimit(limiter, client_header='X-Api-Key')]
+
+
+class IdentifiedLimitedResource(LimitedResource):
+    decorators = [ratelimit.RateLimit(limiter, fallback_key=None)]
+
+
+class UserLimitedResource(LimitedResource):
+    decorators = [ratelimit.RateLimit(limiter, key_func=get_user)]
+
+
+def dispatch_helper(
+    resource_class, address='127.0.0.1', headers=None, **kwargs
+):
+    request = create_request_mock(
+        method='GET', headers=headers or {}, remote_addr=address
+    )
+    return resource_class(request, formats.JsonFormat).dispatch(**kwargs)
+
+
+def test_rate_limit_decorator():
+    assert dispatch_helper(LimitedResource)[1] == 200
+    res = dispatch_helper(LimitedResource)
+    assert res[1] == 429
+    assert res[3] == {'Retry-After': 1}
+
+    assert dispatch_helper(LimitedResource, iden='1')[1] == 200
+    assert dispatch_helper(LimitedResource, address='127.0.0.2')[1] == 200
+
+
+def test_rate_limit_decorator_methods():
+    assert [
+        dispatch_helper(ShowLimitedResource)[1] for _ in range(3)
+    ] == [200, 200, 200]
+    assert [
+        dispatch_helper(ShowLimitedResource, iden='1')[1] for _ in range(2)
+    ] == [200, 429]
+
+
+def test_rate_limit_decorator_client_header():
+    assert dispatch_helper(
+        ApiKeyLimitedResource, headers={'HTTP_X_API_KEY': 'a'}
+    )[1] == 200
+    assert dispatch_helper(
+        ApiKeyLimitedResource,
+        address='127.0.0.2', headers={'HTTP_X_API_KEY': 'a'}
+    )[1] == 429
+    assert dispatch_helper(
+        ApiKeyLimitedResource, headers={'HTTP_X_API_KEY': 'b'}
+    )[1] == 200
+
+
+def test_rate_limit_decorator_unidentified_client():
+    assert dispatch_helper(LimitedResource, address=None)[1] == 200
+    assert dispatch_helper(LimitedResource, address='')[1] == 429
+    assert dispatch_helper(LimitedResource)[1] == 200
+
+    assert dispatch_helper(
+        ApiKeyLimitedResource, headers={'HTTP_X_API_KEY': ''}
+    )[1] == 200
+    assert dispatch_helper(ApiKeyLimitedResource)[1] == 429
+
+
+def test_rate_limit_decorator_unidentified_client_not_limited():
+    assert [
+        dispatch_helper(IdentifiedLimitedResource, address=None)[1]
+        for _ in range(3)
+    ] == [200, 200, 200]
+    assert [
+        dispatch_helper(IdentifiedLimitedResource)[1] for _ in range(2)
+    ] == [200, 429]
+
+
+def test_rate_limit_decorator_key_func():
+    assert dispatch_helper(
+        UserLimitedResource, headers={'HTTP_X_USER': 'a'}
+    )[1] == 200
+    assert dispatch_helper(
+        UserLimitedResource, address='127.0.0.2', headers={'HTTP_X_USER': 'a'}
+    )[1] == 429
+    assert dispatch_helper(
+        UserLimitedResource, headers={'HTTP_X_USER': 'b'}
+    )[1] == 200
+
+
+def test_too_many_requests_error():
+    assert errors.TooManyRequestsError.http_code == 429
@@ -1,14 +1,27 @@
+import abc
 import collections
+import datetime
+import gzip
+import io
 import json
+import zlib
 import mock
 import pytest
+import six
 
 from mock import patch
 
+from restea import cache
+from restea import columnar
+from restea import compression
 from restea import errors
 from restea import formats
 from restea import fields
+from restea import instrumentation
+from restea import pagination
+from restea import resource
 from restea.resource import Resource
+from tests.helpers import create_request_mock
 
 
 def create_resource_helper(
@@ -17,14 +30,30 @@ def create_resource_helper(
     data=None,
     formatter=None
 ):
-    request = mock.Mock(method=method, headers=headers, data=data)
+    request = create_request_mock(
+        method=method, headers=headers, data=data, raw_data=data
+    )
 
     if not formatter:
-        formatter = mock.Mock()
+        formatter = mock.Mock(accepts_bytes=False)
 
     return Resource(request, formatter), request, formatter
 
 
+def create_json_resource_helper(
+    resource_class,
+    method='GET',
+    headers=None,
+    data=None,
+    params=None
+):
+    request = create_request_mock(
+        method=method, headers=headers or {}, data=data, raw_data=data
+    )
+    request.get.side_effect = (params or {}).get
+    return resource_class(request, formats.JsonFormat)
+
+
 def test_init():
     resource, req_mock, formatter_mock = create_resource_helper()
     assert resource.request == req_mock
@@ -444,3 +473,973 @@ def test_headers_with_failed_response(process_mock):
     assert status == 503
     assert content_type == 'application/json'
     assert headers == collections.OrderedDict([('foo', 'bar')])
+
+
+class BulkResource(Resource):
+    fields = fields.FieldSet(
+        name=fields.String(required=True),
+        rating=fields.Integer(),
+    )
+
+    def create(self):
+        return self.payload
+
+    def bulk_create(self):
+        return [
+            errors.ConflictError('Duplicate', code=1)
+            if item['name'] == 'dup' else item
+            for item in self.payload
+        ]
+
+
+def test_process_bulk_create():
+    data = json.dumps([{'name': 'a', 'rating': '1'}, {'name': 'dup'}])
+    request = create_request_mock(
+        method='POST', headers={}, data=data, raw_data=data
+    )
+    resource = BulkResource(request, formats.JsonFormat)
+
+    res = json.loads(resource.process())
+    assert res == [
+        {'status': 200, 'data': {'name': 'a', 'rating': 1}},
+        {'status': 409, 'error': 'Duplicate', 'code': 1},
+    ]
+    assert resource.payload == [{'name': 'a', 'rating': 1}, {'name': 'dup'}]
+
+
+def test_process_bulk_create_with_dict_payload_calls_create():
+    data = json.dumps({'name': 'a'})
+    request = create_request_mock(
+        method='POST', headers={}, data=data, raw_data=data
+    )
+    resource = BulkResource(request, formats.JsonFormat)
+
+    assert json.loads(resource.process()) == {'name': 'a'}
+
+
+def test_process_bulk_create_validation_fails():
+    data = json.dumps([{'name': 'a'}, {'rating': 1}, {'name': 1}])
+    request = create_request_mock(
+        method='POST', headers={}, data=data, raw_data=data
+    )
+    resource = BulkResource(request, formats.JsonFormat)
+
+    with pytest.raises(errors.BadRequestError) as e:
+        resource.process()
+    assert str(e.value) == '2 of 3 items failed validation'
+    assert e.value.info['errors'] == [
+        {'index': 1, 'error': 'Field "name" is missing'},
+        {'index': 2, 'error': 'Field "name" is not a string'},
+    ]
+
+
+def create_ndjson_request(chunks):
+    request = create_request_mock(method='POST', headers={})
+    request.iter_body.return_value = iter(chunks)
+    return request
+
+
+def test_process_bulk_create_ndjson():
+    request = create_ndjson_request([
+        b'{"name": "a", "rating": "1"}\n{"na', b'me": "dup"}\n',
+    ])
+    resource = BulkResource(request, formats.NdjsonFormat)
+
+    res = resource.process()
+    assert not isinstance(res, str)
+    assert [json.loads(line) for line in res] == [
+        {'status': 200, 'data': {'name': 'a', 'rating': 1}},
+        {'status': 409, 'error': 'Duplicate', 'code': 1},
+    ]
+    request.iter_body.assert_called_once_with()
+    assert not hasattr(resource, '_payload_data')
+
+
+class StreamedBulkResource(BulkResource):
+    def bulk_create(self):
+        for item in self.payload:
+            yield item
+
+
+def test_process_bulk_create_ndjson_streamed():
+    request = create_ndjson_request([b'{"name": "a"}\n{"name": "b"}\n'])
+    resource = StreamedBulkResource(request, formats.NdjsonFormat)
+
+    lines = resource.process()
+    # request body is read while response is written
+    request.iter_body.assert_not_called()
+    assert json.loads(next(lines)) == {'status': 200, 'data': {'name': 'a'}}
+    assert json.loads(next(lines)) == {'status': 200, 'data': {'name': 'b'}}
+    assert list(lines) == []
+
+
+@pytest.mark.parametrize('resource_class', [
+    BulkResource, StreamedBulkResource
+])
+def test_process_bulk_create_ndjson_validation_fails(resource_class):
+    request = create_ndjson_request([
+        b'{"name": "a"}\n{"rating": 1}\n{"name": "b"}\n'
+    ])
+    resource = resource_class(request, formats.NdjsonFormat)
+
+    assert [json.loads(line) for line in resource.process()] == [
+        {'status': 200, 'data': {'name': 'a'}},
+        {'status': 400, 'index': 1, 'error': 'Field "name" is missing'},
+    ]
+
+
+@pytest.mark.parametrize('resource_class', [
+    BulkResource, StreamedBulkResource
+])
+def test_process_bulk_create_ndjson_load_error(resource_class):
+    request = create_ndjson_request([b'{"name": "a"}\n{"name"\n'])
+    resource = resource_class(request, formats.NdjsonFormat)
+
+    assert [json.loads(line) for line in resource.process()] == [
+        {'status': 200, 'data': {'name': 'a'}},
+        {'status': 400, 'index': 1, 'error': 'Fail to load the data'},
+    ]
+
+
+def test_process_list_ndjson_is_streamed():
+    class ListResource(Resource):
+        def list(self):
+            return [{'id': 1}, {'id': 2}]
+
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+    request.get.return_value = None
+    content = ListResource(request, formats.NdjsonFormat).process()
+
+    assert [json.loads(line) for line in content] == [{'id': 1}, {'id': 2}]
+
+
+def test_process_bulk_create_rejected_before_payload_is_parsed():
+    def reject(func):
+        def wrapper(resource, *args, **kwargs):
+            raise errors.ForbiddenError('Forbidden')
+        return wrapper
+
+    class RejectingBulkResource(BulkResource):
+        decorators = [reject]
+
+    data = json.dumps([{'name': 'a'}])
+    request = create_request_mock(
+        method='POST', headers={}, data=data, raw_data=data
+    )
+    resource = RejectingBulkResource(request, formats.JsonFormat)
+
+    with patch.object(formats.JsonFormat, 'unserialize') as unserialize:
+        with pytest.raises(errors.ForbiddenError):
+            resource.process()
+    assert resource._is_bulk
+    assert not unserialize.called
+
+
+def test_process_bulk_create_with_invalid_list_payload():
+    data = '[{"name": "a"'
+    request = create_request_mock(
+        method='POST', headers={}, data=data, raw_data=data
+    )
+    resource = BulkResource(request, formats.JsonFormat)
+
+    with pytest.raises(errors.BadRequestError) as e:
+        resource.process()
+    assert str(e.value) == 'Fail to load the data'
+
+
+def test_process_bulk_method_not_implemented():
+    data = json.dumps([{'name': 'a'}])
+    request = create_request_mock(
+        method='PUT', headers={}, data=data, raw_data=data
+    )
+    resource = BulkResource(request, formats.JsonFormat)
+
+    with pytest.raises(errors.BadRequestError) as e:
+        resource.process()
+    assert 'Given method requires iden' in str(e.value)
+
+
+def test_process_stream_list():
+    resource, _, _ = create_resource_helper(formatter=formats.JsonFormat)
+    resource.stream = True
+    type(resource).list = mock.Mock(return_value=iter([{'a': 1}, {'a': 2}]))
+
+    res = resource.process()
+    assert not isinstance(res, str)
+    assert json.loads(''.join(res)) == [{'a': 1}, {'a': 2}]
+
+
+@pytest.mark.skipif(
+    not formats.MsgPackFormat.available, reason='msgpack is not installed'
+)
+def test_process_stream_list_msgpack():
+    resource, _, _ = create_resource_helper(formatter=formats.MsgPackFormat)
+    resource.stream = True
+    type(resource).list = mock.Mock(return_value=iter([{'a': 1}, {'a': 2}]))
+
+    res = b''.join(resource.process())
+    assert formats.MsgPackFormat.unserialize(res) == [{'a': 1}, {'a': 2}]
+
+
+@patch.object(formats.JsonFormat, 'serialize')
+def test_process_stream_show_is_not_streamed(serialize_mock):
+    serialize_mock.return_value = '{}'
+    resource, _, _ = create_resource_helper(formatter=formats.JsonFormat)
+    resource.stream = True
+    type(resource).show = mock.Mock(return_value={})
+
+    assert resource.process(iden=10) == '{}'
+
+
+def test_get_payload_uses_raw_data_if_formatter_accepts_bytes():
+    request = create_request_mock(
+        method='PUT', headers={}, data='data', raw_data=b'data'
+    )
+    formatter = mock.Mock(accepts_bytes=True)
+    formatter.unserialize.return_value = {}
+    resource = Resource(request, formatter)
+
+    assert resource._get_payload('edit') == {}
+    formatter.unserialize.assert_called_with(b'data')
+
+
+def test_dispatch_table_applies_decorators_once():
+    decorator = mock.Mock(side_effect=lambda func: func)
+
+    class DecoratedResource(Resource):
+        decorators = [decorator]
+
+        def show(self, iden):
+            return {'iden': iden}
+
+    call_counts = []
+    for iden in (1, 2):
+        request = create_request_mock(
+            method='GET', headers={}, data=None, raw_data=None
+        )
+        resource = DecoratedResource(request, formats.JsonFormat)
+        assert json.loads(resource.process(iden=iden)) == {'iden': iden}
+        call_counts.append(decorator.call_count)
+
+    assert call_counts[0] > 0
+    assert call_counts[0] == call_counts[1]
+
+
+def test_dispatch_table_reset_on_class_change():
+    class ParentResource(Resource):
+        def show(self, iden):
+            return {'version': 1}
+
+    class ChildResource(ParentResource):
+        pass
+
+    def process():
+        request = create_request_mock(
+            method='GET', headers={}, data=None, raw_data=None
+        )
+        return json.loads(
+            ChildResource(request, formats.JsonFormat).process(iden=1)
+        )
+
+    assert process() == {'version': 1}
+    ParentResource.show = lambda self, iden: {'version': 2}
+    # table is kept until it's reset
+    assert process() == {'version': 1}
+    ParentResource.reset_dispatch_table()
+    assert process() == {'version': 2}
+
+
+def test_dispatch_table_uses_instance_attributes():
+    class DecoratedResource(Resource):
+        def show(self, iden):
+            return {'iden': iden}
+
+    def process(decorators=None):
+        request = create_request_mock(
+            method='GET', headers={}, data=None, raw_data=None
+        )
+        resource = DecoratedResource(request, formats.JsonFormat)
+        if decorators is not None:
+            resource.decorators = decorators
+        return json.loads(resource.process(iden=1))
+
+    assert process() == {'iden': 1}
+    assert process([
+        lambda func: lambda resource, iden: {'decorated': iden}
+    ]) == {'decorated': 1}
+    assert process() == {'iden': 1}
+
+
+def test_resource_with_abstract_base_class():
+    class AbstractResource(six.with_metaclass(abc.ABCMeta, Resource)):
+        @abc.abstractmethod
+        def get_item(self, iden):
+            pass
+
+        def show(self, iden):
+            return self.get_item(iden)
+
+    class ItemResource(AbstractResource):
+        def get_item(self, iden):
+            return {'iden': iden}
+
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+    with pytest.raises(TypeError):
+        AbstractResource(request, formats.JsonFormat)
+
+    resource = ItemResource(request, formats.JsonFormat)
+    assert json.loads(resource.process(iden=1)) == {'iden': 1}
+
+
+def test_dispatch_entry_errors():
+    resource, _, _ = create_resource_helper(method='PUT')
+    with pytest.raises(errors.BadRequestError) as e:
+        resource._get_dispatch_entry(has_iden=False)
+    assert 'Given method requires iden' in str(e.value)
+
+    resource, _, _ = create_resource_helper(method='HEAD')
+    with pytest.raises(errors.MethodNotAllowedError) as e:
+        resource._get_dispatch_entry(has_iden=True)
+    assert 'Method "HEAD" is not supported' in str(e.value)
+
+    resource, _, _ = create_resource_helper(method='DELETE')
+    with pytest.raises(errors.BadRequestError) as e:
+        resource._get_dispatch_entry(has_iden=True)
+    assert 'Method "DELETE" is not implemented' in str(e.value)
+
+
+def record_auth(func):
+    def wrapper(resource, *args, **kwargs):
+        resource.calls.append('auth')
+        return func(resource, *args, **kwargs)
+    return wrapper
+
+
+class CachedResource(Resource):
+    cache_params = ('q',)
+    decorators = [record_auth]
+    fields = fields.FieldSet(name=fields.String())
+    calls = None
+
+    def show(self, iden):
+        self.calls.append('show')
+        self.set_header('X-Show', iden)
+        return {'iden': iden}
+
+    def edit(self, iden):
+        self.calls.append('edit')
+        return self.payload
+
+
+@pytest.fixture
+def cached_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(CachedResource, 'cache', cache.ResponseCache())
+    monkeypatch.setattr(CachedResource, 'calls', calls)
+    return calls
+
+
+def test_dispatch_cached_response(cached_calls):
+    first = create_json_resource_helper(CachedResource).dispatch(iden='1')
+    assert create_json_resource_helper(CachedResource).dispatch(
+        iden='1'
+    ) == first
+    assert first[3] == {'X-Show': '1'}
+    assert cached_calls == ['auth', 'show', 'auth']
+
+    create_json_resource_helper(CachedResource).dispatch(iden='2')
+    create_json_resource_helper(
+        CachedResource, params={'q': 'query'}
+    ).dispatch(iden='1')
+    assert cached_calls == [
+        'auth', 'show', 'auth', 'auth', 'show', 'auth', 'show'
+    ]
+
+
+def test_dispatch_cached_response_invalidated(cached_calls):
+    create_json_resource_helper(CachedResource).dispatch(iden='1')
+    create_json_resource_helper(
+        CachedResource, method='PUT', data=json.dumps({'name': 'a'})
+    ).dispatch(iden='1')
+    create_json_resource_helper(CachedResource).dispatch(iden='1')
+    assert cached_calls == ['auth', 'show', 'auth', 'edit', 'auth', 'show']
+
+
+def test_dispatch_cached_response_not_invalidated_on_error(cached_calls):
+    create_json_resource_helper(CachedResource).dispatch(iden='1')
+    res = create_json_resource_helper(
+        CachedResource, method='PUT', data=json.dumps({'name': 1})
+    ).dispatch(iden='1')
+    assert res[1] == 400
+    create_json_resource_helper(CachedResource).dispatch(iden='1')
+    assert cached_calls == ['auth', 'show', 'auth', 'edit', 'auth']
+
+
+def test_process_payload_is_loaded_lazily():
+    class LazyResource(Resource):
+        def delete(self, iden):
+            return iden
+
+        def edit(self, iden):
+            return self.payload
+
+    request = create_request_mock(
+        method='DELETE', headers={}, data='{broken', raw_data='{broken'
+    )
+    resource = LazyResource(request, formats.JsonFormat)
+    assert resource.process(iden='1') == '"1"'
+
+    request.method = 'PUT'
+    resource = LazyResource(request, formats.JsonFormat)
+    with pytest.raises(errors.BadRequestError):
+        resource.process(iden='1')
+
+
+class ConditionalResource(Resource):
+    conditional = True
+    calls = None
+
+    def show(self, iden):
+        self.calls.append('show')
+        return {'iden': iden}
+
+
+class VersionedResource(ConditionalResource):
+    def get_etag(self, method_name, *args, **kwargs):
+        return 'v1'
+
+
+class ModifiedResource(ConditionalResource):
+    def get_last_modified(self, method_name, *args, **kwargs):
+        return datetime.datetime(2015, 10, 21, 7, 28, 0)
+
+
+@pytest.fixture
+def conditional_calls(monkeypatch):
+    calls = []
+    monkeypatch.setattr(ConditionalResource, 'calls', calls)
+    return calls
+
+
+def test_dispatch_conditional_content_etag(conditional_calls):
+    res, status, _, headers = create_json_resource_helper(
+        ConditionalResource
+    ).dispatch(iden='1')
+    assert status == 200
+    etag = headers['ETag']
+    assert etag.startswith('"') and etag.endswith('"')
+
+    res, status, _, headers = create_json_resource_helper(
+        ConditionalResource,
+        headers={'HTTP_IF_NONE_MATCH': 'W/"other", ' + etag}
+    ).dispatch(iden='1')
+    assert (res, status) == ('', 304)
+    assert headers['ETag'] == etag
+
+    res, status, _, headers = create_json_resource_helper(
+        ConditionalResource, headers={'HTTP_IF_NONE_MATCH': etag}
+    ).dispatch(iden='2')
+    assert status == 200
+    assert headers['ETag'] != etag
+    assert conditional_calls == ['show', 'show', 'show']
+
+
+def test_dispatch_conditional_version_etag_skips_method(conditional_calls):
+    res, status, _, headers = create_json_resource_helper(
+        VersionedResource, headers={'HTTP_IF_NONE_MATCH': '"v1"'}
+    ).dispatch(iden=1)
+    assert (res, status) == ('', 304)
+    assert headers['ETag'] == '"v1"'
+    assert conditional_calls == []
+
+    res, status, _, headers = create_json_resource_helper(
+        VersionedResource, headers={'HTTP_IF_NONE_MATCH': '"v0"'}
+    ).dispatch(iden=1)
+    assert status == 200
+    assert headers['ETag'] == '"v1"'
+    assert conditional_calls == ['show']
+
+
+def test_dispatch_conditional_last_modified(conditional_calls):
+    res, status, _, headers = create_json_resource_helper(
+        ModifiedResource,
+        headers={'HTTP_IF_MODIFIED_SINCE': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+    ).dispatch(iden=1)
+    assert (res, status) == ('', 304)
+    assert headers['Last-Modified'] == 'Wed, 21 Oct 2015 07:28:00 GMT'
+    assert conditional_calls == []
+
+    res, status, _, headers = create_json_resource_helper(
+        ModifiedResource,
+        headers={'HTTP_IF_MODIFIED_SINCE': 'Wed, 21 Oct 2015 07:27:59 GMT'}
+    ).dispatch(iden=1)
+    assert status == 200
+    res, status, _, headers = create_json_resource_helper(
+        ModifiedResource, headers={'HTTP_IF_MODIFIED_SINCE': 'not a date'}
+    ).dispatch(iden=1)
+    assert status == 200
+    assert conditional_calls == ['show', 'show']
+
+
+def test_dispatch_conditional_cached_response():
+    calls = []
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+
+    class CachedConditionalResource(Resource):
+        conditional = True
+        cache = cache.ResponseCache()
+
+        def show(self, iden):
+            calls.append('show')
+            return {'iden': iden}
+
+    _, _, _, headers = CachedConditionalResource(
+        request, formats.JsonFormat
+    ).dispatch(iden=1)
+    request.headers = {'HTTP_IF_NONE_MATCH': headers['ETag']}
+    res, status, _, _ = CachedConditionalResource(
+        request, formats.JsonFormat
+    ).dispatch(iden=1)
+    assert (res, status) == ('', 304)
+    assert calls == ['show']
+
+
+class ProjectionResource(Resource):
+    projection_param = 'fields'
+
+    def list(self):
+        return [
+            {'id': 1, 'name': 'a', 'rating': 5},
+            {'id': 2, 'name': 'b'},
+        ]
+
+    def show(self, iden):
+        assert self.projection == frozenset(['id', 'name'])
+        return {'id': iden, 'name': 'a', 'rating': 5}
+
+
+def test_process_projection_show():
+    resource = create_json_resource_helper(
+        ProjectionResource, params={'fields': 'id, name,'}
+    )
+    assert json.loads(resource.process(iden='1')) == {'id': '1', 'name': 'a'}
+
+
+def test_process_projection_list():
+    resource = create_json_resource_helper(
+        ProjectionResource, params={'fields': 'name'}
+    )
+    assert json.loads(resource.process()) == [{'name': 'a'}, {'name': 'b'}]
+
+    resource = create_json_resource_helper(ProjectionResource)
+    assert json.loads(resource.process()) == [
+        {'id': 1, 'name': 'a', 'rating': 5},
+        {'id': 2, 'name': 'b'},
+    ]
+
+
+class ProjectionFieldsResource(ProjectionResource):
+    fields = fields.FieldSet(id=fields.Integer(), name=fields.String())
+
+
+@pytest.mark.parametrize('value,expected', [
+    ('id,name', frozenset(['id', 'name'])),
+    ('name,unknown', frozenset(['name'])),
+    ('unknown', None),
+    (',', None),
+])
+def test_get_projection_known_fields(value, expected):
+    resource = create_json_resource_helper(
+        ProjectionFieldsResource, params={'fields': value}
+    )
+    assert resource._get_projection('list') == expected
+
+
+def test_get_projection_empty():
+    resource = create_json_resource_helper(
+        ProjectionResource, params={'fields': ' , '}
+    )
+    assert resource._get_projection('list') is None
+    assert len(json.loads(resource.process())) == 2
+
+
+def test_get_projection_disabled_by_default():
+    resource, request, _ = create_resource_helper()
+    request.get.return_value = 'id'
+    assert resource._get_projection('list') is None
+
+
+def test_process_paginated_list():
+    class PaginatedResource(Resource):
+        paginator = pagination.KeysetPaginator(default_limit=2)
+
+        def list(self):
+            start = self.page.after[0] + 1 if self.page.after else 0
+            return [{'id': i} for i in range(start, 5)][:self.page.limit + 1]
+
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+    request.get.side_effect = {}.get
+    resource = PaginatedResource(request, formats.JsonFormat)
+    assert json.loads(resource.process()) == [{'id': 0}, {'id': 1}]
+
+    cursor = resource._response_headers['X-Next-Cursor']
+    assert resource._response_headers['Link'] == \
+        '<?cursor={}&limit=2>; rel="next"'.format(cursor)
+
+    request.get.side_effect = {'cursor': cursor, 'limit': '5'}.get
+    resource = PaginatedResource(request, formats.JsonFormat)
+    assert json.loads(resource.process()) == [
+        {'id': 2}, {'id': 3}, {'id': 4}
+    ]
+    assert 'Link' not in resource._response_headers
+
+
+class ObservedResource(Resource):
+    fields = fields.FieldSet(name=fields.String())
+
+    def show(self, iden):
+        return {'iden': iden}
+
+    def create(self):
+        return self.payload
+
+
+@pytest.fixture
+def observer(monkeypatch):
+    observer = mock.Mock(spec=instrumentation.BaseObserver)
+    monkeypatch.setattr(ObservedResource, 'observers', [observer])
+    return observer
+
+
+def test_dispatch_notifies_observers(observer):
+    data = json.dumps({'name': 'a'})
+    response = create_json_resource_helper(
+        ObservedResource, method='POST', data=data
+    ).dispatch()
+
+    measurement = observer.observe.call_args[0][0]
+    assert measurement.resource_name.endswith('.ObservedResource')
+    assert measurement.method_name == 'create'
+    assert measurement.status == 200
+    assert list(measurement.phases) == [
+        'resolve', 'prepare', 'decorators', 'method', 'validate', 'parse',
+        'handle', 'finish', 'serialize'
+    ]
+    assert abs(sum(measurement.phases.values()) - measurement.total) < 0.01
+    assert measurement.request_size == len(data)
+    assert measurement.response_size == len(response[0])
+
+
+def test_dispatch_notifies_observers_on_error(observer):
+    create_json_resource_helper(ObservedResource, method='PUT').dispatch(
+        iden='1'
+    )
+
+    measurement = observer.observe.call_args[0][0]
+    assert measurement.method_name is None
+    assert measurement.status == 400
+    assert measurement.request_size is None
+    assert list(measurement.phases) == ['resolve', 'serialize']
+
+
+def test_dispatch_without_timings_skips_measure():
+    data = json.dumps({'name': 'a'})
+    with patch.object(Resource, '_measure') as measure:
+        response = create_json_resource_helper(
+            ObservedResource, method='POST', data=data
+        ).dispatch()
+    assert response[1] == 200
+    assert json.loads(response[0]) == {'name': 'a'}
+    assert not measure.called
+
+
+def test_dispatch_without_observers_does_not_measure():
+    resource, _, _ = create_resource_helper()
+    assert resource._measure('prepare', lambda: 'result') == 'result'
+    assert resource._timings is None
+
+
+def test_dispatch_server_timing_header():
+    class TimedResource(Resource):
+        server_timing = 1
+
+        def show(self, iden):
+            return {'iden': iden}
+
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+    headers = TimedResource(request, formats.JsonFormat).dispatch(iden='1')[3]
+
+    metrics = [
+        metric.split(';')[0]
+        for metric in headers['Server-Timing'].split(', ')
+    ]
+    assert metrics == [
+        'resolve', 'prepare', 'decorators', 'method', 'handle', 'finish',
+        'serialize', 'total'
+    ]
+
+
+def test_dispatch_server_timing_header_sampled():
+    class TimedResource(Resource):
+        server_timing = 0.5
+
+        def show(self, iden):
+            return {'iden': iden}
+
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+    with patch('random.random', return_value=0.7):
+        resource = TimedResource(request, formats.JsonFormat)
+        assert 'Server-Timing' not in resource.dispatch(iden='1')[3]
+        assert resource._timings is None
+
+
+def test_constant_error():
+    error = errors.BadRequestError.constant('Constant')
+    assert isinstance(error, errors.BadRequestError)
+    assert error.is_constant
+    assert not errors.BadRequestError('Dynamic').is_constant
+
+
+def test_dispatch_constant_error_serialized_once():
+    class ConstantErrorResource(Resource):
+        pass
+
+    with patch.dict(resource._constant_error_contents, clear=True), \
+            patch.object(
+                formats.JsonFormat, 'serialize', return_value='serialized'
+            ) as serialize:
+        for _ in range(3):
+            request = create_request_mock(method='CONNECT', headers={})
+            res = ConstantErrorResource(request, formats.JsonFormat).dispatch()
+            assert res[:3] == ('serialized', 405, 'application/json')
+
+    serialize.assert_called_once_with(
+        {'error': 'Method "CONNECT" is not supported'}
+    )
+
+
+def test_dispatch_dynamic_error_serialized_every_time():
+    class DynamicErrorResource(Resource):
+        def list(self):
+            raise errors.NotFoundError('Not found', code=1)
+
+    with patch.object(
+        formats.JsonFormat, 'serialize', return_value='serialized'
+    ) as serialize:
+        for _ in range(2):
+            request = create_request_mock(method='GET', headers={})
+            DynamicErrorResource(request, formats.JsonFormat).dispatch()
+
+    assert serialize.call_count == 2
+
+
+class CompressedResource(Resource):
+    compression = compression.Compression(threshold=100)
+
+    def list(self):
+        return [{'id': i} for i in range(50)]
+
+    def show(self, iden):
+        self.set_header('Vary', 'Origin')
+        return {'id': iden}
+
+
+class StreamedCompressedResource(CompressedResource):
+    stream = True
+
+
+class ConditionalCompressedResource(Resource):
+    compression = compression.Compression(threshold=0)
+    conditional = True
+
+    def list(self):
+        return [{'id': i} for i in range(50)]
+
+
+def test_dispatch_compressed_response():
+    content, status, _, headers = create_json_resource_helper(
+        CompressedResource, headers={'HTTP_ACCEPT_ENCODING': 'gzip, deflate'}
+    ).dispatch()
+
+    assert status == 200
+    assert headers == {'Vary': 'Accept-Encoding', 'Content-Encoding': 'gzip'}
+    data = gzip.GzipFile(fileobj=io.BytesIO(content)).read()
+    assert json.loads(data.decode('utf-8'))[49] == {'id': 49}
+
+
+def test_dispatch_compressed_response_not_accepted():
+    content, _, _, headers = create_json_resource_helper(
+        CompressedResource
+    ).dispatch()
+    assert headers == {'Vary': 'Accept-Encoding'}
+    assert json.loads(content)[0] == {'id': 0}
+
+
+def test_dispatch_compressed_response_below_threshold():
+    content, _, _, headers = create_json_resource_helper(
+        CompressedResource, headers={'HTTP_ACCEPT_ENCODING': 'gzip, deflate'}
+    ).dispatch(iden='1')
+    assert headers == {'Vary': 'Origin'}
+    assert json.loads(content) == {'id': '1'}
+
+
+def test_dispatch_compressed_response_streamed():
+    content, _, _, headers = create_json_resource_helper(
+        StreamedCompressedResource,
+        headers={'HTTP_ACCEPT_ENCODING': 'deflate'}
+    ).dispatch()
+
+    assert headers['Content-Encoding'] == 'deflate'
+    data = zlib.decompress(b''.join(content))
+    assert len(json.loads(data.decode('utf-8'))) == 50
+
+
+def test_dispatch_compressed_response_etag():
+    _, _, _, headers = create_json_resource_helper(
+        ConditionalCompressedResource
+    ).dispatch()
+    etag = headers['ETag']
+
+    content, _, _, headers = create_json_resource_helper(
+        ConditionalCompressedResource,
+        headers={'HTTP_ACCEPT_ENCODING': 'gzip'}
+    ).dispatch()
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['ETag'] == etag[:-1] + '-gzip"'
+    data = gzip.GzipFile(fileobj=io.BytesIO(content)).read()
+    assert len(json.loads(data.decode('utf-8'))) == 50
+
+
+def test_dispatch_compressed_response_not_modified():
+    _, _, _, headers = create_json_resource_helper(
+        ConditionalCompressedResource,
+        headers={'HTTP_ACCEPT_ENCODING': 'gzip'}
+    ).dispatch()
+    etag = headers['ETag']
+
+    content, status, _, headers = create_json_resource_helper(
+        ConditionalCompressedResource,
+        headers={'HTTP_ACCEPT_ENCODING': 'gzip', 'HTTP_IF_NONE_MATCH': etag}
+    ).dispatch()
+    assert status == 304
+    assert content == ''
+    assert 'Content-Encoding' not in headers
+    assert headers['ETag'] == etag
+
+    # client has uncompressed content, it's still not modified
+    uncompressed_etag = etag.replace('-gzip', '')
+    content, status, _, headers = create_json_resource_helper(
+        ConditionalCompressedResource,
+        headers={
+            'HTTP_ACCEPT_ENCODING': 'gzip',
+            'HTTP_IF_NONE_MATCH': uncompressed_etag,
+        }
+    ).dispatch()
+    assert status == 304
+    assert content == ''
+    assert headers['ETag'] == uncompressed_etag
+
+
+class ColumnarResource(Resource):
+    projection_param = 'fields'
+
+    def list(self):
+        return columnar.Columns({
+            'id': list(range(5)),
+            'name': ['name {}'.format(i) for i in range(5)],
+        }, ['id', 'name'])
+
+
+class StreamedColumnarResource(ColumnarResource):
+    stream = True
+
+
+class PaginatedColumnarResource(ColumnarResource):
+    paginator = pagination.KeysetPaginator(default_limit=2)
+
+
+def test_process_columnar_list():
+    resource = create_json_resource_helper(
+        StreamedColumnarResource, params={'fields': 'id'}
+    )
+    assert json.loads(resource.process()) == {
+        'columns': ['id'], 'data': {'id': [0, 1, 2, 3, 4]}
+    }
+
+
+def test_process_columnar_list_paginated():
+    resource = create_json_resource_helper(PaginatedColumnarResource)
+    response = json.loads(resource.process())
+    assert response['data'] == {'id': [0, 1], 'name': ['name 0', 'name 1']}
+    cursor = resource._response_headers['X-Next-Cursor']
+    assert pagination.decode_cursor(cursor) == (1,)
+
+
+@pytest.mark.skipif(
+    not formats.ArrowFormat.available, reason='pyarrow is not installed'
+)
+def test_process_list_arrow_format():
+    class ArrowResource(Resource):
+        fields = fields.FieldSet(id=fields.Integer(), name=fields.String())
+        stream = True
+
+        def list(self):
+            return [{'id': i, 'name': 'name {}'.format(i)} for i in range(3)]
+
+    request = create_request_mock(
+        method='GET', headers={}, data=None, raw_data=None
+    )
+    request.get.return_value = None
+    content = ArrowResource(request, formats.ArrowFormat).process()
+
+    assert isinstance(content, bytes)
+    assert formats.ArrowFormat.unserialize(content) == [
+        {'id': i, 'name': 'name {}'.format(i)} for i in range(3)
+    ]
+
+
+def test_max_body_size_is_set_to_request():
+    class LimitedResource(Resource):
+        max_body_size = 1024
+
+    request = mock.Mock(max_body_size=None)
+    LimitedResource(request, formats.JsonFormat)
+    assert request.max_body_size == 1024
+
+    request = mock.Mock(max_body_size=None)
+    Resource(request, formats.JsonFormat)
+    assert request.max_body_size is None
+
+
+def test_dispatch_payload_too_large():
+    class LimitedResource(Resource):
+        max_body_size = 10
+
+        def create(self):
+            return self.payload
+
+    request = create_request_mock(method='POST', headers={})
+    type(request).raw_data = mock.PropertyMock(
+        side_effect=errors.PayloadTooLargeError.constant(
+            'Request body is larger than 10 bytes'
+        )
+    )
+    resource = LimitedResource(request, formats.JsonFormat)
+
+    content, status, _, _ = resource.dispatch()
+    assert status == 413
+    assert json.loads(content) == {
+        'error': 'Request body is larger than 10 bytes'
+    }
@@ -0,0 +1,47 @@
+import io
+
+import mock
+import pytest
+
+from restea import errors
+
+try:
+    from restea.adapters import wheezywebwrap
+except ImportError:
+    wheezywebwrap = None
+
+pytestmark = pytest.mark.skipif(
+    wheezywebwrap is None, reason='Wheezy web adapter is not available'
+)
+
+
+def create_request(body, max_content_length=1024):
+    return mock.Mock(
+        method='POST',
+        encoding='utf-8',
+        options={'MAX_CONTENT_LENGTH': max_content_length},
+        environ={
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+        }
+    )
+
+
+def test_read_body_rewinds_input():
+    original_request = create_request(b'{"a": 1}')
+    request = wheezywebwrap.WheezyRequestWrapper(original_request)
+
+    assert request.raw_data == b'{"a": 1}'
+    assert request.data == '{"a": 1}'
+    assert original_request.environ['wsgi.input'].tell() == 0
+
+
+def test_read_body_too_large():
+    request = wheezywebwrap.WheezyRequestWrapper(create_request(b'{}', 1))
+    with pytest.raises(errors.PayloadTooLargeError):
+        request.raw_data
+
+    request = wheezywebwrap.WheezyRequestWrapper(create_request(b'{"a": 1}'))
+    request.max_body_size = 4
+    with pytest.raises(errors.PayloadTooLargeError):
+        request.raw_data
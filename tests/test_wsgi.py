@@ -0,0 +1,247 @@
+import io
+import json
+from wsgiref.util import setup_testing_defaults
+
+import mock
+
+from restea import fields
+from restea import ratelimit
+from restea.adapters.wsgi import (
+    Router,
+    WSGIApplication,
+    WSGIRequestWrapper,
+    WSGIResourceWrapper,
+)
+from restea.resource import Resource
+
+
+def make_environ(method='GET', path='/', body=None, query='', **extra):
+    environ = {
+        'REQUEST_METHOD': method,
+        'PATH_INFO': path,
+        'QUERY_STRING': query,
+    }
+    if body is not None:
+        environ['CONTENT_LENGTH'] = str(len(body))
+        environ['wsgi.input'] = io.BytesIO(body)
+    environ.update(extra)
+    setup_testing_defaults(environ)
+    return environ
+
+
+class ItemResource(Resource):
+    fields = fields.FieldSet(name=fields.String())
+
+    def list(self):
+        return [{'name': 'a'}, {'name': 'b'}]
+
+    def show(self, iden):
+        return {'iden': iden}
+
+    def create(self):
+        return self.payload
+
+
+class StreamedItemResource(ItemResource):
+    stream = True
+
+
+class LimitedItemResource(ItemResource):
+    decorators = [
+        ratelimit.RateLimit(ratelimit.TokenBucketLimiter(rate=0.001, burst=1))
+    ]
+
+
+def call(app, environ):
+    start_response = mock.Mock()
+    body = b''.join(app(environ, start_response))
+    status, headers = start_response.call_args[0]
+    return status, dict(headers), body
+
+
+def create_app():
+    app = WSGIApplication(
+        WSGIResourceWrapper(ItemResource).get_routes('/items')
+    )
+    app.add_routes(
+        WSGIResourceWrapper(StreamedItemResource).get_routes('/streamed')
+    )
+    return app
+
+
+def test_router_routes():
+    router = Router([
+        (r'^/items(?:\.(?P<data_format>\w+))?$', 'collection'),
+        (r'^/items/(?P<iden>\w+)(?:\.(?P<data_format>\w+))?$', 'item'),
+    ])
+
+    assert router.match('/items') == ('collection', {})
+    assert router.match('/items.json') == (
+        'collection', {'data_format': 'json'}
+    )
+    assert router.match('/items/10') == ('item', {'iden': '10'})
+    assert router.match('/items/10.json') == (
+        'item', {'iden': '10', 'data_format': 'json'}
+    )
+
+
+def test_router_unmatched():
+    router = Router([(r'^/items$', 'collection')])
+
+    assert router.match('/items/') is None
+    assert router.match('/other') is None
+    assert router.match('/items/10') is None
+    assert Router().match('/items') is None
+
+
+def test_router_add_routes_recompiles():
+    router = Router([(r'^/items$', 'items')])
+    assert router.match('/users') is None
+
+    router.add_routes([(r'^/users$', 'users')])
+    assert router.match('/users') == ('users', {})
+    assert router.match('/items') == ('items', {})
+
+
+def create_many_routes():
+    routes = []
+    for index in range(30):
+        routes.extend(
+            WSGIResourceWrapper(ItemResource).get_routes(
+                '/items{}'.format(index)
+            )
+        )
+    return routes
+
+
+def test_router_compiles_many_routes():
+    # more groups than `re` of Python 2 supports in one expression
+    router = Router(create_many_routes())
+    handler, kwargs = router.match('/items29/1.json')
+    assert kwargs == {'iden': '1', 'data_format': 'json'}
+
+
+def test_router_splits_routes_by_max_groups():
+    routes = create_many_routes()
+    router = Router(routes)
+    router.max_groups = 10
+    router.compile()
+
+    assert len(router._regexes) > 1
+    assert all(regex.groups <= 10 for regex in router._regexes)
+    handler, kwargs = router.match('/items29/1.json')
+    assert kwargs == {'iden': '1', 'data_format': 'json'}
+    assert router.match('/items0') == (routes[0][1], {})
+
+
+def test_request_wrapper_query():
+    request = WSGIRequestWrapper(make_environ(query='a=1&b=2&b=3&c='))
+
+    assert request.get('a') == '1'
+    assert request.get('b') == '2'
+    assert request.get('c') is None
+    assert request.get('d') is None
+
+
+def test_request_wrapper_reads_content_length():
+    environ = make_environ(method='POST', body=b'{"a": 1}')
+    environ['wsgi.input'] = io.BytesIO(b'{"a": 1}trailing')
+    request = WSGIRequestWrapper(environ)
+
+    assert request.raw_data == b'{"a": 1}'
+    assert request.data == '{"a": 1}'
+    assert request.method == 'POST'
+    assert request.headers is environ
+    assert request.get_header('Content-Length') == '8'
+    assert request.get_header('Host') == environ['HTTP_HOST']
+    assert request.get_header('X-Missing') is None
+
+
+def test_request_wrapper_remote_addr():
+    request = WSGIRequestWrapper(make_environ(REMOTE_ADDR='10.0.0.1'))
+    assert request.remote_addr == '10.0.0.1'
+    assert WSGIRequestWrapper(make_environ()).remote_addr is None
+
+
+def test_request_wrapper_without_content_length():
+    environ = make_environ(method='POST')
+    environ['wsgi.input'] = io.BytesIO(b'body')
+    assert WSGIRequestWrapper(environ).raw_data == b''
+
+    environ['CONTENT_LENGTH'] = ''
+    assert WSGIRequestWrapper(environ).raw_data == b''
+
+
+def test_application_routes():
+    app = create_app()
+
+    status, headers, body = call(app, make_environ(path='/items'))
+    assert status == '200 OK'
+    assert json.loads(body.decode('utf-8')) == [{'name': 'a'}, {'name': 'b'}]
+
+    status, headers, body = call(app, make_environ(path='/items/10.json'))
+    assert status == '200 OK'
+    assert headers['Content-Type'] == 'application/json'
+    assert json.loads(body.decode('utf-8')) == {'iden': '10'}
+
+
+def test_application_not_found():
+    status, headers, body = call(create_app(), make_environ(path='/other'))
+    assert status == '404 Not Found'
+    assert body == b'Not Found'
+
+
+def test_application_create():
+    environ = make_environ(
+        method='POST', path='/items', body=b'{"name": "c", "other": 1}'
+    )
+    status, headers, body = call(create_app(), environ)
+
+    assert status == '200 OK'
+    assert json.loads(body.decode('utf-8')) == {'name': 'c'}
+
+
+def test_application_error():
+    environ = make_environ(method='POST', path='/items', body=b'{')
+    status, headers, body = call(create_app(), environ)
+
+    assert status == '400 Bad Request'
+    assert json.loads(body.decode('utf-8')) == {
+        'error': 'Fail to load the data'
+    }
+
+
+def test_application_fixed_content_length():
+    status, headers, body = call(create_app(), make_environ(path='/items/1'))
+    assert headers['Content-Length'] == str(len(body))
+
+
+def test_application_streamed_response():
+    start_response = mock.Mock()
+    chunks = create_app()(make_environ(path='/streamed'), start_response)
+    status, headers = start_response.call_args[0]
+
+    assert 'Content-Length' not in dict(headers)
+    assert not isinstance(chunks, list)
+    chunks = list(chunks)
+    assert len(chunks) > 1
+    assert all(isinstance(chunk, bytes) for chunk in chunks)
+    assert json.loads(b''.join(chunks).decode('utf-8')) == [
+        {'name': 'a'}, {'name': 'b'}
+    ]
+
+
+def test_application_rate_limit_by_remote_addr():
+    app = WSGIApplication(
+        WSGIResourceWrapper(LimitedItemResource).get_routes('/items')
+    )
+
+    def get(**extra):
+        status = call(app, make_environ(path='/items/1', **extra))[0]
+        return int(status.split()[0])
+
+    assert get(REMOTE_ADDR='10.0.0.1') == 200
+    assert get(REMOTE_ADDR='10.0.0.1') == 429
+    assert get(REMOTE_ADDR='10.0.0.2') == 200
+    assert get() == 200
+    assert get() == 429